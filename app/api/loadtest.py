@@ -0,0 +1,220 @@
+# app/api/loadtest.py
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from app.config import VALID_STATUSES
+from app.benchmarks.repositoryBenchmark import percentile
+from app.benchmarks.syntheticData import LAST_NAMES
+
+Request = Tuple[str, str, Optional[dict]]  # (method, path, JSON body)
+
+
+@dataclass
+class Stats:
+    latencies: List[float] = field(default_factory=list)  # ms, every completed request
+    by_route: Dict[str, List[float]] = field(default_factory=dict)
+    statuses: Dict[int, int] = field(default_factory=dict)
+    errors: int = 0  # connection failures, not HTTP error statuses
+
+    def merge(self, other: "Stats") -> None:
+        self.latencies += other.latencies
+        for route, samples in other.by_route.items():
+            self.by_route.setdefault(route, []).extend(samples)
+        for status, n in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + n
+        self.errors += other.errors
+
+
+class Workload:
+    """
+    The request mix: mostly the reads a desk or a technician's phone makes
+    (order pages, customer search, counts, next free slot), plus status
+    changes when `write_ratio` > 0. Ids are drawn from what the server
+    reported at start-up so requests hit real rows.
+    """
+
+    def __init__(self, max_order_id: int, technician_ids: List[int], write_ratio: float = 0.0):
+        self.max_order_id = max(max_order_id, 1)
+        self.technician_ids = technician_ids or [1]
+        self.write_ratio = write_ratio
+        self.reads: List[Tuple[int, str, Callable[[random.Random], Request]]] = [
+            (30, "GET /orders", lambda rng: ("GET", f"/orders?limit=50&description=0&after_id={self._order_id(rng)}", None)),
+            (15, "GET /orders?status", lambda rng: ("GET", f"/orders?limit=50&status={quote(rng.choice(VALID_STATUSES))}", None)),
+            (20, "GET /customers/search", lambda rng: ("GET", f"/customers/search?q={rng.choice(LAST_NAMES)[:4]}", None)),
+            (10, "GET /customers", lambda rng: ("GET", "/customers?limit=50", None)),
+            (10, "GET /orders/counts", lambda rng: ("GET", "/orders/counts", None)),
+            (10, "GET /technicians/{id}/next-free",
+             lambda rng: ("GET", f"/technicians/{rng.choice(self.technician_ids)}/next-free", None)),
+            (5, "GET /health", lambda rng: ("GET", "/health", None)),
+        ]
+        self._weights = [w for w, _, _ in self.reads]
+
+    def _order_id(self, rng: random.Random) -> int:
+        return rng.randint(1, self.max_order_id)
+
+    def next(self, rng: random.Random) -> Tuple[str, Request]:
+        if self.write_ratio and rng.random() < self.write_ratio:
+            return "PUT /orders/{id}/status", ("PUT", f"/orders/{self._order_id(rng)}/status",
+                                              {"status": rng.choice(VALID_STATUSES)})
+        _, route, make = rng.choices(self.reads, self._weights)[0]
+        return route, make(rng)
+
+
+def _call(conn: http.client.HTTPConnection, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, bytes]:
+    data = json.dumps(body).encode() if body is not None else None
+    headers = {"Content-Type": "application/json"} if data else {}
+    conn.request(method, path, body=data, headers=headers)
+    response = conn.getresponse()
+    return response.status, response.read()
+
+
+def _client(host: str, port: int, workload: Workload, deadline: float, seed: int, stats: Stats) -> None:
+    """One simulated client: a single keep-alive connection, requests back to back until the deadline."""
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        while time.perf_counter() < deadline:
+            route, (method, path, body) = workload.next(rng)
+            started = time.perf_counter()
+            try:
+                status, _ = _call(conn, method, path, body)
+            except (OSError, http.client.HTTPException):
+                stats.errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=30)
+                continue
+            ms = (time.perf_counter() - started) * 1000
+            stats.latencies.append(ms)
+            stats.by_route.setdefault(route, []).append(ms)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+    finally:
+        conn.close()
+
+
+def discover(host: str, port: int) -> Tuple[int, List[int]]:
+    """Newest OrderID and the active technician ids, to aim the workload at existing rows."""
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        status, body = _call(conn, "GET", "/orders?limit=1&description=0")
+        orders = json.loads(body)["items"] if status == 200 else []
+        status, body = _call(conn, "GET", "/technicians?limit=1000")
+        technicians = json.loads(body)["items"] if status == 200 else []
+    finally:
+        conn.close()
+    return (orders[0]["OrderID"] if orders else 1), [t["TechnicianID"] for t in technicians]
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "requests": len(samples),
+        "mean_ms": round(sum(samples) / len(samples), 3) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "max_ms": round(samples[-1], 3) if samples else 0.0,
+    }
+
+
+def run(host: str, port: int, clients: int, seconds: float, write_ratio: float = 0.0,
+        warmup: float = 1.0, seed: int = 42) -> Dict:
+    max_order_id, technician_ids = discover(host, port)
+    workload = Workload(max_order_id, technician_ids, write_ratio)
+    if warmup:
+        _client(host, port, workload, time.perf_counter() + warmup, seed - 1, Stats())
+
+    per_client = [Stats() for _ in range(clients)]
+    deadline = time.perf_counter() + seconds
+    threads = [threading.Thread(target=_client, args=(host, port, workload, deadline, seed + i, per_client[i]),
+                                daemon=True) for i in range(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    stats = Stats()
+    for s in per_client:
+        stats.merge(s)
+    return {
+        "clients": clients,
+        "seconds": round(elapsed, 3),
+        "write_ratio": write_ratio,
+        "requests_per_sec": round(len(stats.latencies) / elapsed, 1) if elapsed else 0.0,
+        "overall": _summary(stats.latencies),
+        "routes": {route: _summary(samples) for route, samples in sorted(stats.by_route.items())},
+        "statuses": {str(k): v for k, v in sorted(stats.statuses.items())},
+        "connection_errors": stats.errors,
+    }
+
+
+def _serve(db: str, engine: str, scale: str, workers: Optional[int]):
+    """Start an in-process server on a free port (generating `db` at `scale` when it is empty)."""
+    from app.api.server import ApiServer
+    from app.benchmarks.syntheticData import generate, parse_scale, table_counts
+    from app.model.dbconnection import set_engine
+    from app.model.engine import create_engine
+
+    set_engine(create_engine(engine, db))
+    if not table_counts()["orders"]:
+        print(f"Generating {scale} orders into {db} ...")
+        generate(parse_scale(scale))
+    server = ApiServer(("127.0.0.1", 0), **({"workers": workers} if workers else {}))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure sustained requests/sec of the HTTP/JSON API.")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="server to load (ignored with --serve)")
+    parser.add_argument("--serve", metavar="DB", help="start a server in this process on this SQLite file instead")
+    parser.add_argument("--engine", choices=["sqlite", "sqlserver"], default="sqlite")
+    parser.add_argument("--scale", default="100k", help="orders to generate for --serve when the file is empty")
+    parser.add_argument("--workers", type=int, help="server workers for --serve (default API_WORKERS)")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent keep-alive connections")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.0, help="share of requests that change a status")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.serve:
+        server = _serve(args.serve, args.engine, args.scale, args.workers)
+        host, port = server.server_address[:2]
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+
+    try:
+        result = run(host, port, args.clients, args.seconds, args.write_ratio, seed=args.seed)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    overall = result["overall"]
+    print(f"{result['clients']} clients, {result['seconds']:.1f}s: {result['requests_per_sec']:.1f} req/s "
+          f"(p50 {overall['p50_ms']:.2f} ms, p95 {overall['p95_ms']:.2f} ms, p99 {overall['p99_ms']:.2f} ms)")
+    print(f"{'route':34} {'requests':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for route, s in result["routes"].items():
+        print(f"{route:34} {s['requests']:9d} {s['p50_ms']:8.2f} {s['p95_ms']:8.2f} {s['p99_ms']:8.2f}")
+    print(f"statuses: {result['statuses']}, connection errors: {result['connection_errors']}")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"created_at": datetime.now().isoformat(timespec="seconds"),
+                       "python": sys.version.split()[0], **result}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+# app/api/server.py
+import argparse
+import dataclasses
+import json
+import re
+import threading
+import time
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from app.config import (API_HOST, API_PORT, API_WORKERS, API_KEEPALIVE_SECONDS, API_MAX_BODY, CHANGES_BATCH_SIZE,
+                        DEFAULT_PAGE_SIZE)
+from app.model.changes import ChangeWatermark
+from app.model.dbconnection import PoolTimeout, get_engine, query_metrics, set_engine
+from app.model.engine import create_engine
+from app.model.instrumentation import Histogram
+from app.model.page import Page
+from app.services.customerServiceManager import CustomerServiceManager
+from app.services.technicianServiceManager import TechnicianServiceManager
+from app.services.serviceorderServiceManager import ServiceorderServiceManager
+from app.services.queryCache import cache_stats
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def to_json(value: Any) -> Any:
+    """JSON-ready form of what the managers return (entities, pages, watermarks, datetimes)."""
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, Page):
+        return {"items": [to_json(i) for i in value.items],
+                "next_cursor": value.next_cursor, "prev_cursor": value.prev_cursor}
+    if dataclasses.is_dataclass(value):
+        return {f.name: to_json(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return {str(k): to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(v) for v in value]
+    return value
+
+
+class RequestMetrics:
+    """Latency histogram and status counts per route (the route pattern, not the raw path)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._since = datetime.now()
+            self._routes: Dict[str, Histogram] = {}
+            self._statuses: Dict[str, Dict[int, int]] = {}
+            self._in_flight = 0
+
+    def enter(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def leave(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def record(self, route: str, status: int, ms: float) -> None:
+        with self._lock:
+            histogram = self._routes.get(route)
+            if histogram is None:
+                histogram = self._routes[route] = Histogram()
+                self._statuses[route] = {}
+            histogram.add(ms)
+            self._statuses[route][status] = self._statuses[route].get(status, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = {route: {**h.snapshot(), "statuses": dict(self._statuses[route])}
+                      for route, h in self._routes.items()}
+            return {"since": self._since.isoformat(timespec="seconds"), "in_flight": self._in_flight,
+                    "requests": sum(r["count"] for r in routes.values()), "routes": routes}
+
+
+# Query-string/body helpers
+def _int(value: Optional[str], name: str, default: Optional[int] = None) -> Optional[int]:
+    if value in (None, ""):
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer") from None
+
+
+def _bool(value: Any, default: bool) -> bool:
+    if value in (None, ""):
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("1", "true", "yes")
+
+
+def _datetime(value: Optional[str], name: str) -> Optional[datetime]:
+    if value in (None, ""):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an ISO date/time") from None
+
+
+def _require(body: Dict, *names: str, kind: Optional[type] = None) -> List[Any]:
+    """Values of required fields; with `kind`, each must be an instance of it (e.g. str for text)."""
+    missing = [n for n in names if n not in body]
+    if missing:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"Missing field(s): {', '.join(missing)}")
+    if kind is not None:
+        for n in names:
+            _check_kind(n, body[n], kind)
+    return [body[n] for n in names]
+
+
+def _optional(body: Dict, name: str, kind: type = str) -> Any:
+    value = body.get(name)
+    if value is not None:
+        _check_kind(name, value, kind)
+    return value
+
+
+def _check_kind(name: str, value: Any, kind: type) -> None:
+    if not isinstance(value, kind):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be {'a string' if kind is str else kind.__name__}")
+
+
+def _page_args(q: Dict[str, str]) -> Dict[str, Any]:
+    limit = _int(q.get("limit"), "limit", DEFAULT_PAGE_SIZE)
+    if not 1 <= limit <= 1000:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "limit must be between 1 and 1000")
+    return {"limit": limit, "after_id": _int(q.get("after_id"), "after_id"),
+            "before_id": _int(q.get("before_id"), "before_id")}
+
+
+class ServiceDeskApi:
+    """
+    Maps HTTP routes onto the three service managers. Handlers take
+    (path params, query params, JSON body) and return something to_json()
+    can render; manager ValueErrors become 400s.
+    """
+
+    def __init__(self):
+        self.customers = CustomerServiceManager()
+        self.technicians = TechnicianServiceManager()
+        self.orders = ServiceorderServiceManager()
+        self.metrics = RequestMetrics()
+        r = r"(\d+)"
+        self.routes: List[Tuple[str, "re.Pattern", str, Callable]] = [
+            (method, re.compile(f"^{pattern}$"), f"{method} {label}", handler)
+            for method, pattern, label, handler in [
+                ("GET", "/health", "/health", self.health),
+                ("GET", "/metrics", "/metrics", self.get_metrics),
+                ("GET", "/customers", "/customers", self.list_customers),
+                ("GET", "/customers/search", "/customers/search", self.search_customers),
+                ("POST", "/customers", "/customers", self.create_customer),
+                ("PUT", f"/customers/{r}", "/customers/{id}", self.update_customer),
+                ("DELETE", f"/customers/{r}", "/customers/{id}", self.delete_customer),
+                ("GET", "/technicians", "/technicians", self.list_technicians),
+                ("POST", "/technicians", "/technicians", self.create_technician),
+                ("PUT", f"/technicians/{r}/active", "/technicians/{id}/active", self.set_technician_active),
+                ("GET", f"/technicians/{r}/next-free", "/technicians/{id}/next-free", self.next_free_slot),
+                ("GET", "/orders", "/orders", self.list_orders),
+                ("POST", "/orders", "/orders", self.create_order),
+                ("GET", "/orders/changes", "/orders/changes", self.order_changes),
+                ("GET", "/orders/counts", "/orders/counts", self.order_counts),
+                ("GET", "/orders/conflicts", "/orders/conflicts", self.schedule_conflicts),
+                ("PUT", f"/orders/{r}/technician", "/orders/{id}/technician", self.assign_technician),
+                ("PUT", f"/orders/{r}/status", "/orders/{id}/status", self.update_order_status),
+                ("DELETE", f"/orders/{r}", "/orders/{id}", self.delete_order),
+                ("POST", "/orders/status", "/orders/status", self.update_status_many),
+                ("POST", "/orders/technician", "/orders/technician", self.assign_many),
+            ]
+        ]
+
+    def resolve(self, method: str, path: str) -> Tuple[str, Callable, Tuple[str, ...]]:
+        allowed = False
+        for route_method, pattern, label, handler in self.routes:
+            m = pattern.match(path)
+            if m:
+                if route_method == method:
+                    return label, handler, m.groups()
+                allowed = True
+        if allowed:
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {path}")
+        raise ApiError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+
+    # Service endpoints
+    def health(self, params, q, body):
+        return {"status": "ok", "engine": get_engine().name}
+
+    def get_metrics(self, params, q, body):
+        return {"requests": self.metrics.snapshot(), "queries": query_metrics(), "caches": cache_stats()}
+
+    def list_customers(self, params, q, body):
+        return self.customers.list_customers_page(search=q.get("search") or None, **_page_args(q))
+
+    def search_customers(self, params, q, body):
+        return self.customers.search_customers(q.get("q", ""), _int(q.get("limit"), "limit", 20))
+
+    def create_customer(self, params, q, body):
+        name, phone = _require(body, "name", "phone", kind=str)
+        return {"CustomerID": self.customers.create_customer(name, phone, _optional(body, "email"),
+                                                             _optional(body, "address"))}
+
+    def update_customer(self, params, q, body):
+        name, phone = _require(body, "name", "phone", kind=str)
+        self.customers.update_customer(int(params[0]), name, phone, _optional(body, "email"),
+                                       _optional(body, "address"))
+
+    def delete_customer(self, params, q, body):
+        self.customers.delete_customer(int(params[0]))
+
+    def list_technicians(self, params, q, body):
+        return self.technicians.list_technicians_page(_bool(q.get("active_only"), True), **_page_args(q))
+
+    def create_technician(self, params, q, body):
+        name, phone, skill = _require(body, "name", "phone", "skill_level", kind=str)
+        return {"TechnicianID": self.technicians.create_technician(name, phone, skill, _bool(body.get("active"), True))}
+
+    def set_technician_active(self, params, q, body):
+        self.technicians.set_technician_active(int(params[0]), _bool(_require(body, "active")[0], True))
+
+    def next_free_slot(self, params, q, body):
+        after = _datetime(q.get("after"), "after") or datetime.now()
+        return {"start": self.orders.next_free_slot(int(params[0]), after, _int(q.get("minutes"), "minutes"))}
+
+    def list_orders(self, params, q, body):
+        # names=1 adds the customer's and technician's names and contact fields, joined in the same query
+        list_page = self.orders.list_order_details_page if _bool(q.get("names"), False) else self.orders.list_orders_page
+        return list_page(status=q.get("status") or None,
+                         with_description=_bool(q.get("description"), True), **_page_args(q))
+
+    def create_order(self, params, q, body):
+        customer_id, service_type = _require(body, "customer_id", "service_type")
+        _check_kind("service_type", service_type, str)
+        return {"OrderID": self.orders.create_order(_int(str(customer_id), "customer_id"), service_type,
+                                                    _optional(body, "description"),
+                                                    _datetime(body.get("scheduled_at"), "scheduled_at"))}
+
+    def order_changes(self, params, q, body):
+        # The watermark travels as its three fields; none of them means "start from now".
+        updated_at = _datetime(q.get("updated_at"), "updated_at")
+        watermark = None
+        if updated_at is not None:
+            watermark = ChangeWatermark(updated_at, _int(q.get("order_id"), "order_id", 0),
+                                        _datetime(q.get("deleted_at"), "deleted_at"))
+        return self.orders.order_changes(watermark, _int(q.get("limit"), "limit", CHANGES_BATCH_SIZE))
+
+    def order_counts(self, params, q, body):
+        return self.orders.order_counts()
+
+    def schedule_conflicts(self, params, q, body):
+        return self.orders.schedule_conflicts(_int(q.get("technician_id"), "technician_id"))
+
+    def assign_technician(self, params, q, body):
+        technician_id = _int(str(_require(body, "technician_id")[0]), "technician_id")
+        self.orders.assign_technician(int(params[0]), technician_id, _bool(body.get("allow_conflict"), False))
+
+    def update_order_status(self, params, q, body):
+        self.orders.update_order_status(int(params[0]), _require(body, "status", kind=str)[0])
+
+    def delete_order(self, params, q, body):
+        self.orders.delete_order(int(params[0]))
+
+    def update_status_many(self, params, q, body):
+        updates = [(int(u["order_id"]), u["status"]) for u in _require(body, "updates")[0]]
+        return self.orders.update_status_many(updates)
+
+    def assign_many(self, params, q, body):
+        pairs = [(int(a["order_id"]), int(a["technician_id"])) for a in _require(body, "assignments")[0]]
+        return self.orders.assign_many(pairs, _bool(body.get("allow_conflict"), False))
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """One thread per client connection; HTTP/1.1, so connections are kept alive between requests."""
+
+    protocol_version = "HTTP/1.1"
+    timeout = API_KEEPALIVE_SECONDS  # idle keep-alive connections are closed after this
+    disable_nagle_algorithm = True  # headers and body go out in separate writes; don't hold the second for an ACK
+    server: "ApiServer"
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def _handle(self) -> None:
+        started = time.perf_counter()
+        api = self.server.api
+        route = f"{self.command} (unmatched)"
+        status, payload = HTTPStatus.OK, None
+        engine = get_engine()
+        try:
+            raw = self._read_raw_body()  # before anything can fail, so keep-alive stays in step
+            url = urlsplit(self.path)
+            route, handler, params = api.resolve(self.command, url.path.rstrip("/") or "/")
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            body = self._parse_body(raw)
+            with self.server.slots:  # bounds concurrent database work to the pool size
+                api.metrics.enter()
+                try:
+                    payload = handler(params, query, body)
+                finally:
+                    api.metrics.leave()
+            if payload is None:
+                status = HTTPStatus.NO_CONTENT
+        except ApiError as e:
+            status, payload = e.status, {"error": str(e)}
+        except (ValueError, KeyError, TypeError) as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except PoolTimeout as e:
+            status, payload = HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)}
+        except engine.integrity_errors as e:
+            status, payload = HTTPStatus.CONFLICT, {"error": str(e)}
+        except engine.unavailable_errors as e:
+            self.log_error("Database unavailable on %s: %r", self.path, e)
+            status, payload = HTTPStatus.SERVICE_UNAVAILABLE, {"error": "database unavailable"}
+        except Exception as e:  # keep the connection's thread alive for the next request
+            self.log_error("Unhandled error on %s: %r", self.path, e)
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"}
+        self._send(status, payload)
+        api.metrics.record(route, int(status), (time.perf_counter() - started) * 1000)
+
+    def _read_raw_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding"):
+            self.close_connection = True  # chunked bodies aren't read, so the stream can't be reused
+            raise ApiError(HTTPStatus.LENGTH_REQUIRED, "Send the body with a Content-Length")
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self.close_connection = True
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Content-Length must be a non-negative integer") from None
+        if length > API_MAX_BODY:
+            self.close_connection = True
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body over {API_MAX_BODY} bytes")
+        return self.rfile.read(length) if length else b""
+
+    @staticmethod
+    def _parse_body(raw: bytes) -> Dict:
+        if not raw:
+            return {}
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Body must be JSON") from None
+        if not isinstance(body, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return body
+
+    def _send(self, status: int, payload: Any) -> None:
+        data = b"" if status == HTTPStatus.NO_CONTENT else json.dumps(to_json(payload), ensure_ascii=False).encode()
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # per-request numbers go to /metrics; errors still reach log_error
+
+
+class ApiServer(ThreadingHTTPServer):
+    """
+    ThreadingHTTPServer over one ServiceDeskApi. Connection threads are cheap
+    and held by keep-alive clients; at most `workers` requests touch the
+    database at a time, matching the connection pool, so a burst of clients
+    waits here instead of timing out in get_connection().
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], workers: int = API_WORKERS, api: Optional[ServiceDeskApi] = None):
+        super().__init__(address, ApiRequestHandler)
+        self.api = api or ServiceDeskApi()
+        self.slots = threading.BoundedSemaphore(workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the AC service desk managers over HTTP/JSON.")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--workers", type=int, default=API_WORKERS, help="concurrent requests using the database")
+    parser.add_argument("--engine", choices=["sqlite", "sqlserver"], help="override DB_ENGINE")
+    parser.add_argument("--db", help="SQLite database file for --engine sqlite")
+    args = parser.parse_args(argv)
+
+    if args.engine:
+        set_engine(create_engine(args.engine, args.db or ":memory:"))
+    server = ApiServer((args.host, args.port), args.workers)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} ({get_engine().name}, {args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# app/benchmarks/memoryBenchmark.py
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from app.model.CURDoperations import ServiceOrderRepository, ORDER_COLUMNS, _seek, _stream
+from app.model.dbconnection import engine_spec, set_engine
+from app.model.engine import create_engine
+from app.benchmarks.syntheticData import generate, parse_scale, table_counts
+
+
+@dataclass
+class LegacyServiceOrder:
+    """ServiceOrder as it was before slots: a plain dataclass with a per-instance __dict__."""
+    OrderID: Optional[int]
+    CustomerID: int
+    TechnicianID: Optional[int]
+    ServiceType: str
+    Description: Optional[str]
+    Status: str
+    ScheduledAt: Optional[datetime]
+    CreatedAt: Optional[datetime] = None
+    UpdatedAt: Optional[datetime] = None
+
+
+def _legacy_order(r) -> LegacyServiceOrder:
+    # The old field-by-field copy out of the driver row.
+    return LegacyServiceOrder(
+        r.OrderID, r.CustomerID, r.TechnicianID, r.ServiceType, r.Description,
+        r.Status, r.ScheduledAt, r.CreatedAt, r.UpdatedAt
+    )
+
+
+@dataclass
+class Result:
+    name: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    retained_mb: Optional[float]  # memory held by the materialized list
+    peak_mb: Optional[float]  # peak traced allocation while loading
+    bytes_per_row: Optional[float]
+
+
+def _measure(name: str, load: Callable[[], Iterable], retain: bool) -> Result:
+    """Time one load untraced, then repeat it under tracemalloc for the memory figures."""
+    gc.collect()
+    started = time.perf_counter()
+    rows = 0
+    if retain:
+        rows = len(list(load()))
+    else:
+        for _ in load():
+            rows += 1
+    seconds = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        if retain:
+            held = list(load())
+            retained, peak = tracemalloc.get_traced_memory()
+            del held
+        else:
+            for _ in load():
+                pass
+            retained, peak = None, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    mb = 1024 * 1024
+    return Result(
+        name=name,
+        rows=rows,
+        seconds=round(seconds, 3),
+        rows_per_sec=round(rows / seconds) if seconds else 0.0,
+        retained_mb=round(retained / mb, 2) if retained is not None else None,
+        peak_mb=round(peak / mb, 2),
+        bytes_per_row=round(retained / rows, 1) if retained is not None and rows else None,
+    )
+
+
+class MemoryBenchmark:
+    """
+    Loads every service order (as a large report would) in each representation
+    and reports time, memory held and peak allocation. The "before" cases use
+    the pre-slots entity and the per-row dict export, rebuilt here.
+    """
+
+    def __init__(self, batch_size: int = 2000):
+        self.batch_size = batch_size
+        self.orders = ServiceOrderRepository()
+
+    def cases(self) -> List[tuple]:
+        legacy_query = _seek(ORDER_COLUMNS, "ServiceOrders", "OrderID", [], [], None)
+        return [
+            ("orders[before: dataclass]", lambda: _stream(legacy_query, _legacy_order, self.batch_size), True),
+            ("orders[slots]", lambda: self.orders.iter(batch_size=self.batch_size), True),
+            ("orders[slots, no Description]",
+             lambda: self.orders.iter(batch_size=self.batch_size, with_description=False), True),
+            ("orders[driver rows]", lambda: _stream(legacy_query, None, self.batch_size), True),
+            ("export[before: dicts]", lambda: self.orders.iter_export(batch_size=self.batch_size), False),
+            ("export[rows]", lambda: self.orders.iter_export(batch_size=self.batch_size, as_dicts=False), False),
+        ]
+
+    def run(self, progress: Optional[Callable[[Result], None]] = None) -> Dict[str, Result]:
+        results = {}
+        for name, load, retain in self.cases():
+            results[name] = _measure(name, load, retain)
+            if progress:
+                progress(results[name])
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare memory and time of order row representations.")
+    parser.add_argument("db", help="SQLite database file; generated at --scale when missing or empty")
+    parser.add_argument("--engine", choices=["sqlite", "sqlserver"], default="sqlite")
+    parser.add_argument("--scale", default="100k", help="orders to generate: 10k, 100k, 1M, 10M or a number")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--out", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    set_engine(create_engine(args.engine, args.db))
+    if not table_counts()["orders"]:
+        print(f"Generating {args.scale} orders into {args.db} ...")
+        generate(parse_scale(args.scale))
+
+    print(f"{'case':32} {'rows':>9} {'s':>7} {'rows/s':>10} {'held MB':>8} {'peak MB':>8} {'B/row':>7}")
+
+    def show(r: Result):
+        fmt = lambda v, spec: format(v, spec) if v is not None else "-".rjust(int(spec.split(".")[0]))
+        print(f"{r.name:32} {r.rows:9d} {r.seconds:7.3f} {r.rows_per_sec:10.0f} "
+              f"{fmt(r.retained_mb, '8.2f')} {fmt(r.peak_mb, '8.2f')} {fmt(r.bytes_per_row, '7.1f')}")
+
+    results = MemoryBenchmark(args.batch_size).run(progress=show)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({
+                "engine": engine_spec()[0],
+                "python": sys.version.split()[0],
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "results": {name: asdict(r) for name, r in results.items()},
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+# app/benchmarks/repositoryBenchmark.py
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import VALID_STATUSES, SERVICE_TYPES
+from app.model.CURDoperations import CustomerRepository, TechnicianRepository, ServiceOrderRepository
+from app.model.customer import Customer
+from app.model.serviceorder import ServiceOrder
+from app.model.dbconnection import engine_spec, set_engine
+from app.model.engine import create_engine
+from app.benchmarks.syntheticData import generate, parse_scale, table_counts, customer_name, phone, LAST_NAMES
+from app.services.customerServiceManager import CustomerServiceManager
+from app.services.technicianServiceManager import TechnicianServiceManager
+from app.services.serviceorderServiceManager import ServiceorderServiceManager
+from app.services.queryCache import set_cache_enabled
+
+Args = Callable[[random.Random], Tuple[Any, ...]]
+
+
+@dataclass
+class Result:
+    name: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    ops_per_sec: float
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not samples:
+        return 0.0
+    rank = max(1, -(-len(samples) * q // 100))  # ceil
+    return samples[int(rank) - 1]
+
+
+def measure(name: str, fn: Callable, make_args: Args, rng: random.Random, iterations: int,
+            warmup: int = 5, time_budget: float = 10.0) -> Result:
+    """
+    Call fn(*make_args(rng)) `warmup` times untimed, then up to `iterations`
+    times timed, stopping early (after at least 5 calls) once `time_budget`
+    seconds have been spent, so full-scan operations stay bounded at 10M rows.
+    """
+    for _ in range(warmup):
+        fn(*make_args(rng))
+    samples = []
+    started = time.perf_counter()
+    for i in range(iterations):
+        args = make_args(rng)
+        t0 = time.perf_counter_ns()
+        fn(*args)
+        samples.append((time.perf_counter_ns() - t0) / 1e6)
+        if i >= 4 and time.perf_counter() - started > time_budget:
+            break
+    total = sum(samples)
+    samples.sort()
+    return Result(
+        name=name,
+        iterations=len(samples),
+        p50_ms=round(percentile(samples, 50), 4),
+        p95_ms=round(percentile(samples, 95), 4),
+        p99_ms=round(percentile(samples, 99), 4),
+        mean_ms=round(total / len(samples), 4),
+        max_ms=round(samples[-1], 4),
+        ops_per_sec=round(len(samples) / (total / 1000), 1) if total else 0.0,
+    )
+
+
+class RepositoryBenchmark:
+    """
+    Times every repository and manager operation against whatever database the
+    current engine points at (normally one filled by syntheticData.generate()).
+    Managers run with the read cache off so their numbers are database numbers.
+    The one exception is the "[cached]" entry, which measures a cache hit.
+    """
+
+    def __init__(self, iterations: int = 200, warmup: int = 5, time_budget: float = 10.0, seed: int = 7):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.time_budget = time_budget
+        self.rng = random.Random(seed)
+        self.counts = table_counts()
+        if not self.counts["orders"]:
+            raise RuntimeError("Database is empty; generate data first")
+        self.customers = CustomerRepository()
+        self.techs = TechnicianRepository()
+        self.orders = ServiceOrderRepository()
+        self.customer_mgr = CustomerServiceManager()
+        self.technician_mgr = TechnicianServiceManager()
+        self.order_mgr = ServiceorderServiceManager()
+
+    def _order_id(self, rng: random.Random) -> int:
+        return rng.randint(1, self.counts["orders"])
+
+    def _tech_id(self, rng: random.Random) -> int:
+        return rng.randint(1, self.counts["technicians"])
+
+    def _victims(self, n: int) -> Callable[[random.Random], Tuple[int]]:
+        # Orders created (untimed, on first use) for the delete benchmarks, so deletes never hit a missing row.
+        ids: List[int] = []
+
+        def take(rng: random.Random) -> Tuple[int]:
+            if not ids:
+                ids.extend(self.orders.create_many([
+                    ServiceOrder(None, 1, None, SERVICE_TYPES[0], "benchmark victim", "Pending", None) for _ in range(n)
+                ]))
+            return (ids.pop(),)
+        return take
+
+    def operations(self) -> List[Tuple[str, Callable, Args]]:
+        n = self.iterations + self.warmup
+        common = LAST_NAMES[0].lower()
+        new_customer = lambda rng: (Customer(None, customer_name(rng), phone(rng), None, None),)
+        new_order = lambda rng: (ServiceOrder(None, rng.randint(1, self.counts["customers"]), None,
+                                              rng.choice(SERVICE_TYPES), "benchmark", "Pending", None),)
+        selective = lambda rng: (phone(rng)[:7],)
+        return [
+            ("repo.customer.create", self.customers.create, new_customer),
+            ("repo.customer.list", lambda: self.customers.list(limit=100), lambda rng: ()),
+            ("repo.customer.list[search]", lambda q: self.customers.list(search=q, limit=100), lambda rng: (common,)),
+            ("repo.customer.list[search-selective]", lambda q: self.customers.list(search=q, limit=100), selective),
+            ("repo.technician.list[active]", lambda: self.techs.list(active_only=True, limit=100), lambda rng: ()),
+            ("repo.order.create", self.orders.create, new_order),
+            ("repo.order.list", lambda: self.orders.list(limit=100), lambda rng: ()),
+            ("repo.order.list[status]", lambda s: self.orders.list(status=s, limit=100),
+             lambda rng: (rng.choice(VALID_STATUSES),)),
+            ("repo.order.assign_technician", self.orders.assign_technician,
+             lambda rng: (self._order_id(rng), self._tech_id(rng))),
+            ("repo.order.update_status", self.orders.update_status,
+             lambda rng: (self._order_id(rng), rng.choice(VALID_STATUSES))),
+            ("repo.order.delete", self.orders.delete, self._victims(n)),
+            ("manager.create_customer", self.customer_mgr.create_customer,
+             lambda rng: (customer_name(rng), phone(rng), None, None)),
+            ("manager.list_customers", lambda: self.customer_mgr.list_customers(limit=100), lambda rng: ()),
+            ("manager.list_customers[search]", lambda q: self.customer_mgr.list_customers(search=q, limit=100),
+             lambda rng: (common,)),
+            ("manager.search_customers", lambda q: self.customer_mgr.search_customers(q), selective),
+            ("manager.list_technicians", lambda: self.technician_mgr.list_technicians(True, 100), lambda rng: ()),
+            ("manager.list_orders[status]", lambda s: self.order_mgr.list_orders(status=s, limit=100),
+             lambda rng: (rng.choice(VALID_STATUSES),)),
+            # Random pairs clash with existing bookings; the index still records each assignment.
+            ("manager.assign_technician", self.order_mgr.assign_technician,
+             lambda rng: (self._order_id(rng), self._tech_id(rng), True)),
+            ("manager.update_order_status", self.order_mgr.update_order_status,
+             lambda rng: (self._order_id(rng), rng.choice(VALID_STATUSES))),
+            ("manager.delete_order", self.order_mgr.delete_order, self._victims(n)),
+            ("manager.order_changes", self.order_mgr.order_changes,
+             lambda rng: (self.order_mgr.order_changes().watermark,)),
+        ]
+
+    def run(self, only: Optional[List[str]] = None, progress: Optional[Callable[[Result], None]] = None) -> Dict[str, Result]:
+        results = {}
+        set_cache_enabled(False)
+        try:
+            for name, fn, make_args in self.operations():
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+                results[name] = measure(name, fn, make_args, self.rng, self.iterations, self.warmup, self.time_budget)
+                if progress:
+                    progress(results[name])
+            if not only or any("manager.list_technicians".startswith(prefix) for prefix in only):
+                set_cache_enabled(True)
+                name = "manager.list_technicians[cached]"
+                results[name] = measure(name, lambda: self.technician_mgr.list_technicians(True, 100),
+                                        lambda rng: (), self.rng, self.iterations, self.warmup, self.time_budget)
+                if progress:
+                    progress(results[name])
+        finally:
+            set_cache_enabled(True)
+        return results
+
+
+def report(results: Dict[str, Result], counts: Dict[str, int], iterations: int) -> Dict:
+    return {
+        "engine": engine_spec()[0],
+        "counts": counts,
+        "iterations": iterations,
+        "python": sys.version.split()[0],
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "results": {name: asdict(r) for name, r in results.items()},
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = 0.25, min_delta_ms: float = 0.05) -> List[str]:
+    """
+    Regressions of `current` against `baseline`: an operation regresses when
+    its p50 or p95 is more than `tolerance` (a fraction) slower and also more
+    than `min_delta_ms` slower, so sub-0.1 ms jitter does not fail the gate.
+    """
+    # Each run adds a few rows (creates outnumber deletes), so only the order of magnitude has to match.
+    ratio = current["counts"]["orders"] / max(1, baseline["counts"]["orders"])
+    if current["engine"] != baseline["engine"] or not 0.9 <= ratio <= 1.1:
+        raise ValueError(
+            f"Baseline was taken on {baseline['engine']} with {baseline['counts']['orders']} orders; "
+            f"this run is {current['engine']} with {current['counts']['orders']}"
+        )
+    regressions = []
+    for name, base in baseline["results"].items():
+        now = current["results"].get(name)
+        if now is None:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            limit = base[metric] * (1 + tolerance)
+            if now[metric] > limit and now[metric] - base[metric] > min_delta_ms:
+                regressions.append(f"{name}: {metric} {now[metric]:.3f} ms vs baseline {base[metric]:.3f} ms "
+                                   f"(+{(now[metric] / base[metric] - 1) * 100 if base[metric] else 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark repository and manager operations.")
+    parser.add_argument("db", help="SQLite database file; generated at --scale when missing or empty")
+    parser.add_argument("--engine", choices=["sqlite", "sqlserver"], default="sqlite")
+    parser.add_argument("--scale", default="10k", help="orders to generate: 10k, 100k, 1M, 10M or a number")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--time-budget", type=float, default=10.0, help="max timed seconds per operation")
+    parser.add_argument("--only", nargs="*", help="operation name prefixes to run")
+    parser.add_argument("--out", help="write this run's JSON report here")
+    parser.add_argument("--baseline", help="baseline JSON to compare against; exit 1 on regressions")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run to --baseline instead")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    set_engine(create_engine(args.engine, args.db))
+    if not table_counts()["orders"]:
+        print(f"Generating {args.scale} orders into {args.db} ...")
+        generate(parse_scale(args.scale))
+
+    bench = RepositoryBenchmark(args.iterations, args.warmup, args.time_budget)
+    print(f"{'operation':40} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ops/s':>10}")
+
+    def show(r: Result):
+        print(f"{r.name:40} {r.iterations:5d} {r.p50_ms:9.3f} {r.p95_ms:9.3f} {r.p99_ms:9.3f} {r.ops_per_sec:10.1f}")
+
+    current = report(bench.run(args.only, progress=show), bench.counts, args.iterations)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    elif args.baseline:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save-baseline first")
+            sys.exit(2)
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare(current, baseline, args.tolerance, args.min_delta_ms)
+        except ValueError as e:
+            print(e)
+            sys.exit(2)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
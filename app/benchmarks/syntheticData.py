@@ -0,0 +1,165 @@
+# app/benchmarks/syntheticData.py
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, Optional, Sequence
+
+from app.config import SERVICE_TYPES, SKILL_LEVELS
+from app.model.dbconnection import get_connection, get_engine, set_engine
+from app.model.engine import create_engine
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1M": 1_000_000, "10M": 10_000_000}
+
+FIRST_NAMES = [
+    "Ali", "Abid", "Bilal", "Hassan", "Usman", "Ahmed", "Omar", "Zain", "Hamza", "Faisal",
+    "Ayesha", "Fatima", "Sana", "Hina", "Maryam", "Zara", "Nadia", "Amna", "Saad", "Imran",
+    "John", "Sarah", "David", "Maria", "James", "Priya", "Chen", "Elena", "Tariq", "Yusuf",
+]
+LAST_NAMES = [
+    "Khan", "Haider", "Malik", "Qureshi", "Sheikh", "Butt", "Chaudhry", "Raza", "Siddiqui", "Akhtar",
+    "Iqbal", "Hussain", "Javed", "Mirza", "Abbasi", "Smith", "Patel", "Garcia", "Wang", "Ivanova",
+]
+STREETS = ["Main Blvd", "Canal Rd", "Mall Rd", "Ferozepur Rd", "Jail Rd", "University Ave", "Park Ln", "Gulberg III"]
+DESCRIPTIONS = [
+    None, "AC not cooling", "Gas refill", "Noise from outdoor unit", "Water leakage", "Annual service",
+    "Install split unit, 1.5 ton", "Remote not working", "Thermostat fault", "Compressor trips breaker",
+]
+# Rough shape of a live desk: most orders are finished, a minority are open.
+STATUS_WEIGHTS = {"Pending": 8, "Assigned": 7, "In Progress": 5, "Completed": 70, "Canceled": 10}
+
+CUSTOMERS_PER_ORDER = 0.2
+ORDERS_PER_TECHNICIAN = 1000
+DEFAULT_CHUNK = 10_000
+
+
+def sizes(orders: int) -> Dict[str, int]:
+    """Row counts for a scale expressed as a number of service orders."""
+    return {
+        "customers": max(1, int(orders * CUSTOMERS_PER_ORDER)),
+        "technicians": max(20, orders // ORDERS_PER_TECHNICIAN),
+        "orders": orders,
+    }
+
+
+def parse_scale(scale: str) -> int:
+    if scale in SCALES:
+        return SCALES[scale]
+    try:
+        return int(scale)
+    except ValueError:
+        raise ValueError(f"Invalid scale. Allowed: {list(SCALES)} or a row count") from None
+
+
+def customer_name(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def phone(rng: random.Random) -> str:
+    return f"03{rng.randint(0, 49):02d}-{rng.randint(0, 9_999_999):07d}"
+
+
+def customer_rows(n: int, rng: random.Random, start: datetime, span: timedelta) -> Iterator[tuple]:
+    for i in range(n):
+        name = customer_name(rng)
+        email = f"{name.lower().replace(' ', '.')}{i}@example.com" if rng.random() < 0.7 else None
+        address = f"{rng.randint(1, 400)} {rng.choice(STREETS)}, Lahore" if rng.random() < 0.8 else None
+        yield name, phone(rng), email, address, start + span * (i / n)
+
+
+def technician_rows(n: int, rng: random.Random, start: datetime) -> Iterator[tuple]:
+    for _ in range(n):
+        yield customer_name(rng), phone(rng), rng.choice(SKILL_LEVELS), rng.random() < 0.85, start
+
+
+def order_rows(n: int, customers: int, technicians: int, rng: random.Random,
+               start: datetime, span: timedelta) -> Iterator[tuple]:
+    statuses, weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    for i in range(n):
+        created = start + span * (i / n)
+        status = rng.choices(statuses, weights)[0]
+        technician = rng.randint(1, technicians) if status != "Pending" else None
+        scheduled = created + timedelta(hours=rng.randint(2, 96)) if rng.random() < 0.9 else None
+        updated = created + timedelta(minutes=rng.randint(0, 4320)) if status != "Pending" else created
+        yield (rng.randint(1, customers), technician, rng.choice(SERVICE_TYPES), rng.choice(DESCRIPTIONS),
+               status, scheduled, created, updated)
+
+
+CUSTOMER_COLUMNS = ("Name", "Phone", "Email", "Address", "CreatedAt")
+TECHNICIAN_COLUMNS = ("Name", "Phone", "SkillLevel", "Active", "CreatedAt")
+ORDER_COLUMNS = ("CustomerID", "TechnicianID", "ServiceType", "Description", "Status", "ScheduledAt",
+                 "CreatedAt", "UpdatedAt")
+
+
+def _load(table: str, key: str, columns: Sequence[str], rows: Iterator[tuple], total: int,
+          chunk_size: int, progress: Optional[Callable[[str, int, int], None]]) -> None:
+    done = 0
+    while done < total:
+        chunk = [row for _, row in zip(range(chunk_size), rows)]
+        if not chunk:
+            break
+        with get_connection() as cn:
+            get_engine().bulk_insert(cn.cursor(), table, key, columns, chunk)
+            cn.commit()
+        done += len(chunk)
+        if progress:
+            progress(table, done, total)
+
+
+def table_counts() -> Dict[str, int]:
+    with get_connection() as cn:
+        cur = cn.cursor()
+        counts = {}
+        for name, table in (("customers", "Customers"), ("technicians", "Technicians"), ("orders", "ServiceOrders")):
+            cur.execute(f"SELECT COUNT(*) FROM {table};")
+            counts[name] = int(cur.fetchone()[0])
+        return counts
+
+
+def generate(orders: int, seed: int = 42, chunk_size: int = DEFAULT_CHUNK, days: int = 730,
+             progress: Optional[Callable[[str, int, int], None]] = None) -> Dict[str, int]:
+    """
+    Fill the current engine's (empty) database with a deterministic data set
+    for `orders` service orders. CreatedAt is spread over the last `days`
+    days, so the date-range and UpdatedAt indexes see realistic
+    distributions. Returns the row counts written.
+    """
+    existing = table_counts()
+    if any(existing.values()):
+        raise RuntimeError(f"Database is not empty ({existing}); generate into a fresh one")
+    n = sizes(orders)
+    rng = random.Random(seed)
+    end = datetime.utcnow().replace(microsecond=0)
+    start = end - timedelta(days=days)
+    span = end - start
+    _load("Technicians", "TechnicianID", TECHNICIAN_COLUMNS, technician_rows(n["technicians"], rng, start),
+          n["technicians"], chunk_size, progress)
+    _load("Customers", "CustomerID", CUSTOMER_COLUMNS, customer_rows(n["customers"], rng, start, span),
+          n["customers"], chunk_size, progress)
+    _load("ServiceOrders", "OrderID", ORDER_COLUMNS,
+          order_rows(n["orders"], n["customers"], n["technicians"], rng, start, span),
+          n["orders"], chunk_size, progress)
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic AC service desk database.")
+    parser.add_argument("db", help="SQLite database file to create (ignored with --engine sqlserver)")
+    parser.add_argument("--scale", default="10k", help=f"orders: {', '.join(SCALES)} or a number")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--engine", choices=["sqlite", "sqlserver"], default="sqlite")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    args = parser.parse_args(argv)
+
+    set_engine(create_engine(args.engine, args.db))
+    started = time.perf_counter()
+
+    def show(table, done, total):
+        print(f"\r  {table}: {done}/{total}", end="\n" if done >= total else "", flush=True)
+
+    counts = generate(parse_scale(args.scale), seed=args.seed, chunk_size=args.chunk_size, progress=show)
+    print(f"Generated {counts} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,65 @@ SQL_USERNAME = os.getenv("SQL_USERNAME", r"DESKTOP-SNKKUPV\Ali Haider")
 SQL_PASSWORD = os.getenv("SQL_PASSWORD", "pkk096006")
 SQL_DRIVER = os.getenv("SQL_DRIVER", "ODBC Driver 18 for SQL Server")  # or "ODBC Driver 18 for SQL Server"
 
+# Storage engine: "sqlserver" (default) or "sqlite" (embedded; SQLITE_PATH may be ":memory:")
+DB_ENGINE = os.getenv("DB_ENGINE", "sqlserver")
+SQLITE_PATH = os.getenv("SQLITE_PATH", "acservicedesk.db")
+
+# Connection pool
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds to wait for a free connection
+DB_POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "300"))  # idle seconds before a connection is closed
+DB_POOL_VALIDATE_AFTER = float(os.getenv("DB_POOL_VALIDATE_AFTER", "5"))  # idle seconds before a liveness check
+
+# Query instrumentation
+QUERY_METRICS = os.getenv("QUERY_METRICS", "1") == "1"  # per-statement latency/row/error metrics
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "250"))  # statements at least this slow are logged
+SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "")  # file for the slow-query log; empty = logging config only
+QUERY_METRICS_DUMP = os.getenv("QUERY_METRICS_DUMP", "")  # write a metrics JSON here at exit
+
+# Async service layer (app/services/asyncServiceManagers.py)
+ASYNC_WORKERS = int(os.getenv("ASYNC_WORKERS", str(DB_POOL_MAX_SIZE)))  # concurrent database calls
+ASYNC_MAX_WAITING = int(os.getenv("ASYNC_MAX_WAITING", "200"))  # queued calls before ServiceBusy
+ASYNC_WAIT_TIMEOUT = float(os.getenv("ASYNC_WAIT_TIMEOUT", "30"))  # seconds a call may wait for a worker
+
+# HTTP/JSON API server (app/api/server.py)
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", "8080"))
+API_WORKERS = int(os.getenv("API_WORKERS", str(DB_POOL_MAX_SIZE)))  # requests using the database at once
+API_KEEPALIVE_SECONDS = float(os.getenv("API_KEEPALIVE_SECONDS", "15"))  # idle seconds before a connection is closed
+API_MAX_BODY = int(os.getenv("API_MAX_BODY", str(1024 * 1024)))  # largest accepted request body, in bytes
+
 # UI constants
 APP_TITLE = "AbidBilal Technical Services - AC Service Desk"
 DEFAULT_PAGE_SIZE = 100
+UI_WORKERS = int(os.getenv("UI_WORKERS", "4"))  # threads running database calls for the window
+UI_POLL_MS = int(os.getenv("UI_POLL_MS", "30"))  # how often the window picks up finished calls
+STARTUP_PREFETCH = os.getenv("STARTUP_PREFETCH", "1") == "1"  # fetch every tab's first page once the window is up
+STARTUP_TIMING_LOG = os.getenv("STARTUP_TIMING_LOG", "")  # append one JSON line of startup timings per run here
+STARTUP_WARN_MS = float(os.getenv("STARTUP_WARN_MS", "2000"))  # log startup as a warning when first data is slower
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))  # rows per fetchmany() when streaming
+CUSTOMER_SEARCH_INDEX = os.getenv("CUSTOMER_SEARCH_INDEX", "1") == "1"  # in-memory trigram index for customer search
+CUSTOMER_SEARCH_INDEX_MAX_AGE = float(os.getenv("CUSTOMER_SEARCH_INDEX_MAX_AGE", "300"))  # seconds before the index reloads
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))  # rows per bulk-import transaction
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") == "1"  # read-through cache for the managers' list/search calls
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))  # per entity
+CACHE_TTL = float(os.getenv("CACHE_TTL", "30"))  # seconds; bounds staleness from other desks' writes
+DIMENSION_CACHE_MAX_ENTRIES = int(os.getenv("DIMENSION_CACHE_MAX_ENTRIES", "20000"))  # customers/technicians by ID, each
+DIMENSION_CACHE_TTL = float(os.getenv("DIMENSION_CACHE_TTL", "300"))  # seconds before a cached name is re-read
+ORDERS_POLL_SECONDS = float(os.getenv("ORDERS_POLL_SECONDS", "5"))  # orders tab auto-refresh interval
+CHANGES_BATCH_SIZE = int(os.getenv("CHANGES_BATCH_SIZE", "500"))  # changed orders per changes_since() call
+CHANGES_OVERLAP_SECONDS = float(os.getenv("CHANGES_OVERLAP_SECONDS", "2"))  # re-read window for late-committing writes
+COUNTERS_RECONCILE_SECONDS = float(os.getenv("COUNTERS_RECONCILE_SECONDS", "60"))  # dashboard counters re-checked against the database
+DASHBOARD_REFRESH_SECONDS = float(os.getenv("DASHBOARD_REFRESH_SECONDS", "3"))  # dashboard tab redraw interval
 
 # Domain constants
 VALID_STATUSES = ["Pending", "Assigned", "In Progress", "Completed", "Canceled"]
 SERVICE_TYPES = ["Repair", "Tuning", "Installation"]
+SKILL_LEVELS = ["Junior", "Mid", "Senior"]  # lowest first
+
+# Scheduling and automatic dispatch
+SERVICE_SKILL_REQUIREMENTS = {"Tuning": "Junior", "Repair": "Mid", "Installation": "Senior"}  # minimum level
+DEFAULT_JOB_DURATION_MINUTES = int(os.getenv("DEFAULT_JOB_DURATION_MINUTES", "120"))  # slot a scheduled job blocks
+DISPATCH_MAX_OPEN_ORDERS = int(os.getenv("DISPATCH_MAX_OPEN_ORDERS", "8"))  # per technician, Assigned + In Progress
+SCHEDULE_INDEX_MAX_AGE = float(os.getenv("SCHEDULE_INDEX_MAX_AGE", "300"))  # seconds before the schedule index reloads
@@ -2,14 +2,42 @@ import tkinter as tk
 from tkinter import messagebox, ttk
 import pyodbc
 import os
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
 import subprocess
 import sys
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# Last connection that worked: {"driver", "name", "conn_str"}; tried first on the next start
+CONNECTION_CACHE_FILE = os.getenv(
+    "LOGIN_CONNECTION_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".connection_cache.json")
+)
+PROBE_TIMEOUT = 5  # seconds per connection attempt
+
+PBKDF2_ITERATIONS = 200_000
+SESSION_TTL = timedelta(hours=8)
+CREDENTIAL_CACHE_SIZE = 256  # users whose password hash is kept in memory
+CREDENTIAL_CACHE_TTL = 300  # seconds before a cached hash is re-read (picks up password changes)
+
+_driver_name = None  # found once per run; pyodbc.drivers() walks the whole ODBC registry
 
 
 # ==================== CHECK ODBC DRIVER ====================
 def check_odbc_driver():
     """Check if ODBC driver is installed and install if not"""
+    global _driver_name
+    if _driver_name:
+        return _driver_name
+
     try:
         # List available ODBC drivers
         drivers = pyodbc.drivers()
@@ -44,6 +72,7 @@ def check_odbc_driver():
             return None
         else:
             print(f"Using driver: {available_driver}")
+            _driver_name = available_driver  # a missing driver is not cached, so installing one is picked up
             return available_driver
 
     except Exception as e:
@@ -51,15 +80,42 @@ def check_odbc_driver():
         return None
 
 
-# ==================== DATABASE CONNECTION ====================
-def connect_db():
-    # First check for ODBC driver
-    driver_name = check_odbc_driver()
-    if not driver_name:
-        return None
+# ==================== CONNECTION CACHE ====================
+def load_cached_connection():
+    """Return the cached {"driver", "name", "conn_str"} or None"""
+    try:
+        with open(CONNECTION_CACHE_FILE, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("driver") and cached.get("conn_str"):
+            return cached
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_cached_connection(driver_name, config):
+    try:
+        with open(CONNECTION_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"driver": driver_name, "name": config["name"], "conn_str": config["conn_str"]}, f)
+    except OSError as e:
+        print(f"Could not save connection cache: {e}")
+
+
+def clear_cached_connection():
+    try:
+        os.remove(CONNECTION_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def database_conn_str(conn_str, database):
+    """Same server and options, different database"""
+    return conn_str.replace("DATABASE=master;", f"DATABASE={database};")
+
 
-    # Try different connection configurations
-    connection_configs = [
+# ==================== DATABASE CONNECTION ====================
+def connection_configs(driver_name):
+    return [
         # Try with named instance
         {
             "name": "Named Instance",
@@ -107,32 +163,95 @@ def connect_db():
         }
     ]
 
-    conn = None
+
+def try_connect(config, timeout=PROBE_TIMEOUT):
+    """Open and test one connection; raises pyodbc.Error on failure"""
+    conn = pyodbc.connect(config['conn_str'], timeout=timeout, autocommit=True)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT @@version")
+        version = cursor.fetchone()[0]
+    except pyodbc.Error:
+        conn.close()
+        raise
+    print(f"✅ Success with: {config['name']}")
+    print(f"SQL Server Version: {version[:100]}...")
+    return conn
+
+
+def probe_connections(configs, timeout=PROBE_TIMEOUT):
+    """
+    Try every config at once and return (conn, config) for the first that
+    connects, or (None, errors). A bad network now costs one timeout, not one
+    per config. Attempts still running when one wins are left to finish in the
+    background and their connections are closed.
+    """
     errors = []
+    pool = ThreadPoolExecutor(max_workers=len(configs), thread_name_prefix="db-probe")
+    futures = {pool.submit(try_connect, config, timeout): config for config in configs}
+    try:
+        for future in as_completed(futures):
+            config = futures[future]
+            try:
+                conn = future.result()
+            except pyodbc.Error as e:
+                error_msg = f"{config['name']}: {str(e)}"
+                errors.append(error_msg)
+                print(f"❌ Failed: {error_msg}")
+                continue
 
-    for config in connection_configs:
-        try:
-            print(f"\nTrying connection: {config['name']}")
-            print(f"Connection string: {config['conn_str'][:100]}...")
+            for other in futures:
+                if other is not future:
+                    other.add_done_callback(_close_unused)
+            return conn, config
+    finally:
+        pool.shutdown(wait=False)
 
-            conn = pyodbc.connect(config['conn_str'], timeout=5, autocommit=True)
-            print(f"✅ Success with: {config['name']}")
+    return None, errors
 
-            # Test the connection
-            cursor = conn.cursor()
-            cursor.execute("SELECT @@version")
-            version = cursor.fetchone()[0]
-            print(f"SQL Server Version: {version[:100]}...")
 
-            return conn
+def _close_unused(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
 
+def find_connection(timeout=PROBE_TIMEOUT):
+    """
+    Connect to master: the cached connection first, then every known config
+    in parallel. The cache is only dropped when its connection fails, and is
+    rewritten with whichever config wins. Returns (conn, errors).
+    """
+    global _driver_name
+    cached = load_cached_connection()
+    if cached:
+        print(f"\nTrying cached connection: {cached.get('name', 'cached')}")
+        try:
+            conn = try_connect(cached, timeout)
+            _driver_name = _driver_name or cached["driver"]  # skip pyodbc.drivers() for later logins
+            return conn, []
         except pyodbc.Error as e:
-            error_msg = f"{config['name']}: {str(e)}"
-            errors.append(error_msg)
-            print(f"❌ Failed: {error_msg}")
-            if conn:
-                conn.close()
-            continue
+            print(f"❌ Cached connection failed: {e}")
+            clear_cached_connection()
+
+    driver_name = check_odbc_driver()
+    if not driver_name:
+        return None, ["No SQL Server ODBC driver installed"]
+
+    configs = connection_configs(driver_name)
+    print(f"\nTrying {len(configs)} connections in parallel...")
+    conn, result = probe_connections(configs, timeout)
+    if conn:
+        save_cached_connection(driver_name, result)
+        return conn, []
+    return None, result
+
+
+def connect_db():
+    conn, errors = find_connection()
+    if conn:
+        return conn
+    if not _driver_name:
+        return None  # check_odbc_driver() has already told the user
 
     # If all connections failed, show detailed error
     error_message = "All connection attempts failed:\n\n"
@@ -148,6 +267,184 @@ def connect_db():
     return None
 
 
+# ==================== PASSWORDS ====================
+def hash_password(password, salt=None, iterations=PBKDF2_ITERATIONS):
+    """Salted PBKDF2-SHA256 as "pbkdf2_sha256$iterations$salt$hash" (90 chars, fits NVARCHAR(100))"""
+    salt = salt or secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return "pbkdf2_sha256${}${}${}".format(
+        iterations, base64.b64encode(salt).decode(), base64.b64encode(digest).decode())
+
+
+def is_hashed(stored):
+    return stored.startswith("pbkdf2_sha256$")
+
+
+def verify_password(password, stored):
+    """Check a password against a stored hash; rows from before hashing hold the plain password"""
+    if not is_hashed(stored):
+        return hmac.compare_digest(password.encode("utf-8"), stored.encode("utf-8"))
+    _, iterations, salt, digest = stored.split("$")
+    candidate = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), base64.b64decode(salt), int(iterations))
+    return hmac.compare_digest(candidate, base64.b64decode(digest))
+
+
+# ==================== SESSIONS ====================
+class CredentialCache:
+    """
+    Username -> (password hash, created_at) for recent logins, least recently
+    used dropped first. A repeat login is verified here without a query;
+    entries are re-read after CREDENTIAL_CACHE_TTL and on any failed check,
+    so a changed password is picked up.
+    """
+
+    def __init__(self, max_size=CREDENTIAL_CACHE_SIZE, ttl=CREDENTIAL_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, username):
+        entry = self._entries.get(username)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[2] > self.ttl:
+            del self._entries[username]
+            return None
+        self._entries.move_to_end(username)
+        return entry[0], entry[1]
+
+    def put(self, username, stored, created_at):
+        self._entries[username] = (stored, created_at, time.monotonic())
+        self._entries.move_to_end(username)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def drop(self, username):
+        self._entries.pop(username, None)
+
+
+@dataclass
+class Session:
+    token: str
+    username: str
+    driver_name: str  # the connection itself is not kept here; a failed lookup may close and reopen it
+    created_at: datetime
+    expires_at: datetime
+    member_since: datetime = None
+
+    @property
+    def expired(self):
+        return datetime.now() >= self.expires_at
+
+    def connection(self):
+        """The kept LoginSystemDB connection, reopened if it was closed since login"""
+        return get_login_connection(self.driver_name)
+
+
+class SessionStore:
+    """Sessions by token; expired ones are removed when looked up or purged"""
+
+    def __init__(self, ttl=SESSION_TTL):
+        self.ttl = ttl
+        self._sessions = {}
+
+    def create(self, username, driver_name, member_since=None):
+        self.purge()
+        now = datetime.now()
+        session = Session(secrets.token_urlsafe(32), username, driver_name, now, now + self.ttl, member_since)
+        self._sessions[session.token] = session
+        return session
+
+    def get(self, token):
+        session = self._sessions.get(token)
+        if session is not None and session.expired:
+            del self._sessions[token]
+            return None
+        return session
+
+    def end(self, token):
+        self._sessions.pop(token, None)
+
+    def purge(self):
+        for token in [t for t, s in self._sessions.items() if s.expired]:
+            del self._sessions[token]
+
+
+credential_cache = CredentialCache()
+sessions = SessionStore()
+_login_conn = None  # one connection to LoginSystemDB, kept across logins
+
+
+def login_conn_str(driver_name):
+    """LoginSystemDB on the server that answered last time if known"""
+    cached = load_cached_connection()
+    if cached:
+        return database_conn_str(cached["conn_str"], "LoginSystemDB")
+    return f"DRIVER={{{driver_name}}};SERVER=.\\SQLEXPRESS;DATABASE=LoginSystemDB;Trusted_Connection=yes;Encrypt=no;"
+
+
+def get_login_connection(driver_name):
+    """The kept connection, opened on first use"""
+    global _login_conn
+    if _login_conn is None:
+        _login_conn = pyodbc.connect(login_conn_str(driver_name), timeout=PROBE_TIMEOUT, autocommit=True)
+    return _login_conn
+
+
+def close_login_connection():
+    global _login_conn
+    if _login_conn is not None:
+        try:
+            _login_conn.close()
+        except pyodbc.Error:
+            pass
+        _login_conn = None
+
+
+def _is_missing_table(error):
+    return "42S02" in str(error)  # Invalid object name 'Users'
+
+
+def _lookup_user(driver_name, username):
+    """(password, created_at) or None; one query, retried once on a fresh connection if the kept one died"""
+    for attempt in range(2):
+        conn = get_login_connection(driver_name)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT password, created_at FROM Users WHERE username = ?", (username,))
+            return cursor.fetchone()
+        except pyodbc.Error as e:
+            close_login_connection()
+            if attempt or _is_missing_table(e):
+                raise
+
+
+def authenticate(driver_name, username, password):
+    """
+    Return a Session for valid credentials, else None. A user seen recently
+    is checked against the credential cache, so a repeat login makes no
+    round-trip at all. Otherwise it is a single
+    lookup by username; a plain-text password from before hashing is
+    replaced by its hash once it has been verified.
+    """
+    cached = credential_cache.get(username)
+    if cached and verify_password(password, cached[0]):
+        return sessions.create(username, driver_name, cached[1])
+
+    row = _lookup_user(driver_name, username)
+    if row is None or not verify_password(password, row[0]):
+        credential_cache.drop(username)
+        return None
+
+    stored = row[0]
+    if not is_hashed(stored):
+        stored = hash_password(password)
+        get_login_connection(driver_name).cursor().execute(
+            "UPDATE Users SET password = ? WHERE username = ?", (stored, username))
+    credential_cache.put(username, stored, row[1])
+    return sessions.create(username, driver_name, row[1])
+
+
 # ==================== DATABASE SETUP ====================
 def setup_database():
     """Create database and table if they don't exist"""
@@ -156,20 +453,8 @@ def setup_database():
         return False
 
     try:
-        # Try multiple connection methods for setup
-        setup_configs = [
-            f"DRIVER={{{driver_name}}};SERVER=.\\SQLEXPRESS;DATABASE=master;Trusted_Connection=yes;Encrypt=no;",
-            f"DRIVER={{{driver_name}}};SERVER=localhost\\SQLEXPRESS;DATABASE=master;Trusted_Connection=yes;Encrypt=no;",
-            f"DRIVER={{{driver_name}}};SERVER=DESKTOP-G8NIUM3\\SQLEXPRESS;DATABASE=master;Trusted_Connection=yes;Encrypt=no;"
-        ]
-
-        conn = None
-        for conn_str in setup_configs:
-            try:
-                conn = pyodbc.connect(conn_str, timeout=10, autocommit=True)
-                break
-            except:
-                continue
+        # Same discovery as connect_db: cached endpoint first, then all configs in parallel
+        conn, _ = find_connection(timeout=10)
 
         if not conn:
             messagebox.showerror("Setup Error", "Cannot connect to SQL Server for setup")
@@ -213,12 +498,10 @@ def setup_database():
         count = cursor.fetchone()[0]
 
         if count == 0:
-            cursor.execute("""
-                INSERT INTO Users (username, password) 
-                VALUES ('admin', 'admin123');
-                INSERT INTO Users (username, password) 
-                VALUES ('user1', 'password123');
-            """)
+            cursor.executemany(
+                "INSERT INTO Users (username, password) VALUES (?, ?)",
+                [("admin", hash_password("admin123")), ("user1", hash_password("password123"))]
+            )
             print("Test users created")
 
         conn.commit()
@@ -408,42 +691,22 @@ def login():
                 login_button.config(state='normal', text="LOGIN")
                 return
 
-            # Try to connect to our database
-            conn_str = f"DRIVER={{{driver_name}}};SERVER=.\\SQLEXPRESS;DATABASE=LoginSystemDB;Trusted_Connection=yes;Encrypt=no;"
-            conn = pyodbc.connect(conn_str, timeout=5)
-            cursor = conn.cursor()
-
-            # Check if table exists
-            cursor.execute("""
-                SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES 
-                WHERE TABLE_NAME = 'Users'
-            """)
-            table_exists = cursor.fetchone()[0]
-
-            if not table_exists:
-                messagebox.showwarning("Table Missing", "Users table not found. Please run Setup Database first.")
-                login_button.config(state='normal', text="LOGIN")
-                conn.close()
-                return
-
-            # Perform login query
-            query = "SELECT username FROM Users WHERE username = ? AND password = ?"
-            cursor.execute(query, (username, password))
-            result = cursor.fetchone()
+            session = authenticate(driver_name, username, password)
 
-            if result:
+            if session:
                 messagebox.showinfo("Success", f"Welcome back, {username}!")
                 root.withdraw()
-                open_main_window(username)
+                open_main_window(session)
             else:
                 messagebox.showerror("Login Failed", "Invalid username or password.")
 
-            conn.close()
             status_label.config(text="✅ Database login complete", fg="#27ae60")
 
         except pyodbc.Error as e:
             error_msg = str(e)
-            if "LoginSystemDB" in error_msg:
+            if _is_missing_table(e):
+                messagebox.showwarning("Table Missing", "Users table not found. Please run Setup Database first.")
+            elif "LoginSystemDB" in error_msg:
                 # Database doesn't exist
                 if messagebox.askyesno("Database Not Found",
                                        "LoginSystemDB database not found.\n\nWould you like to create it now?"):
@@ -461,7 +724,8 @@ def login():
 
 
 # ==================== MAIN APPLICATION WINDOW ====================
-def open_main_window(username):
+def open_main_window(session):
+    username = session.username
     main = tk.Toplevel()
     main.title(f"Main Application - {username}")
     main.geometry("700x500")
@@ -510,6 +774,9 @@ def open_main_window(username):
     Status: Connected to LoginSystemDB
     Authentication: Windows Integrated Security
     """
+    if session.member_since:
+        info_text += f"Member since: {session.member_since:%Y-%m-%d}\n    "
+    info_text += f"Session expires: {session.expires_at:%Y-%m-%d %H:%M}\n"
 
     tk.Label(
         content_frame,
@@ -528,15 +795,27 @@ def open_main_window(username):
         bg="#e74c3c",
         fg="white",
         activebackground="#c0392b",
-        command=lambda: [main.destroy(), root.deiconify()],
+        command=lambda: on_closing(),
         width=15,
         height=2
     ).pack(pady=30)
 
     def on_closing():
+        # The connection stays open for the next login; only the session ends
+        sessions.end(session.token)
         main.destroy()
         root.deiconify()
 
+    def check_expiry():
+        if not main.winfo_exists():
+            return
+        if sessions.get(session.token) is None:
+            messagebox.showinfo("Session Expired", "Your session has expired. Please log in again.")
+            on_closing()
+        else:
+            main.after(60_000, check_expiry)
+
+    main.after(60_000, check_expiry)
     main.protocol("WM_DELETE_WINDOW", on_closing)
 
 
@@ -688,4 +967,11 @@ entry_password.bind("<Return>", lambda event: login())
 # Initial driver check
 root.after(1000, lambda: check_odbc_driver())
 
+
+def on_app_close():
+    close_login_connection()
+    root.destroy()
+
+
+root.protocol("WM_DELETE_WINDOW", on_app_close)
 root.mainloop()
\ No newline at end of file
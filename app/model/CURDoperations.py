@@ -1,55 +1,223 @@
 # app/model/repositories.py
-from typing import List, Optional, Tuple
-from datetime import datetime
-from app.model.dbconnection import get_connection
+from sys import intern
+from typing import Callable, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
+from app.config import STREAM_BATCH_SIZE, CHANGES_BATCH_SIZE, CHANGES_OVERLAP_SECONDS
+from app.model.dbconnection import get_connection, get_engine
 from app.model.customer import Customer
 from app.model.technician import Technician
-from app.model.serviceorder import ServiceOrder
+from app.model.serviceorder import ServiceOrder, ServiceOrderDetail
+from app.model.page import Page, make_page
+from app.model.changes import ChangeWatermark, OrderChanges
+
+
+CUSTOMER_COLUMNS = "CustomerID, Name, Phone, Email, Address, CreatedAt"
+TECHNICIAN_COLUMNS = "TechnicianID, Name, Phone, SkillLevel, Active, CreatedAt"
+CUSTOMER_INSERT = ("Name", "Phone", "Email", "Address")
+TECHNICIAN_INSERT = ("Name", "Phone", "SkillLevel", "Active")
+ORDER_INSERT = ("CustomerID", "TechnicianID", "ServiceType", "Description", "Status", "ScheduledAt")
+ORDER_COLUMNS = (
+    "OrderID, CustomerID, TechnicianID, ServiceType, Description, "
+    "Status, ScheduledAt, CreatedAt, UpdatedAt"
+)
+ORDER_FIELDS = tuple(ORDER_COLUMNS.split(", "))
+# Listings that never show the NVARCHAR(400) Description skip reading it.
+ORDER_BRIEF_COLUMNS = ", ".join(c for c in ORDER_FIELDS if c != "Description")
+# Orders with customer and technician display fields, joined in the same statement (no per-row lookups).
+# Column names stay unique so SQLite's named rows and pyodbc's r.Column both work.
+ORDER_DETAIL_TABLES = (
+    "ServiceOrders o JOIN Customers c ON c.CustomerID = o.CustomerID "
+    "LEFT JOIN Technicians t ON t.TechnicianID = o.TechnicianID"
+)
+ORDER_DETAIL_NAMES = (
+    "c.Name AS CustomerName, c.Phone AS CustomerPhone, t.Name AS TechnicianName, t.SkillLevel AS TechnicianSkillLevel"
+)
+
+
+# The *_COLUMNS lists follow the entities' field order, so rows unpack straight into them.
+def _to_customer(r) -> Customer:
+    return Customer(*r)
+
+
+def _to_technician(r) -> Technician:
+    t = Technician(*r)
+    t.Active = bool(t.Active)
+    return t
+
+
+def _to_order(r) -> ServiceOrder:
+    # ServiceType/Status come from small fixed sets; share one string each instead of one per row.
+    return ServiceOrder(r[0], r[1], r[2], intern(r[3]), r[4], intern(r[5]), r[6], r[7], r[8])
+
+
+def _to_order_brief(r) -> ServiceOrder:
+    # ORDER_BRIEF_COLUMNS: everything but Description.
+    return ServiceOrder(r[0], r[1], r[2], intern(r[3]), None, intern(r[4]), r[5], r[6], r[7])
+
+
+def _to_order_detail(r) -> ServiceOrderDetail:
+    # ORDER_FIELDS, then ORDER_DETAIL_NAMES.
+    return ServiceOrderDetail(r[0], r[1], r[2], intern(r[3]), r[4], intern(r[5]), r[6], r[7], r[8],
+                              r[9], r[10], r[11], intern(r[12]) if r[12] is not None else None)
+
+
+def _to_order_detail_brief(r) -> ServiceOrderDetail:
+    return ServiceOrderDetail(r[0], r[1], r[2], intern(r[3]), None, intern(r[4]), r[5], r[6], r[7],
+                              r[8], r[9], r[10], intern(r[11]) if r[11] is not None else None)
+
+
+def _to_dict(r) -> dict:
+    # namedtuple rows (SQLite) know their fields; pyodbc rows carry the cursor description.
+    names = r._fields if hasattr(r, "_fields") else [d[0] for d in r.cursor_description]
+    return dict(zip(names, r))
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    # Aggregates lose the DATETIME2 column type on SQLite and come back as text.
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _seek(columns: str, table: str, key: str, filters: List[str], params: list, limit: Optional[int],
+          after_id: Optional[int] = None, before_id: Optional[int] = None) -> Tuple[str, tuple]:
+    """
+    Keyset query over `key` (newest first). after_id seeks to older rows and
+    before_id to newer ones (read ascending; callers reverse them), so every
+    page is an index seek no matter how deep it is. limit=None reads everything.
+    """
+    conditions, params = list(filters), list(params)
+    order = "DESC"
+    if after_id is not None:
+        conditions.append(f"{key} < ?")
+        params.append(after_id)
+    elif before_id is not None:
+        conditions.append(f"{key} > ?")
+        params.append(before_id)
+        order = "ASC"
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    sql = f"SELECT {{top}} {columns} FROM {table} {where} ORDER BY {key} {order} {{limit}};"
+    if limit is None:
+        return sql.format(top="", limit=""), tuple(params)
+    return get_engine().page(sql, params, limit)
+
+
+def _stream(query: Tuple[str, tuple], make: Optional[Callable], batch_size: int) -> Iterator:
+    """
+    Yield entities for `query` (rows as fetched when `make` is None) in
+    fetchmany batches of `batch_size`, so memory stays flat however many rows
+    match. The pooled connection is held until the
+    generator is exhausted or closed; wrap it in contextlib.closing() when the
+    consumer may stop early.
+    """
+    with get_connection() as cn:
+        cur = cn.cursor()
+        try:
+            cur.execute(*query)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                if make is None:
+                    yield from rows
+                else:
+                    for r in rows:
+                        yield make(r)
+        finally:
+            cur.close()
+
+
+def _insert(table: str, key: str, columns: Tuple[str, ...], params: tuple) -> int:
+    with get_connection() as cn:
+        cur = cn.cursor()
+        new_id = get_engine().insert(cur, table, key, columns, params)
+        cn.commit()
+        return new_id
+
+
+def _insert_many(table: str, key: str, columns: Tuple[str, ...], rows: List[tuple], bulk: bool = False) -> List[int]:
+    """
+    Insert `rows` in one transaction and return the new keys in row order:
+    multi-row INSERTs returning keys, or executemany() when `bulk` is set.
+    """
+    if not rows:
+        return []
+    with get_connection() as cn:
+        cur = cn.cursor()
+        engine = get_engine()
+        if bulk:
+            ids = engine.bulk_insert(cur, table, key, columns, rows)
+        else:
+            ids = engine.insert_many(cur, table, key, columns, rows)
+        if len(ids) != len(rows):
+            raise RuntimeError(f"Insert into {table} returned {len(ids)} keys for {len(rows)} rows")
+        cn.commit()
+        return ids
 
 
 class CustomerRepository:
     def create(self, customer: Customer) -> int:
+        return _insert("Customers", "CustomerID", CUSTOMER_INSERT,
+                       (customer.Name, customer.Phone, customer.Email, customer.Address))
+
+    def create_many(self, customers: List[Customer]) -> List[int]:
+        return _insert_many("Customers", "CustomerID", CUSTOMER_INSERT,
+                            [(c.Name, c.Phone, c.Email, c.Address) for c in customers])
+
+    def bulk_insert(self, customers: List[Customer]) -> List[int]:
+        return _insert_many("Customers", "CustomerID", CUSTOMER_INSERT,
+                            [(c.Name, c.Phone, c.Email, c.Address) for c in customers], bulk=True)
+
+    def list(self, search: Optional[str] = None, limit: int = 100,
+             after_id: Optional[int] = None, before_id: Optional[int] = None) -> List[Customer]:
+        filters, params = self._filters(search)
         with get_connection() as cn:
             cur = cn.cursor()
-            cur.execute(
-                """
-                INSERT INTO Customers (Name, Phone, Email, Address)
-                VALUES (?, ?, ?, ?);
-                """,
-                (customer.Name, customer.Phone, customer.Email, customer.Address),
-            )
-            cur.execute("SELECT SCOPE_IDENTITY();")
-            new_id = int(cur.fetchone()[0])
-            cn.commit()
-            return new_id
+            cur.execute(*_seek(
+                CUSTOMER_COLUMNS, "Customers", "CustomerID", filters, params, limit, after_id, before_id,
+            ))
+            rows = cur.fetchall()
+            if before_id is not None:
+                rows.reverse()
+            return [_to_customer(r) for r in rows]
+
+    def iter(self, search: Optional[str] = None, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Customer]:
+        filters, params = self._filters(search)
+        return _stream(_seek(CUSTOMER_COLUMNS, "Customers", "CustomerID", filters, params, None),
+                       _to_customer, batch_size)
 
-    def list(self, search: Optional[str] = None, limit: int = 100) -> List[Customer]:
+    def iter_newer(self, customer_id: int, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Customer]:
+        """Customers with an ID above `customer_id`, oldest first."""
+        return _stream(_seek(CUSTOMER_COLUMNS, "Customers", "CustomerID", [], [], None, before_id=customer_id),
+                       _to_customer, batch_size)
+
+    def get_many(self, customer_ids: List[int]) -> List[Customer]:
+        """Customers for the given IDs, in the same order; IDs that no longer exist are skipped."""
+        found = {}
+        size = get_engine().max_params
         with get_connection() as cn:
             cur = cn.cursor()
-            if search:
+            for i in range(0, len(customer_ids), size):
+                chunk = customer_ids[i:i + size]
                 cur.execute(
-                    """
-                    SELECT TOP (?) CustomerID, Name, Phone, Email, Address, CreatedAt
-                    FROM Customers
-                    WHERE Name LIKE ? OR Phone LIKE ? OR Email LIKE ?
-                    ORDER BY CustomerID DESC;
-                    """,
-                    (limit, f"%{search}%", f"%{search}%", f"%{search}%"),
+                    f"SELECT {CUSTOMER_COLUMNS} FROM Customers WHERE CustomerID IN ({', '.join('?' * len(chunk))});",
+                    chunk,
                 )
-            else:
-                cur.execute(
-                    """
-                    SELECT TOP (?) CustomerID, Name, Phone, Email, Address, CreatedAt
-                    FROM Customers
-                    ORDER BY CustomerID DESC;
-                    """,
-                    (limit,),
-                )
-            rows = cur.fetchall()
-            return [
-                Customer(r.CustomerID, r.Name, r.Phone, r.Email, r.Address, r.CreatedAt)
-                for r in rows
-            ]
+                for r in cur.fetchall():
+                    found[r.CustomerID] = _to_customer(r)
+        return [found[i] for i in customer_ids if i in found]
+
+    def list_page(self, search: Optional[str] = None, limit: int = 100,
+                  after_id: Optional[int] = None, before_id: Optional[int] = None) -> Page:
+        rows = self.list(search=search, limit=limit + 1, after_id=after_id, before_id=before_id)
+        if before_id is not None and len(rows) <= limit:
+            # Back at the newest rows: show a full first page rather than a short one.
+            return self.list_page(search=search, limit=limit)
+        return make_page(rows, limit, lambda c: c.CustomerID, after_id, before_id)
+
+    @staticmethod
+    def _filters(search: Optional[str]) -> Tuple[List[str], list]:
+        if not search:
+            return [], []
+        return ["(Name LIKE ? OR Phone LIKE ? OR Email LIKE ?)"], [f"%{search}%", f"%{search}%", f"%{search}%"]
 
     def update(self, customer: Customer) -> None:
         if not customer.CustomerID:
@@ -74,47 +242,57 @@ class CustomerRepository:
 
 class TechnicianRepository:
     def create(self, tech: Technician) -> int:
+        return _insert("Technicians", "TechnicianID", TECHNICIAN_INSERT,
+                       (tech.Name, tech.Phone, tech.SkillLevel, int(tech.Active)))
+
+    def create_many(self, techs: List[Technician]) -> List[int]:
+        return _insert_many("Technicians", "TechnicianID", TECHNICIAN_INSERT,
+                            [(t.Name, t.Phone, t.SkillLevel, int(t.Active)) for t in techs])
+
+    def bulk_insert(self, techs: List[Technician]) -> List[int]:
+        return _insert_many("Technicians", "TechnicianID", TECHNICIAN_INSERT,
+                            [(t.Name, t.Phone, t.SkillLevel, int(t.Active)) for t in techs], bulk=True)
+
+    def list(self, active_only: bool = True, limit: int = 100,
+             after_id: Optional[int] = None, before_id: Optional[int] = None) -> List[Technician]:
+        filters = ["Active = 1"] if active_only else []
         with get_connection() as cn:
             cur = cn.cursor()
-            cur.execute(
-                """
-                INSERT INTO Technicians (Name, Phone, SkillLevel, Active)
-                VALUES (?, ?, ?, ?);
-                """,
-                (tech.Name, tech.Phone, tech.SkillLevel, int(tech.Active)),
-            )
-            cur.execute("SELECT SCOPE_IDENTITY();")
-            new_id = int(cur.fetchone()[0])
-            cn.commit()
-            return new_id
+            cur.execute(*_seek(
+                TECHNICIAN_COLUMNS, "Technicians", "TechnicianID", filters, [], limit, after_id, before_id,
+            ))
+            rows = cur.fetchall()
+            if before_id is not None:
+                rows.reverse()
+            return [_to_technician(r) for r in rows]
 
-    def list(self, active_only: bool = True, limit: int = 100) -> List[Technician]:
+    def iter(self, active_only: bool = True, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Technician]:
+        filters = ["Active = 1"] if active_only else []
+        return _stream(_seek(TECHNICIAN_COLUMNS, "Technicians", "TechnicianID", filters, [], None),
+                       _to_technician, batch_size)
+
+    def get_many(self, technician_ids: List[int]) -> List[Technician]:
+        """Technicians for the given IDs, in the same order; IDs that no longer exist are skipped."""
+        found = {}
+        size = get_engine().max_params
         with get_connection() as cn:
             cur = cn.cursor()
-            if active_only:
+            for i in range(0, len(technician_ids), size):
+                chunk = technician_ids[i:i + size]
                 cur.execute(
-                    """
-                    SELECT TOP (?) TechnicianID, Name, Phone, SkillLevel, Active, CreatedAt
-                    FROM Technicians
-                    WHERE Active = 1
-                    ORDER BY TechnicianID DESC;
-                    """,
-                    (limit,),
+                    f"SELECT {TECHNICIAN_COLUMNS} FROM Technicians WHERE TechnicianID IN ({', '.join('?' * len(chunk))});",
+                    chunk,
                 )
-            else:
-                cur.execute(
-                    """
-                    SELECT TOP (?) TechnicianID, Name, Phone, SkillLevel, Active, CreatedAt
-                    FROM Technicians
-                    ORDER BY TechnicianID DESC;
-                    """,
-                    (limit,),
-                )
-            rows = cur.fetchall()
-            return [
-                Technician(r.TechnicianID, r.Name, r.Phone, r.SkillLevel, bool(r.Active), r.CreatedAt)
-                for r in rows
-            ]
+                for r in cur.fetchall():
+                    found[r.TechnicianID] = _to_technician(r)
+        return [found[i] for i in technician_ids if i in found]
+
+    def list_page(self, active_only: bool = True, limit: int = 100,
+                  after_id: Optional[int] = None, before_id: Optional[int] = None) -> Page:
+        rows = self.list(active_only=active_only, limit=limit + 1, after_id=after_id, before_id=before_id)
+        if before_id is not None and len(rows) <= limit:
+            return self.list_page(active_only=active_only, limit=limit)
+        return make_page(rows, limit, lambda t: t.TechnicianID, after_id, before_id)
 
     def set_active(self, technician_id: int, active: bool) -> None:
         with get_connection() as cn:
@@ -127,82 +305,289 @@ class TechnicianRepository:
 
 class ServiceOrderRepository:
     def create(self, order: ServiceOrder) -> int:
+        return _insert("ServiceOrders", "OrderID", ORDER_INSERT,
+                       (order.CustomerID, order.TechnicianID, order.ServiceType, order.Description, order.Status, order.ScheduledAt))
+
+    def create_many(self, orders: List[ServiceOrder]) -> List[int]:
+        return _insert_many("ServiceOrders", "OrderID", ORDER_INSERT,
+                            [(o.CustomerID, o.TechnicianID, o.ServiceType, o.Description, o.Status, o.ScheduledAt) for o in orders])
+
+    def bulk_insert(self, orders: List[ServiceOrder]) -> List[int]:
+        return _insert_many("ServiceOrders", "OrderID", ORDER_INSERT,
+                            [(o.CustomerID, o.TechnicianID, o.ServiceType, o.Description, o.Status, o.ScheduledAt) for o in orders],
+                            bulk=True)
+
+    def list(self, status: Optional[str] = None, limit: int = 100,
+             after_id: Optional[int] = None, before_id: Optional[int] = None,
+             with_description: bool = True, with_names: bool = False) -> List[ServiceOrder]:
+        """
+        with_description=False leaves Description unread (None), for callers that never show it.
+        with_names=True returns ServiceOrderDetail rows carrying the customer's Name/Phone and the
+        technician's Name/SkillLevel, joined in the same keyset query.
+        """
+        filters, params = (["o.Status = ?"], [status]) if status else ([], [])
+        columns, table, make = self._projection(with_description, with_names)
         with get_connection() as cn:
             cur = cn.cursor()
-            cur.execute(
-                """
-                INSERT INTO ServiceOrders (CustomerID, TechnicianID, ServiceType, Description, Status, ScheduledAt)
-                VALUES (?, ?, ?, ?, ?, ?);
-                """,
-                (order.CustomerID, order.TechnicianID, order.ServiceType, order.Description, order.Status, order.ScheduledAt),
+            cur.execute(*_seek(
+                columns, table, "o.OrderID", filters, params, limit, after_id, before_id,
+            ))
+            rows = cur.fetchall()
+            if before_id is not None:
+                rows.reverse()
+            return [make(r) for r in rows]
+
+    def iter(self, status: Optional[str] = None, batch_size: int = STREAM_BATCH_SIZE,
+             with_description: bool = True, with_names: bool = False) -> Iterator[ServiceOrder]:
+        filters, params = (["o.Status = ?"], [status]) if status else ([], [])
+        columns, table, make = self._projection(with_description, with_names)
+        return _stream(_seek(columns, table, "o.OrderID", filters, params, None), make, batch_size)
+
+    def list_page(self, status: Optional[str] = None, limit: int = 100,
+                  after_id: Optional[int] = None, before_id: Optional[int] = None,
+                  with_description: bool = True, with_names: bool = False) -> Page:
+        rows = self.list(status=status, limit=limit + 1, after_id=after_id, before_id=before_id,
+                         with_description=with_description, with_names=with_names)
+        if before_id is not None and len(rows) <= limit:
+            return self.list_page(status=status, limit=limit, with_description=with_description, with_names=with_names)
+        return make_page(rows, limit, lambda o: o.OrderID, after_id, before_id)
+
+    @staticmethod
+    def _projection(with_description: bool, with_names: bool = False) -> Tuple[str, str, Callable]:
+        """(columns, FROM clause, row converter); the plain listing aliases ServiceOrders as o too."""
+        fields = ORDER_COLUMNS if with_description else ORDER_BRIEF_COLUMNS
+        columns = ", ".join(f"o.{c}" for c in fields.split(", "))
+        if with_names:
+            return (f"{columns}, {ORDER_DETAIL_NAMES}", ORDER_DETAIL_TABLES,
+                    _to_order_detail if with_description else _to_order_detail_brief)
+        return columns, "ServiceOrders o", _to_order if with_description else _to_order_brief
+
+    def created_bounds(self, created_from: Optional[datetime] = None,
+                       created_to: Optional[datetime] = None) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """First and last CreatedAt in [created_from, created_to); (None, None) when empty."""
+        filters, params = self._created_filters(created_from, created_to)
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        with get_connection() as cn:
+            cur = cn.cursor()
+            cur.execute(f"SELECT MIN(CreatedAt), MAX(CreatedAt) FROM ServiceOrders {where};", params)
+            first, last = cur.fetchone()
+            return _as_datetime(first), _as_datetime(last)
+
+    def iter_export(self, created_from: Optional[datetime] = None, created_to: Optional[datetime] = None,
+                    with_names: bool = True, batch_size: int = STREAM_BATCH_SIZE,
+                    as_dicts: bool = True) -> Iterator:
+        """
+        Stream orders created in [created_from, created_to) as flat dicts, oldest
+        first, optionally with CustomerName/TechnicianName joined in.
+        as_dicts=False yields the driver's rows as they are (ORDER_COLUMNS, then
+        the names), which saves building a dict per row in large exports.
+        """
+        filters, params = self._created_filters(created_from, created_to, alias="o.")
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        columns = ", ".join(f"o.{c.strip()}" for c in ORDER_COLUMNS.split(","))
+        joins = ""
+        if with_names:
+            columns += ", c.Name AS CustomerName, t.Name AS TechnicianName"
+            joins = (
+                "LEFT JOIN Customers c ON c.CustomerID = o.CustomerID "
+                "LEFT JOIN Technicians t ON t.TechnicianID = o.TechnicianID"
+            )
+        sql = f"SELECT {columns} FROM ServiceOrders o {joins} {where} ORDER BY o.CreatedAt, o.OrderID;"
+        return _stream((sql, tuple(params)), _to_dict if as_dicts else None, batch_size)
+
+    @staticmethod
+    def _created_filters(created_from: Optional[datetime], created_to: Optional[datetime],
+                         alias: str = "") -> Tuple[List[str], list]:
+        filters, params = [], []
+        if created_from is not None:
+            filters.append(f"{alias}CreatedAt >= ?")
+            params.append(created_from)
+        if created_to is not None:
+            filters.append(f"{alias}CreatedAt < ?")
+            params.append(created_to)
+        return filters, params
+
+    def get(self, order_id: int) -> Optional[ServiceOrder]:
+        with get_connection() as cn:
+            cur = cn.cursor()
+            cur.execute(f"SELECT {ORDER_COLUMNS} FROM ServiceOrders WHERE OrderID = ?;", (order_id,))
+            r = cur.fetchone()
+            return _to_order(r) if r is not None else None
+
+    def assign_technician(self, order_id: int, technician_id: int) -> Optional[ServiceOrder]:
+        """Returns the order as it was before (None if it does not exist)."""
+        with get_connection() as cn:
+            cur = cn.cursor()
+            old = get_engine().update_returning_old(
+                cur, "ServiceOrders", "OrderID", ORDER_FIELDS,
+                "TechnicianID = ?, Status = CASE WHEN Status = 'Pending' THEN 'Assigned' ELSE Status END, "
+                "UpdatedAt = {now}".format(now=get_engine().now),
+                (technician_id,), order_id,
             )
-            cur.execute("SELECT SCOPE_IDENTITY();")
-            new_id = int(cur.fetchone()[0])
             cn.commit()
-            return new_id
+            return _to_order(old) if old is not None else None
 
-    def list(self, status: Optional[str] = None, limit: int = 100) -> List[ServiceOrder]:
+    def get_many(self, order_ids: List[int]) -> List[ServiceOrder]:
+        """Orders for the given IDs, in the same order; IDs that no longer exist are skipped."""
+        found = {}
+        size = get_engine().max_params
         with get_connection() as cn:
             cur = cn.cursor()
-            if status:
-                cur.execute(
-                    """
-                    SELECT TOP (?) OrderID, CustomerID, TechnicianID, ServiceType, Description,
-                           Status, ScheduledAt, CreatedAt, UpdatedAt
-                    FROM ServiceOrders
-                    WHERE Status = ?
-                    ORDER BY OrderID DESC;
-                    """,
-                    (limit, status),
-                )
-            else:
+            for i in range(0, len(order_ids), size):
+                chunk = order_ids[i:i + size]
                 cur.execute(
-                    """
-                    SELECT TOP (?) OrderID, CustomerID, TechnicianID, ServiceType, Description,
-                           Status, ScheduledAt, CreatedAt, UpdatedAt
-                    FROM ServiceOrders
-                    ORDER BY OrderID DESC;
-                    """,
-                    (limit,),
-                )
-            rows = cur.fetchall()
-            return [
-                ServiceOrder(
-                    r.OrderID, r.CustomerID, r.TechnicianID, r.ServiceType, r.Description,
-                    r.Status, r.ScheduledAt, r.CreatedAt, r.UpdatedAt
+                    f"SELECT {ORDER_COLUMNS} FROM ServiceOrders WHERE OrderID IN ({', '.join('?' * len(chunk))});",
+                    chunk,
                 )
-                for r in rows
-            ]
+                for r in cur.fetchall():
+                    found[r.OrderID] = _to_order(r)
+        return [found[i] for i in order_ids if i in found]
 
-    def assign_technician(self, order_id: int, technician_id: int) -> None:
+    def assign_many(self, assignments: List[Tuple[int, int]], pending_only: bool = False) -> List[ServiceOrder]:
+        """
+        Assign (order_id, technician_id) pairs (order IDs unique) in one
+        transaction with set-based UPDATEs, with assign_technician's rules.
+        pending_only touches only orders still Pending and unassigned, so work
+        a dispatcher did meanwhile is never overwritten. Returns the changed
+        orders as they were before.
+        """
+        if not assignments:
+            return []
         with get_connection() as cn:
             cur = cn.cursor()
-            cur.execute(
-                """
-                UPDATE ServiceOrders
-                SET TechnicianID = ?, Status = CASE WHEN Status = 'Pending' THEN 'Assigned' ELSE Status END,
-                    UpdatedAt = SYSUTCDATETIME()
-                WHERE OrderID = ?;
-                """,
-                (technician_id, order_id),
+            engine = get_engine()
+            old = engine.update_from_values(
+                cur, "ServiceOrders", "OrderID", ("OrderID", "TechnicianID"), assignments,
+                "TechnicianID = v.TechnicianID, "
+                "Status = CASE WHEN t.Status = 'Pending' THEN 'Assigned' ELSE t.Status END, "
+                "UpdatedAt = {now}".format(now=engine.now),
+                "t.Status = 'Pending' AND t.TechnicianID IS NULL" if pending_only else "1 = 1",
+                old_columns=ORDER_FIELDS,
+            )
+            cn.commit()
+            return [_to_order(r) for r in old]
+
+    def update_status_many(self, updates: List[Tuple[int, str]]) -> List[ServiceOrder]:
+        """
+        Set (order_id, status) pairs (order IDs unique) in one transaction with
+        set-based UPDATEs. Returns the changed orders as they were before.
+        """
+        if not updates:
+            return []
+        with get_connection() as cn:
+            cur = cn.cursor()
+            engine = get_engine()
+            old = engine.update_from_values(
+                cur, "ServiceOrders", "OrderID", ("OrderID", "Status"), updates,
+                "Status = v.Status, UpdatedAt = {now}".format(now=engine.now),
+                old_columns=ORDER_FIELDS,
             )
             cn.commit()
+            return [_to_order(r) for r in old]
 
-    def update_status(self, order_id: int, status: str) -> None:
+    def open_assignments(self) -> List[Tuple[int, int, Optional[datetime]]]:
+        """(OrderID, TechnicianID, ScheduledAt) for every assigned order that is not finished yet."""
         with get_connection() as cn:
             cur = cn.cursor()
             cur.execute(
-                """
-                UPDATE ServiceOrders
-                SET Status = ?, UpdatedAt = SYSUTCDATETIME()
-                WHERE OrderID = ?;
-                """,
-                (status, order_id),
+                "SELECT OrderID, TechnicianID, ScheduledAt FROM ServiceOrders "
+                "WHERE TechnicianID IS NOT NULL AND Status IN ('Assigned', 'In Progress');"
+            )
+            return [(r.OrderID, r.TechnicianID, _as_datetime(r.ScheduledAt)) for r in cur.fetchall()]
+
+    def order_counts(self) -> List[Tuple[str, str, Optional[int], int]]:
+        """(Status, ServiceType, TechnicianID, count) for every combination present; one scan."""
+        with get_connection() as cn:
+            cur = cn.cursor()
+            cur.execute(
+                "SELECT Status, ServiceType, TechnicianID, COUNT(*) AS N FROM ServiceOrders "
+                "GROUP BY Status, ServiceType, TechnicianID;"
+            )
+            return [(r.Status, r.ServiceType, r.TechnicianID, int(r.N)) for r in cur.fetchall()]
+
+    def update_status(self, order_id: int, status: str) -> Optional[ServiceOrder]:
+        """Returns the order as it was before (None if it does not exist)."""
+        with get_connection() as cn:
+            cur = cn.cursor()
+            old = get_engine().update_returning_old(
+                cur, "ServiceOrders", "OrderID", ORDER_FIELDS,
+                "Status = ?, UpdatedAt = {now}".format(now=get_engine().now), (status,), order_id,
             )
             cn.commit()
+            return _to_order(old) if old is not None else None
 
-    def delete(self, order_id: int) -> None:
+    def delete(self, order_id: int) -> Optional[ServiceOrder]:
+        """Returns the deleted order (None if it did not exist)."""
         with get_connection() as cn:
             cur = cn.cursor()
-            cur.execute("DELETE FROM ServiceOrders WHERE OrderID = ?;", (order_id,))
-            cn.commit()
\ No newline at end of file
+            old = get_engine().delete_returning(cur, "ServiceOrders", "OrderID", ORDER_FIELDS, order_id)
+            if old is not None:
+                # Lets changes_since() readers drop the row too.
+                cur.execute(
+                    "INSERT INTO ServiceOrderTombstones (OrderID, DeletedAt) VALUES (?, {now});".format(now=get_engine().now),
+                    (order_id,),
+                )
+            cn.commit()
+            return _to_order(old) if old is not None else None
+
+    def change_watermark(self) -> ChangeWatermark:
+        """A starting watermark for changes_since(): everything up to (about) now counts as seen."""
+        with get_connection() as cn:
+            cur = cn.cursor()
+            return ChangeWatermark(self._settled(cur))
+
+    def changes_since(self, watermark: ChangeWatermark, limit: int = CHANGES_BATCH_SIZE) -> OrderChanges:
+        """
+        Orders created or modified after `watermark` (at most `limit`, oldest
+        change first) and the IDs deleted since, with the watermark to pass next
+        time. Both queries are index seeks on UpdatedAt / DeletedAt.
+
+        UpdatedAt is stamped when a statement runs, not when it commits, so a
+        slow transaction can commit rows that are older than what a reader has
+        already seen. Only rows at least CHANGES_OVERLAP_SECONDS old (by the
+        server's clock) are returned, so the watermark never moves past that
+        point and late commits inside the window are still picked up. Rows
+        stamped exactly at the watermark can come back once more; apply them
+        as upserts.
+        """
+        with get_connection() as cn:
+            cur = cn.cursor()
+            settled = self._settled(cur)
+            cur.execute(*get_engine().page(
+                f"SELECT {{top}} {ORDER_COLUMNS} FROM ServiceOrders "
+                "WHERE (UpdatedAt > ? OR (UpdatedAt = ? AND OrderID > ?)) AND UpdatedAt <= ? "
+                "ORDER BY UpdatedAt, OrderID {limit};",
+                [watermark.updated_at, watermark.updated_at, watermark.order_id, settled], limit + 1,
+            ))
+            orders = [_to_order(r) for r in cur.fetchall()]
+            cur.execute(
+                "SELECT OrderID, DeletedAt FROM ServiceOrderTombstones WHERE DeletedAt > ? ORDER BY DeletedAt;",
+                (watermark.deleted_at,),
+            )
+            tombstones = cur.fetchall()
+
+        has_more = len(orders) > limit
+        del orders[limit:]
+        if has_more:
+            updated_at, order_id = orders[-1].UpdatedAt, orders[-1].OrderID
+        else:
+            updated_at, order_id = max(settled, watermark.updated_at), 0
+        return OrderChanges(
+            orders=orders,
+            deleted=[r.OrderID for r in tombstones],
+            watermark=ChangeWatermark(updated_at, order_id, max(settled, watermark.deleted_at)),
+            has_more=has_more,
+        )
+
+    def purge_tombstones(self, older_than: datetime) -> int:
+        """Drop tombstones deleted before `older_than`; readers further behind than that must reload."""
+        with get_connection() as cn:
+            cur = cn.cursor()
+            cur.execute("DELETE FROM ServiceOrderTombstones WHERE DeletedAt < ?;", (older_than,))
+            cn.commit()
+            return cur.rowcount
+
+    @staticmethod
+    def _settled(cur) -> datetime:
+        cur.execute(f"SELECT {get_engine().now};")
+        return _as_datetime(cur.fetchone()[0]) - timedelta(seconds=CHANGES_OVERLAP_SECONDS)
\ No newline at end of file
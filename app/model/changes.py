@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+from app.model.serviceorder import ServiceOrder
+
+
+@dataclass(frozen=True)
+class ChangeWatermark:
+    """
+    How far a reader has seen ServiceOrders changes. (updated_at, order_id)
+    is a keyset position in UpdatedAt order; deleted_at is the position in
+    the tombstone log.
+    """
+    updated_at: datetime
+    order_id: int = 0
+    deleted_at: datetime = None
+
+    def __post_init__(self):
+        if self.deleted_at is None:
+            object.__setattr__(self, "deleted_at", self.updated_at)
+
+
+@dataclass
+class OrderChanges:
+    orders: List[ServiceOrder] = field(default_factory=list)  # created or modified, oldest change first
+    deleted: List[int] = field(default_factory=list)  # OrderIDs deleted since the last watermark
+    watermark: ChangeWatermark = None  # pass back to get the next batch
+    has_more: bool = False  # more changes are waiting; ask again straight away
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
     CustomerID: Optional[int]
     Name: str
@@ -1,6 +1,17 @@
 # app/model/db.py
-import pyodbc
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
 from app.config import SQL_SERVER, SQL_DATABASE, SQL_USERNAME, SQL_PASSWORD, SQL_DRIVER
+from app.config import (
+    DB_ENGINE, SQLITE_PATH,
+    DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT, DB_POOL_MAX_IDLE, DB_POOL_VALIDATE_AFTER,
+)
+from app.model.engine import create_engine
+from app.model.instrumentation import InstrumentedCursor, metrics
 
 
 # def get_connection():
@@ -42,29 +53,314 @@ from app.config import SQL_SERVER, SQL_DATABASE, SQL_USERNAME, SQL_PASSWORD, SQL
 #         print(f"❌ Unexpected error: {e}")
 #         return None
 
-def get_connection():
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes free within the checkout timeout."""
+
+
+class PooledConnection:
+    """
+    Checked-out connection. Behaves like the raw connection, and on leaving a
+    `with` block it commits (or rolls back on error) and goes back to the pool.
+    """
+
+    def __init__(self, pool: "ConnectionPool", raw):
+        self._pool = pool
+        self._raw = raw
+
+    def __getattr__(self, name):
+        if self._raw is None:
+            raise RuntimeError("Connection already returned to the pool")
+        return getattr(self._raw, name)
+
+    def __enter__(self):
+        return self
+
+    def cursor(self):
+        if self._raw is None:
+            raise RuntimeError("Connection already returned to the pool")
+        raw = self._raw.cursor()
+        return InstrumentedCursor(raw, metrics) if metrics.enabled else raw
+
+    def __exit__(self, exc_type, exc, tb):
+        broken = False
+        try:
+            if exc_type is None:
+                self._raw.commit()
+            else:
+                self._raw.rollback()
+        except self._pool.errors:
+            broken = True
+            if exc_type is None:
+                raise
+        finally:
+            self._release(broken)
+        return False
+
+    def close(self) -> None:
+        """Return the connection to the pool, discarding any uncommitted work."""
+        if self._raw is None:
+            return
+        broken = False
+        try:
+            self._raw.rollback()
+        except self._pool.errors:
+            broken = True
+        self._release(broken)
+
+    def _release(self, broken: bool) -> None:
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.release(raw, discard=broken)
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe connection pool.
+
+    Idle connections are reused most-recently-used first, closed after `max_idle`
+    seconds (never going below `min_size`), and checked with `validate_query`
+    when they have been idle longer than `validate_after` seconds.
+    """
+
+    def __init__(self, factory: Callable, min_size: int = 1, max_size: int = 10,
+                 timeout: float = 30.0, max_idle: float = 300.0, validate_after: float = 5.0,
+                 validate_query: str = "SELECT 1;", errors: Tuple[type, ...] = (Exception,)):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.validate_after = validate_after
+        self.validate_query = validate_query
+        self.errors = errors  # driver exceptions that mean the connection itself is unusable
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (raw connection, returned at)
+        self._size = 0  # idle + checked out
+        self._closed = False
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "timeouts": 0,
+            "creates": 0,
+            "closes": 0,
+            "validation_failures": 0,
+            "peak_in_use": 0,
+        }
+
+    def prefill(self) -> None:
+        """Open connections until the pool holds `min_size` of them."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            raw = self._create()
+            self.release(raw)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        waited = False
+        while True:
+            raw, idle_since, stale = None, None, []
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    stale.extend(self._evict_idle_locked())
+                    if self._idle:
+                        raw, idle_since = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        self._discard_all(stale)
+                        raise PoolTimeout(
+                            f"No database connection available within {timeout:.1f}s "
+                            f"(pool max_size={self.max_size})"
+                        )
+                    if not waited:
+                        waited = True
+                        self._stats["waits"] += 1
+                    self._cond.wait(remaining)
+            self._discard_all(stale)
+
+            if raw is None:
+                raw = self._create()
+            elif time.monotonic() - idle_since > self.validate_after and not self._is_alive(raw):
+                self._stats["validation_failures"] += 1
+                self._discard(raw)
+                continue
+
+            with self._cond:
+                self._stats["checkouts"] += 1
+                if waited:
+                    self._stats["wait_time"] += time.monotonic() - started
+                in_use = self._size - len(self._idle)
+                if in_use > self._stats["peak_in_use"]:
+                    self._stats["peak_in_use"] = in_use
+            return PooledConnection(self, raw)
+
+    def release(self, raw, discard: bool = False) -> None:
+        with self._cond:
+            if not discard and not self._closed:
+                self._idle.append((raw, time.monotonic()))
+                self._cond.notify()
+                return
+        self._discard(raw)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed when they come back."""
+        with self._cond:
+            self._closed = True
+            idle = [raw for raw, _ in self._idle]
+            self._idle.clear()
+            self._cond.notify_all()
+        self._discard_all(idle)
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot["size"] = self._size
+            snapshot["idle"] = len(self._idle)
+            snapshot["in_use"] = self._size - len(self._idle)
+            snapshot["max_size"] = self.max_size
+        return snapshot
+
+    def _create(self):
+        try:
+            raw = self.factory()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["creates"] += 1
+        return raw
+
+    def _is_alive(self, raw) -> bool:
+        try:
+            cur = raw.cursor()
+            cur.execute(self.validate_query)
+            cur.fetchall()
+            cur.close()
+            return True
+        except Exception:
+            return False
+
+    def _evict_idle_locked(self):
+        # Oldest idle connections sit at the left end of the deque.
+        evicted = []
+        cutoff = time.monotonic() - self.max_idle
+        while self._idle and self._size - len(evicted) > self.min_size and self._idle[0][1] < cutoff:
+            evicted.append(self._idle.popleft()[0])
+        return evicted
+
+    def _discard(self, raw) -> None:
+        try:
+            raw.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._stats["closes"] += 1
+            self._cond.notify()
+
+    def _discard_all(self, raws) -> None:
+        for raw in raws:
+            self._discard(raw)
+
+
+_engine = None
+_pool: Optional[ConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.RLock()
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _pool_lock:
+            if _engine is None:
+                _engine = create_engine(DB_ENGINE, SQLITE_PATH)
+    return _engine
+
+
+def engine_spec():
+    """(name, sqlite path) for recreating the current engine in a worker process."""
+    engine = get_engine()
+    return engine.name, getattr(engine, "path", None)
+
+
+def set_engine(engine) -> None:
+    """Switch storage engines at runtime (embedded mode, benchmarks); drops the current pool."""
+    global _engine
+    close_pool()
+    with _pool_lock:
+        _engine = engine
+
+
+def get_pool() -> ConnectionPool:
+    global _pool, _pool_pid
+    # A pool inherited through fork() holds the parent's sockets; start a fresh one.
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                engine = get_engine()
+                pool = ConnectionPool(
+                    engine.connect,
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    timeout=DB_POOL_TIMEOUT,
+                    max_idle=DB_POOL_MAX_IDLE,
+                    validate_after=DB_POOL_VALIDATE_AFTER,
+                    validate_query=engine.validate_query,
+                    errors=engine.errors,
+                )
+                pool.prefill()
+                _pool, _pool_pid = pool, os.getpid()
+    return _pool
+
+
+def get_connection() -> PooledConnection:
+    started = time.perf_counter()
     try:
-        SQL_DRIVER = 'ODBC Driver 18 for SQL Server'
-        SQL_SERVER = r"DESKTOP-SNKKUPV\SQLEXPRESS"  # or your server name
-        SQL_DATABASE = 'AbidBilalServices'
-
-        # Windows Authentication connection string
-        conn_str = (
-            f"DRIVER={{{SQL_DRIVER}}};"
-            f"SERVER={SQL_SERVER};"
-            f"DATABASE={SQL_DATABASE};"
-            f"Trusted_Connection=yes;"
-            f"TrustServerCertificate=yes;"
-        )
-
-        cnxn = pyodbc.connect(conn_str, autocommit=False)
-        #cnxn.fast_executemany = True
-        print("✅ Windows Authentication connection successful!")
-        return cnxn
-
-    except pyodbc.Error as e:
-        print(f"❌ Connection failed: {e}")
-        return None
-
-
-#get_connection()
\ No newline at end of file
+        cn = get_pool().acquire()
+    except Exception as e:
+        metrics.record_acquire((time.perf_counter() - started) * 1000, error=e)
+        raise
+    metrics.record_acquire((time.perf_counter() - started) * 1000)
+    return cn
+
+
+def query_metrics() -> Dict:
+    """Statement metrics (see instrumentation.QueryMetrics) together with the pool's counters."""
+    return {**metrics.snapshot(), "pool": pool_stats()}
+
+
+def dump_query_metrics(path: str) -> None:
+    metrics.dump_json(path, extra={"pool": pool_stats()})
+
+
+def pool_stats() -> Dict[str, float]:
+    return get_pool().stats()
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            # After fork() the connections still belong to the parent; closing them here would break it.
+            if _pool_pid == os.getpid():
+                _pool.close()
+            _pool = None
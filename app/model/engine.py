@@ -0,0 +1,334 @@
+# app/model/engine.py
+import os
+import sqlite3
+import threading
+from collections import namedtuple
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from app.config import SQL_DATABASE, SQL_DRIVER, SQL_SERVER
+
+try:
+    import pyodbc
+except ImportError:  # SQLite-only installs (branch offices, load-test boxes)
+    pyodbc = None
+
+SQLITE_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schema_sqlite.sql")
+
+
+def _marks(n: int) -> str:
+    return ", ".join("?" * n)
+
+
+def _batches(rows: List[Sequence[Any]], width: int, max_params: int, max_rows: int):
+    """Split rows so each multi-row statement stays under the driver's parameter/row limits."""
+    size = max(1, min(max_rows, max_params // width))
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+class SqlServerEngine:
+    """SQL Server over pyodbc; the dialect the repositories were written for."""
+
+    name = "sqlserver"
+    now = "SYSUTCDATETIME()"
+    validate_query = "SELECT 1;"
+
+    def __init__(self):
+        if pyodbc is None:
+            raise RuntimeError("pyodbc is required for the SQL Server engine (pip install pyodbc)")
+        # We pool connections ourselves; the driver manager's pool would only hide them from us.
+        pyodbc.pooling = False
+        self.errors: Tuple[type, ...] = (pyodbc.Error,)
+        self.integrity_errors: Tuple[type, ...] = (pyodbc.IntegrityError,)  # constraint violations
+        self.unavailable_errors: Tuple[type, ...] = (pyodbc.OperationalError,)  # lost connections, timeouts
+
+    def connect(self):
+        # Windows Authentication. Failures propagate; get_connection() records them in the query metrics.
+        conn_str = (
+            f"DRIVER={{{SQL_DRIVER}}};"
+            f"SERVER={SQL_SERVER};"
+            f"DATABASE={SQL_DATABASE};"
+            f"Trusted_Connection=yes;"
+            f"TrustServerCertificate=yes;"
+        )
+        return pyodbc.connect(conn_str, autocommit=False)
+
+    def page(self, sql: str, params: Sequence[Any], limit: int) -> Tuple[str, tuple]:
+        """Fill the {top}/{limit} slots of a SELECT template; the row limit goes first."""
+        return sql.format(top="TOP (?)", limit=""), (limit, *params)
+
+    max_params = 2099  # 2100 per request, minus headroom
+    max_rows = 1000  # VALUES row-constructor limit
+
+    def insert(self, cur, table: str, key: str, columns: Sequence[str], params: Sequence[Any]) -> int:
+        """Insert one row and return its identity in the same round-trip."""
+        cur.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) OUTPUT INSERTED.{key} VALUES ({_marks(len(columns))});",
+            params,
+        )
+        return int(cur.fetchone()[0])
+
+    def insert_many(self, cur, table: str, key: str, columns: Sequence[str], rows: List[Sequence[Any]]) -> List[int]:
+        """
+        Insert rows with one multi-row statement per batch and return their
+        identities in input order. INSERT ... SELECT ... ORDER BY is the form for
+        which SQL Server guarantees identities follow the ORDER BY.
+        """
+        ids = []
+        cols = ", ".join(columns)
+        width = len(columns) + 1
+        for batch in _batches(rows, width, self.max_params, self.max_rows):
+            values = ", ".join(f"({_marks(width)})" for _ in batch)
+            cur.execute(
+                f"INSERT INTO {table} ({cols}) OUTPUT INSERTED.{key} "
+                f"SELECT {cols} FROM (VALUES {values}) AS s ({cols}, _rn) ORDER BY _rn;",
+                [p for rn, row in enumerate(batch) for p in (*row, rn)],
+            )
+            ids.extend(sorted(int(r[0]) for r in cur.fetchall()))
+        return ids
+
+    def bulk_insert(self, cur, table: str, key: str, columns: Sequence[str], rows: List[Sequence[Any]]) -> List[int]:
+        """
+        executemany() an INSERT with fast_executemany and return the new identities
+        in row order. The exclusive table lock taken first is held until commit,
+        so no other writer can interleave identities with ours.
+        """
+        cur.execute(f"SELECT ISNULL(MAX({key}), 0) FROM {table} WITH (TABLOCKX, HOLDLOCK);")
+        floor = cur.fetchone()[0]
+        cur.fast_executemany = True
+        cur.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({_marks(len(columns))});", rows)
+        cur.execute(f"SELECT {key} FROM {table} WHERE {key} > ? ORDER BY {key};", (floor,))
+        return [int(r[0]) for r in cur.fetchall()]
+
+    def update_from_values(self, cur, table: str, key: str, columns: Sequence[str], rows: List[Sequence[Any]],
+                           assignments: str, condition: str = "1 = 1",
+                           old_columns: Optional[Sequence[str]] = None) -> List[Any]:
+        """
+        Set-based UPDATE of `table` (alias t) joined to the rows as a VALUES
+        table (alias v, `columns`, the first being `key`), one statement per
+        batch. Only rows meeting `condition` change. Returns their keys, or with
+        `old_columns` their rows as they were before (OUTPUT DELETED).
+        """
+        out = []
+        cols = ", ".join(columns)
+        output = ", ".join(f"DELETED.{c}" for c in old_columns) if old_columns else f"INSERTED.{key}"
+        for batch in _batches(rows, len(columns), self.max_params, self.max_rows):
+            values = ", ".join(f"({_marks(len(columns))})" for _ in batch)
+            cur.execute(
+                f"UPDATE t SET {assignments} OUTPUT {output} "
+                f"FROM {table} AS t JOIN (VALUES {values}) AS v ({cols}) ON t.{key} = v.{key} "
+                f"WHERE {condition};",
+                [p for row in batch for p in row],
+            )
+            out.extend(cur.fetchall() if old_columns else (int(r[0]) for r in cur.fetchall()))
+        return out
+
+    def update_returning_old(self, cur, table: str, key: str, columns: Sequence[str], assignments: str,
+                             params: Sequence[Any], key_value: Any):
+        """UPDATE one row by key and return its `columns` as they were before (None if no such row)."""
+        cur.execute(
+            f"UPDATE {table} SET {assignments} OUTPUT {', '.join('DELETED.' + c for c in columns)} "
+            f"WHERE {key} = ?;",
+            (*params, key_value),
+        )
+        return cur.fetchone()
+
+    def delete_returning(self, cur, table: str, key: str, columns: Sequence[str], key_value: Any):
+        """DELETE one row by key and return its `columns` (None if no such row)."""
+        cur.execute(
+            f"DELETE FROM {table} OUTPUT {', '.join('DELETED.' + c for c in columns)} WHERE {key} = ?;",
+            (key_value,),
+        )
+        return cur.fetchone()
+
+
+# SQLite has no DATETIME2; store text in one fixed, sortable format and parse it back.
+def _adapt_datetime(value: datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def _convert_datetime(value: bytes) -> datetime:
+    return datetime.fromisoformat(value.decode())
+
+
+sqlite3.register_adapter(datetime, _adapt_datetime)
+sqlite3.register_converter("DATETIME2", _convert_datetime)
+
+_row_classes = {}
+
+
+def _named_row(cursor, row):
+    # pyodbc rows allow r.ColumnName; give SQLite rows the same shape.
+    names = tuple(col[0] for col in cursor.description)
+    cls = _row_classes.get(names)
+    if cls is None:
+        cls = _row_classes[names] = namedtuple("Row", names, rename=True)
+    return cls(*row)
+
+
+class SqliteEngine:
+    """
+    Embedded SQLite engine implementing app/schema_sqlite.sql.
+
+    `path` is a database file (opened in WAL mode) or ":memory:". In-memory
+    databases use a shared cache so every pooled connection sees the same data;
+    the engine keeps one connection open so the database outlives the pool.
+    """
+
+    name = "sqlite"
+    now = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+    validate_query = "SELECT 1;"
+    errors: Tuple[type, ...] = (sqlite3.Error,)
+    integrity_errors: Tuple[type, ...] = (sqlite3.IntegrityError,)
+    unavailable_errors: Tuple[type, ...] = (sqlite3.OperationalError,)  # e.g. "database is locked"
+
+    def __init__(self, path: str = ":memory:"):
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            raise RuntimeError(f"SQLite 3.35+ is required for RETURNING (found {sqlite3.sqlite_version})")
+        self.path = path
+        self.in_memory = path == ":memory:"
+        if self.in_memory:
+            self._target = f"file:acservicedesk-{id(self)}?mode=memory&cache=shared"
+        else:
+            self._target = path
+        self._schema_lock = threading.Lock()
+        self._keeper = None
+        self._schema_ready = False
+
+    def connect(self):
+        cn = self._open()
+        if not self._schema_ready:
+            self._ensure_schema(cn)
+        return cn
+
+    def _open(self):
+        cn = sqlite3.connect(
+            self._target,
+            uri=self.in_memory,
+            timeout=30,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,  # the pool hands connections between threads, one at a time
+        )
+        cn.row_factory = _named_row
+        cn.execute("PRAGMA foreign_keys = ON;")
+        if not self.in_memory:
+            cn.execute("PRAGMA journal_mode = WAL;")
+            cn.execute("PRAGMA synchronous = NORMAL;")
+        return cn
+
+    def _ensure_schema(self, cn) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            if self.in_memory:
+                self._keeper = self._open()
+            with open(SQLITE_SCHEMA_PATH, encoding="utf-8") as f:
+                cn.executescript(f.read())
+            self._schema_ready = True
+
+    def page(self, sql: str, params: Sequence[Any], limit: int) -> Tuple[str, tuple]:
+        """Fill the {top}/{limit} slots of a SELECT template; the row limit goes last."""
+        return sql.format(top="", limit="LIMIT ?"), (*params, limit)
+
+    max_params = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+    max_rows = 1000
+
+    def insert(self, cur, table: str, key: str, columns: Sequence[str], params: Sequence[Any]) -> int:
+        """Insert one row and return its rowid in the same statement."""
+        cur.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({_marks(len(columns))}) RETURNING {key};",
+            params,
+        )
+        return int(cur.fetchone()[0])
+
+    def insert_many(self, cur, table: str, key: str, columns: Sequence[str], rows: List[Sequence[Any]]) -> List[int]:
+        """
+        Insert rows with one multi-row INSERT ... RETURNING per batch and return
+        their rowids in input order (rowids are handed out in VALUES order).
+        """
+        ids = []
+        cols = ", ".join(columns)
+        for batch in _batches(rows, len(columns), self.max_params, self.max_rows):
+            values = ", ".join(f"({_marks(len(columns))})" for _ in batch)
+            cur.execute(
+                f"INSERT INTO {table} ({cols}) VALUES {values} RETURNING {key};",
+                [p for row in batch for p in row],
+            )
+            ids.extend(sorted(int(r[0]) for r in cur.fetchall()))
+        return ids
+
+    def bulk_insert(self, cur, table: str, key: str, columns: Sequence[str], rows: List[Sequence[Any]]) -> List[int]:
+        """
+        executemany() an INSERT and return the new rowids in row order. BEGIN
+        IMMEDIATE takes the write lock up front, so no other writer can
+        interleave rowids with ours before commit.
+        """
+        if not cur.connection.in_transaction:
+            cur.execute("BEGIN IMMEDIATE;")
+        cur.execute(f"SELECT COALESCE(MAX({key}), 0) FROM {table};")
+        floor = cur.fetchone()[0]
+        cur.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({_marks(len(columns))});", rows)
+        cur.execute(f"SELECT {key} FROM {table} WHERE {key} > ? ORDER BY {key};", (floor,))
+        return [int(r[0]) for r in cur.fetchall()]
+
+    def update_from_values(self, cur, table: str, key: str, columns: Sequence[str], rows: List[Sequence[Any]],
+                           assignments: str, condition: str = "1 = 1",
+                           old_columns: Optional[Sequence[str]] = None) -> List[Any]:
+        """
+        Set-based UPDATE ... FROM (SQLite 3.33+) of `table` (alias t) joined to
+        the rows as a VALUES table (alias v, `columns`, the first being `key`).
+        Only rows meeting `condition` change. Returns their keys, or with
+        `old_columns` (which must include `key`) their rows as they were before;
+        those are read first under BEGIN IMMEDIATE, as RETURNING only sees new values.
+        """
+        out = []
+        named = ", ".join(f"column{i + 1} AS {c}" for i, c in enumerate(columns))
+        if old_columns and not cur.connection.in_transaction:
+            cur.execute("BEGIN IMMEDIATE;")
+        for batch in _batches(rows, len(columns), self.max_params, self.max_rows):
+            before = {}
+            if old_columns:
+                cur.execute(
+                    f"SELECT {', '.join(old_columns)} FROM {table} WHERE {key} IN ({_marks(len(batch))});",
+                    [row[0] for row in batch],
+                )
+                before = {getattr(r, key): r for r in cur.fetchall()}
+            values = ", ".join(f"({_marks(len(columns))})" for _ in batch)
+            cur.execute(
+                f"UPDATE {table} AS t SET {assignments} "
+                f"FROM (SELECT {named} FROM (VALUES {values})) AS v "
+                f"WHERE t.{key} = v.{key} AND {condition} RETURNING {key};",
+                [p for row in batch for p in row],
+            )
+            changed = [int(r[0]) for r in cur.fetchall()]
+            out.extend([before[k] for k in changed] if old_columns else changed)
+        return out
+
+    def update_returning_old(self, cur, table: str, key: str, columns: Sequence[str], assignments: str,
+                             params: Sequence[Any], key_value: Any):
+        """
+        UPDATE one row by key and return its `columns` as they were before (None
+        if no such row). RETURNING only sees new values, so the row is read
+        first under BEGIN IMMEDIATE, which keeps other writers out until commit.
+        """
+        if not cur.connection.in_transaction:
+            cur.execute("BEGIN IMMEDIATE;")
+        cur.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE {key} = ?;", (key_value,))
+        old = cur.fetchone()
+        if old is not None:
+            cur.execute(f"UPDATE {table} SET {assignments} WHERE {key} = ?;", (*params, key_value))
+        return old
+
+    def delete_returning(self, cur, table: str, key: str, columns: Sequence[str], key_value: Any):
+        """DELETE one row by key and return its `columns` (None if no such row)."""
+        cur.execute(f"DELETE FROM {table} WHERE {key} = ? RETURNING {', '.join(columns)};", (key_value,))
+        return cur.fetchone()
+
+
+def create_engine(name: str, sqlite_path: str = ":memory:"):
+    if name == "sqlserver":
+        return SqlServerEngine()
+    if name == "sqlite":
+        return SqliteEngine(sqlite_path)
+    raise ValueError(f"Unknown DB_ENGINE {name!r}. Allowed: ['sqlserver', 'sqlite']")
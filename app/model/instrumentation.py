@@ -0,0 +1,262 @@
+# app/model/instrumentation.py
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.config import QUERY_METRICS, SLOW_QUERY_MS, SLOW_QUERY_LOG, QUERY_METRICS_DUMP
+
+# Upper bounds (ms) of the latency buckets; the last bucket is open-ended.
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+MAX_STATEMENTS = 500  # distinct statements tracked before the rest are lumped under "(other)"
+
+slow_log = logging.getLogger("acservicedesk.slowquery")
+slow_log.addHandler(logging.NullHandler())  # without a logging config, don't fall back to stderr
+
+_WHITESPACE = re.compile(r"\s+")
+_ROW_GROUPS = re.compile(r"\((?:\?, )*\?\)(?:, \((?:\?, )*\?\))+")
+_MARK_LISTS = re.compile(r"\?(?:, \?){3,}")
+
+
+def normalize_sql(sql: str) -> str:
+    """One key per statement shape: whitespace collapsed, multi-row VALUES and long IN lists folded."""
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _ROW_GROUPS.sub("(...), ...", sql)
+    return _MARK_LISTS.sub("?, ...", sql)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; percentiles are bucket upper bounds."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = self.count * q / 100
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return min(BUCKETS_MS[i], self.max_ms) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={b:g}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]:g}ms"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class StatementStats:
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.latency = Histogram()
+        self.rows = 0
+        self.errors = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"sql": self.sql, "rows": self.rows, "errors": self.errors, **self.latency.snapshot()}
+
+
+class QueryMetrics:
+    """
+    Process-wide statement metrics: a latency histogram, row count and error
+    count per normalized statement; a histogram of pool checkout (acquire)
+    times; error counts by exception type; and the most recent slow
+    statements. Statements slower than `slow_ms` also go to the
+    "acservicedesk.slowquery" logger.
+    """
+
+    def __init__(self, enabled: bool = QUERY_METRICS, slow_ms: float = SLOW_QUERY_MS, keep_slow: int = 100):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._keep_slow = keep_slow
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._since = datetime.now()
+            self._statements: Dict[str, StatementStats] = {}
+            self._acquire = Histogram()
+            self._acquire_errors = 0
+            self._errors: Dict[str, int] = {}
+            self._slow = deque(maxlen=self._keep_slow)
+
+    def _stats_for(self, sql: str) -> StatementStats:
+        stats = self._statements.get(sql)
+        if stats is None:
+            if len(self._statements) >= MAX_STATEMENTS:
+                sql = "(other)"
+                stats = self._statements.get(sql)
+            if stats is None:
+                stats = self._statements[sql] = StatementStats(sql)
+        return stats
+
+    def record(self, sql: str, ms: float, rows: int = 0, error: Optional[BaseException] = None,
+               params: int = 0) -> StatementStats:
+        key = normalize_sql(sql)
+        with self._lock:
+            stats = self._stats_for(key)
+            stats.latency.add(ms)
+            stats.rows += rows
+            if error is not None:
+                stats.errors += 1
+                name = type(error).__name__
+                self._errors[name] = self._errors.get(name, 0) + 1
+            slow = ms >= self.slow_ms
+            if slow:
+                self._slow.append({
+                    "at": datetime.now().isoformat(timespec="milliseconds"),
+                    "ms": round(ms, 3),
+                    "sql": key,
+                    "params": params,
+                    "error": repr(error) if error is not None else None,
+                })
+        if slow:
+            # Parameter values can hold customer data; only their count is logged.
+            slow_log.warning("%.1f ms (%d params%s): %s", ms, params,
+                             f", {type(error).__name__}" if error is not None else "", key)
+        return stats
+
+    def add_rows(self, stats: StatementStats, rows: int) -> None:
+        with self._lock:
+            stats.rows += rows
+
+    def record_acquire(self, ms: float, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._acquire.add(ms)
+            if error is not None:
+                self._acquire_errors += 1
+                name = type(error).__name__
+                self._errors[name] = self._errors.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Everything recorded since the last reset, statements ordered by total time."""
+        with self._lock:
+            statements = sorted((s.snapshot() for s in self._statements.values()),
+                                key=lambda s: s["total_ms"], reverse=True)
+            return {
+                "enabled": self.enabled,
+                "since": self._since.isoformat(timespec="seconds"),
+                "taken_at": datetime.now().isoformat(timespec="seconds"),
+                "slow_ms": self.slow_ms,
+                "statements": statements,
+                "acquire": {**self._acquire.snapshot(), "errors": self._acquire_errors},
+                "errors": dict(self._errors),
+                "slow_queries": list(self._slow),
+            }
+
+    def dump_json(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """Write snapshot() (plus e.g. pool stats in `extra`) to `path` atomically."""
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(tmp, path)
+
+
+class InstrumentedCursor:
+    """
+    Wraps a DB-API cursor and reports every execute()/executemany() to
+    QueryMetrics. Rows are counted as they are fetched for queries, and
+    from rowcount for statements that return no result set.
+    """
+
+    def __init__(self, raw, metrics: QueryMetrics):
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_metrics", metrics)
+        object.__setattr__(self, "_current", None)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._raw, name, value)  # e.g. fast_executemany
+
+    def __iter__(self):
+        for row in self._raw:
+            self._count(1)
+            yield row
+
+    def execute(self, sql: str, params=()):
+        self._run(self._raw.execute, sql, (params,) if params else (), len(params) if params else 0)
+        return self
+
+    def executemany(self, sql: str, seq_of_params):
+        seq_of_params = seq_of_params if isinstance(seq_of_params, (list, tuple)) else list(seq_of_params)
+        self._run(self._raw.executemany, sql, (seq_of_params,), len(seq_of_params))
+        return self
+
+    def fetchone(self):
+        row = self._raw.fetchone()
+        if row is not None:
+            self._count(1)
+        return row
+
+    def fetchmany(self, size: int = None):
+        rows = self._raw.fetchmany(size) if size is not None else self._raw.fetchmany()
+        self._count(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._raw.fetchall()
+        self._count(len(rows))
+        return rows
+
+    def _run(self, method, sql: str, args: tuple, n_params: int) -> None:
+        started = time.perf_counter()
+        try:
+            method(sql, *args)
+        except Exception as e:
+            object.__setattr__(self, "_current", None)
+            self._metrics.record(sql, (time.perf_counter() - started) * 1000, error=e, params=n_params)
+            raise
+        ms = (time.perf_counter() - started) * 1000
+        affected = self._raw.rowcount if self._raw.description is None else 0
+        stats = self._metrics.record(sql, ms, rows=max(affected, 0), params=n_params)
+        object.__setattr__(self, "_current", stats if self._raw.description is not None else None)
+
+    def _count(self, n: int) -> None:
+        if n and self._current is not None:
+            self._metrics.add_rows(self._current, n)
+
+
+metrics = QueryMetrics()
+
+if SLOW_QUERY_LOG:
+    _handler = logging.FileHandler(SLOW_QUERY_LOG, encoding="utf-8")
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_log.addHandler(_handler)
+    slow_log.setLevel(logging.WARNING)
+
+if QUERY_METRICS_DUMP:
+    atexit.register(lambda: metrics.dump_json(QUERY_METRICS_DUMP))
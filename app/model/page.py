@@ -0,0 +1,47 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Optional
+
+
+@dataclass
+class Page:
+    """
+    One page of a keyset-paginated listing (newest first).
+
+    Pass `next_cursor` as after_id to get the following (older) page and
+    `prev_cursor` as before_id to get the preceding (newer) one; None means
+    there is nothing further in that direction.
+    """
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[int] = None
+    prev_cursor: Optional[int] = None
+
+
+def make_page(rows: List[Any], limit: int, key: Callable[[Any], int],
+              after_id: Optional[int] = None, before_id: Optional[int] = None) -> Page:
+    """Build a Page from up to limit + 1 rows (newest first); the extra row only signals more data."""
+    if before_id is not None:
+        has_newer = len(rows) > limit
+        items = rows[len(rows) - limit:] if has_newer else rows
+        return Page(
+            items=items,
+            next_cursor=key(items[-1]) if items else None,
+            prev_cursor=key(items[0]) if has_newer else None,
+        )
+    has_older = len(rows) > limit
+    items = rows[:limit]
+    return Page(
+        items=items,
+        next_cursor=key(items[-1]) if has_older else None,
+        prev_cursor=key(items[0]) if after_id is not None and items else None,
+    )
+
+
+def keyset_slice(keys: Iterable[int], limit: int,
+                 after_id: Optional[int] = None, before_id: Optional[int] = None) -> List[int]:
+    """The keys a keyset list() would return for these cursors, newest first, taken from an in-memory set."""
+    if before_id is not None:
+        return heapq.nsmallest(limit, (k for k in keys if k > before_id))[::-1]
+    if after_id is not None:
+        keys = (k for k in keys if k < after_id)
+    return heapq.nlargest(limit, keys)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class ServiceOrder:
     OrderID: Optional[int]
     CustomerID: int
@@ -12,4 +12,12 @@ class ServiceOrder:
     Status: str
     ScheduledAt: Optional[datetime]
     CreatedAt: Optional[datetime] = None
-    UpdatedAt: Optional[datetime] = None
\ No newline at end of file
+    UpdatedAt: Optional[datetime] = None
+
+@dataclass(slots=True)
+class ServiceOrderDetail(ServiceOrder):
+    """A ServiceOrder with its customer's and technician's display fields, for listings."""
+    CustomerName: Optional[str] = None
+    CustomerPhone: Optional[str] = None
+    TechnicianName: Optional[str] = None
+    TechnicianSkillLevel: Optional[str] = None
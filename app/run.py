@@ -1,5 +1,9 @@
 # run.py
+import time
+
+_started = time.perf_counter()  # before the UI, services and driver are imported: startup timing starts here
+
 from app.view.UI import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(_started)
@@ -31,7 +31,20 @@ CREATE TABLE ServiceOrders (
     CONSTRAINT FK_ServiceOrders_Technicians FOREIGN KEY (TechnicianID) REFERENCES Technicians(TechnicianID)
 );
 
+-- Deleted orders, so desks polling for changes can drop them too
+CREATE TABLE ServiceOrderTombstones (
+    OrderID INT NOT NULL PRIMARY KEY,
+    DeletedAt DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME()
+);
+
 -- Helpful indexes
 CREATE INDEX IX_ServiceOrders_Status ON ServiceOrders(Status);
 CREATE INDEX IX_ServiceOrders_CustomerID ON ServiceOrders(CustomerID);
 CREATE INDEX IX_ServiceOrders_TechnicianID ON ServiceOrders(TechnicianID);
+-- Date-range exports
+CREATE INDEX IX_ServiceOrders_CreatedAt ON ServiceOrders(CreatedAt);
+-- Keyset paging of active technicians (TechnicianID rides along as the clustered key)
+CREATE INDEX IX_Technicians_Active ON Technicians(Active);
+-- Incremental refresh (changes since an UpdatedAt watermark)
+CREATE INDEX IX_ServiceOrders_UpdatedAt ON ServiceOrders(UpdatedAt, OrderID);
+CREATE INDEX IX_ServiceOrderTombstones_DeletedAt ON ServiceOrderTombstones(DeletedAt);
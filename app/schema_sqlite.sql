@@ -0,0 +1,51 @@
+-- schema_sqlite.sql
+-- SQLite equivalent of schema.sql, used by the embedded engine (DB_ENGINE=sqlite).
+CREATE TABLE IF NOT EXISTS Customers (
+    CustomerID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Name NVARCHAR(100) NOT NULL,
+    Phone NVARCHAR(30) NOT NULL,
+    Email NVARCHAR(100) NULL,
+    Address NVARCHAR(200) NULL,
+    CreatedAt DATETIME2 NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS Technicians (
+    TechnicianID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Name NVARCHAR(100) NOT NULL,
+    Phone NVARCHAR(30) NOT NULL,
+    SkillLevel NVARCHAR(50) NOT NULL, -- e.g., "Junior", "Senior"
+    Active BIT NOT NULL DEFAULT 1,
+    CreatedAt DATETIME2 NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS ServiceOrders (
+    OrderID INTEGER PRIMARY KEY AUTOINCREMENT,
+    CustomerID INT NOT NULL,
+    TechnicianID INT NULL,
+    ServiceType NVARCHAR(50) NOT NULL, -- e.g., "Repair", "Tuning", "Installation"
+    Description NVARCHAR(400) NULL,
+    Status NVARCHAR(30) NOT NULL DEFAULT 'Pending', -- Pending, Assigned, In Progress, Completed, Canceled
+    ScheduledAt DATETIME2 NULL,
+    CreatedAt DATETIME2 NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now')),
+    UpdatedAt DATETIME2 NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now')),
+    CONSTRAINT FK_ServiceOrders_Customers FOREIGN KEY (CustomerID) REFERENCES Customers(CustomerID),
+    CONSTRAINT FK_ServiceOrders_Technicians FOREIGN KEY (TechnicianID) REFERENCES Technicians(TechnicianID)
+);
+
+-- Deleted orders, so desks polling for changes can drop them too
+CREATE TABLE IF NOT EXISTS ServiceOrderTombstones (
+    OrderID INT NOT NULL PRIMARY KEY,
+    DeletedAt DATETIME2 NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+
+-- Helpful indexes
+CREATE INDEX IF NOT EXISTS IX_ServiceOrders_Status ON ServiceOrders(Status);
+CREATE INDEX IF NOT EXISTS IX_ServiceOrders_CustomerID ON ServiceOrders(CustomerID);
+CREATE INDEX IF NOT EXISTS IX_ServiceOrders_TechnicianID ON ServiceOrders(TechnicianID);
+-- Date-range exports
+CREATE INDEX IF NOT EXISTS IX_ServiceOrders_CreatedAt ON ServiceOrders(CreatedAt);
+-- Keyset paging of active technicians (the rowid rides along in every index)
+CREATE INDEX IF NOT EXISTS IX_Technicians_Active ON Technicians(Active);
+-- Incremental refresh (changes since an UpdatedAt watermark)
+CREATE INDEX IF NOT EXISTS IX_ServiceOrders_UpdatedAt ON ServiceOrders(UpdatedAt, OrderID);
+CREATE INDEX IF NOT EXISTS IX_ServiceOrderTombstones_DeletedAt ON ServiceOrderTombstones(DeletedAt);
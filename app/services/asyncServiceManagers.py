@@ -0,0 +1,158 @@
+# app/services/asyncServiceManagers.py
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.config import ASYNC_WORKERS, ASYNC_MAX_WAITING, ASYNC_WAIT_TIMEOUT, DEFAULT_PAGE_SIZE
+from app.services.customerServiceManager import CustomerServiceManager
+from app.services.technicianServiceManager import TechnicianServiceManager
+from app.services.serviceorderServiceManager import ServiceorderServiceManager
+
+
+class ServiceBusy(RuntimeError):
+    """Raised instead of queueing when too many calls are already waiting for a worker."""
+
+
+class AsyncExecutor:
+    """
+    Runs blocking service calls on a bounded thread pool for asyncio code.
+
+    At most `max_workers` calls run at once (size it to the connection pool so
+    workers never queue inside get_connection()). Further calls wait on a
+    semaphore in the event loop, where they can be cancelled cheaply. Once
+    `max_waiting` calls are already waiting, or a call has waited
+    `wait_timeout` seconds, ServiceBusy is raised so callers can shed load
+    instead of piling up. A slot is freed when the thread finishes, not when
+    the awaiting task is cancelled, so the bound holds even for abandoned calls.
+    Use one executor per event loop.
+    """
+
+    def __init__(self, max_workers: int = ASYNC_WORKERS, max_waiting: int = ASYNC_MAX_WAITING,
+                 wait_timeout: float = ASYNC_WAIT_TIMEOUT):
+        self.max_workers = max_workers
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-db")
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        if self._slots.locked():
+            if self.waiting >= self.max_waiting:
+                self.rejected += 1
+                raise ServiceBusy(f"{self.waiting} calls already waiting for a database worker")
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.wait_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise ServiceBusy(f"No database worker free within {self.wait_timeout:g}s") from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._slots.acquire()
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._pool.submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._slots.release()
+            raise
+        self.running += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._finished))
+        return await asyncio.wrap_future(future)
+
+    def _finished(self) -> None:
+        # Runs on the event loop thread, like every other use of the counters.
+        self.running -= 1
+        self.completed += 1
+        self._slots.release()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _delegate(name: str, sync_class: type):
+    """An async method running sync_class.<name> on the executor, with its signature and docstring."""
+    method = getattr(sync_class, name)
+
+    @functools.wraps(method)
+    async def call(self, *args, **kwargs):
+        return await self.executor.run(getattr(self.sync, name), *args, **kwargs)
+    return call
+
+
+class _AsyncManager:
+    # Sync manager class and the methods to expose; iter_* streams are left out on purpose:
+    # each holds a pooled connection until it is exhausted, which does not mix with awaiting.
+    sync_class: type
+    methods: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls.methods:
+            setattr(cls, name, _delegate(name, cls.sync_class))
+
+    def __init__(self, executor: "AsyncExecutor", sync=None):
+        self.executor = executor
+        # The sync managers share their caches and in-memory indexes process-wide, so async and
+        # sync callers see (and keep current) the same ones, with the same validation rules.
+        self.sync = sync if sync is not None else self.sync_class()
+
+
+class AsyncCustomerServiceManager(_AsyncManager):
+    sync_class = CustomerServiceManager
+    methods = ("create_customer", "create_customers", "list_customers", "list_customers_page",
+               "search_customers", "update_customer", "delete_customer")
+
+
+class AsyncTechnicianServiceManager(_AsyncManager):
+    sync_class = TechnicianServiceManager
+    methods = ("create_technician", "create_technicians", "list_technicians", "list_technicians_page",
+               "set_technician_active")
+
+
+class AsyncServiceorderServiceManager(_AsyncManager):
+    sync_class = ServiceorderServiceManager
+    methods = ("create_order", "create_orders", "list_orders", "list_orders_page", "orders_snapshot",
+               "order_changes", "list_order_details_page", "order_details_snapshot", "order_detail_changes",
+               "assign_technician", "update_order_status", "update_status_many", "assign_many", "delete_order",
+               "order_counts", "reconcile_counts", "is_slot_free", "slot_conflicts", "next_free_slot",
+               "schedule_conflicts")
+
+
+class AsyncServiceDesk:
+    """The three async managers over one executor, plus fan-out helpers."""
+
+    def __init__(self, executor: Optional[AsyncExecutor] = None):
+        self.executor = executor or AsyncExecutor()
+        self.customers = AsyncCustomerServiceManager(self.executor)
+        self.technicians = AsyncTechnicianServiceManager(self.executor)
+        self.orders = AsyncServiceorderServiceManager(self.executor)
+
+    async def startup_snapshot(self, page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """First page of customers, active technicians and orders (with a change watermark), loaded concurrently."""
+        customers, technicians, (orders, watermark) = await asyncio.gather(
+            self.customers.list_customers_page(limit=page_size),
+            self.technicians.list_technicians_page(active_only=True, limit=page_size),
+            self.orders.orders_snapshot(limit=page_size),
+        )
+        return {"customers": customers, "technicians": technicians, "orders": orders, "watermark": watermark}
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.executor.shutdown(wait)
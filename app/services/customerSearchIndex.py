@@ -0,0 +1,310 @@
+# app/services/customerSearchIndex.py
+import heapq
+import re
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config import CUSTOMER_SEARCH_INDEX_MAX_AGE
+from app.model.customer import Customer
+from app.model.page import keyset_slice
+from app.services.processWide import process_wide
+
+_NON_DIGITS = re.compile(r"\D")
+_PHONE_LIKE = re.compile(r"^[\d\s()+\-.]+$")
+
+NAME, PHONE, EMAIL, WORD = range(4)
+
+Doc = Tuple[str, str, str]  # (name, phone digits, email), lower-cased
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _query_forms(query: str) -> Tuple[str, str]:
+    text = query.strip().lower()
+    digits = _NON_DIGITS.sub("", text) if _PHONE_LIKE.match(text) else ""
+    return text, digits
+
+
+def _tier_test(kind: int, key: str, prefix: bool) -> Callable[[Doc], bool]:
+    if kind == WORD:
+        return lambda d: any(w.startswith(key) for w in d[NAME].split()[1:])
+    if prefix:
+        return lambda d: d[kind].startswith(key)
+    return lambda d: d[kind] == key
+
+
+class _SortedKeys:
+    """(key, id) pairs kept sorted, answering exact/prefix lookups by bisection."""
+
+    def __init__(self):
+        self.items: List[Tuple[str, int]] = []
+
+    def bulk_load(self, items: List[Tuple[str, int]]) -> None:
+        items.sort()
+        self.items = items
+
+    def add(self, key: str, ident: int) -> None:
+        insort(self.items, (key, ident))
+
+    def remove(self, key: str, ident: int) -> None:
+        i = bisect_left(self.items, (key, ident))
+        if i < len(self.items) and self.items[i] == (key, ident):
+            del self.items[i]
+
+    def bounds(self, key: str, prefix: bool) -> Tuple[int, int]:
+        lo = bisect_left(self.items, (key,))
+        return lo, bisect_left(self.items, (key + ("\U0010ffff" if prefix else "\x00"),), lo)
+
+    def ids(self, lo: int, hi: int) -> Set[int]:
+        items = self.items
+        return {items[i][1] for i in range(lo, hi)}
+
+
+class CustomerSearchIndex:
+    """
+    In-memory index over customer Name, Phone (digits only) and Email.
+
+    A trigram index answers "contains" queries with the same matches as the
+    repository's LIKE '%term%' search. Phones also match with punctuation
+    stripped. Sorted key arrays answer exact and prefix lookups. search()
+    ranks hits in tiers, best first:
+      exact Name, Phone, Email; Name prefix, Phone prefix, word prefix,
+      Email prefix; substring in Name, Phone, Email.
+    Ties go to the newest ID.
+
+    The index works out how many rows a tier or query could match. If that
+    is large, walking IDs newest-first reaches `limit` hits sooner than
+    collecting every match, so common terms stay cheap too.
+    CustomerServiceManager keeps the index current on create/update/delete.
+    Customers created elsewhere (other desks, imports, the API) are picked up
+    by top_up() before each search; edits and deletes made elsewhere are seen
+    once the index is older than `max_age` seconds and is rebuilt.
+    """
+
+    def __init__(self, max_age: float = CUSTOMER_SEARCH_INDEX_MAX_AGE):
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._docs: Dict[int, Doc] = {}
+        self._order: List[int] = []  # every indexed ID, ascending
+        self._grams: Dict[str, Set[int]] = {}
+        self._keys = [_SortedKeys() for _ in range(4)]  # NAME, PHONE, EMAIL, WORD
+        self._built_at: Optional[float] = None
+        self._loaded_to = 0  # highest ID read from the database; local adds don't move it
+
+    @property
+    def built(self) -> bool:
+        return self._built_at is not None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def build(self, customers: Iterable[Customer]) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._grams.clear()
+            keys: List[List[Tuple[str, int]]] = [[], [], [], []]
+            for c in customers:
+                doc = self._add_doc(c)
+                for kind, key in self._doc_keys(doc):
+                    keys[kind].append((key, c.CustomerID))
+            for sorted_keys, items in zip(self._keys, keys):
+                sorted_keys.bulk_load(items)
+            self._order = sorted(self._docs)
+            self._loaded_to = self._order[-1] if self._order else 0
+            self._built_at = time.monotonic()
+
+    def ensure_built(self, load: Callable[[], Iterable[Customer]]) -> None:
+        with self._lock:
+            if self._built_at is None or time.monotonic() - self._built_at > self.max_age:
+                self.build(load())
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._built_at = None
+
+    def top_up(self, load_newer: Callable[[int], Iterable[Customer]]) -> int:
+        """Index the customers `load_newer(id)` returns above the highest ID loaded so far; returns how many."""
+        newer = list(load_newer(self._loaded_to))  # outside the lock; usually an empty index seek
+        if not newer:
+            return 0
+        with self._lock:
+            keys: List[List[Tuple[str, int]]] = [[], [], [], []]
+            for c in newer:
+                self._remove(c.CustomerID)  # already added by this desk's manager
+                doc = self._add_doc(c)
+                for kind, key in self._doc_keys(doc):
+                    keys[kind].append((key, c.CustomerID))
+                self._order.append(c.CustomerID)
+            for sorted_keys, items in zip(self._keys, keys):
+                if items:
+                    sorted_keys.items.extend(items)
+                    sorted_keys.items.sort()  # one merge, not an insort per row, after a large import
+            self._order.sort()
+            self._loaded_to = max(self._loaded_to, max(c.CustomerID for c in newer))
+            return len(newer)
+
+    def add(self, customer: Customer) -> None:
+        with self._lock:
+            self._remove(customer.CustomerID)
+            doc = self._add_doc(customer)
+            for kind, key in self._doc_keys(doc):
+                self._keys[kind].add(key, customer.CustomerID)
+            if not self._order or customer.CustomerID > self._order[-1]:
+                self._order.append(customer.CustomerID)
+            else:
+                insort(self._order, customer.CustomerID)
+
+    def remove(self, customer_id: int) -> None:
+        with self._lock:
+            self._remove(customer_id)
+
+    def matches(self, query: str) -> Optional[Set[int]]:
+        """IDs whose Name, Phone or Email contain `query`; None when it is too short for trigrams."""
+        forms = self._forms(query)
+        if forms is None:
+            return None
+        with self._lock:
+            found: Set[int] = set()
+            for form in forms:
+                found |= self._contains(form)
+            return found
+
+    def page(self, query: str, limit: int, after_id: Optional[int] = None,
+             before_id: Optional[int] = None) -> Optional[List[int]]:
+        """
+        Matching IDs for one keyset page, newest first, exactly as
+        keyset_slice(matches(query), ...) would give; None when too short for trigrams.
+        """
+        forms = self._forms(query)
+        if forms is None:
+            return None
+        with self._lock:
+            if self._worth_scanning(sum(self._estimate(f) for f in forms), limit):
+                docs = self._docs
+                test = lambda i: any(form in field for form in forms for field in docs[i])
+                return self._walk(test, limit, after_id, before_id)
+            return keyset_slice(self.matches(query), limit, after_id, before_id)
+
+    def search(self, query: str, limit: int = 20) -> List[int]:
+        """Up to `limit` IDs, best match first (see the class docstring for the order)."""
+        text, digits = _query_forms(query)
+        if not text or limit <= 0:
+            return []
+        with self._lock:
+            result: List[int] = []
+            seen: Set[int] = set()
+            tiers = [(NAME, text, False), (PHONE, digits, False), (EMAIL, text, False),
+                     (NAME, text, True), (PHONE, digits, True), (WORD, text, True), (EMAIL, text, True)]
+            for kind, key, prefix in tiers:
+                if not key:
+                    continue
+                lo, hi = self._keys[kind].bounds(key, prefix)
+                self._fill(result, seen, limit, hi - lo, _tier_test(kind, key, prefix),
+                           lambda: self._keys[kind].ids(lo, hi))
+                if len(result) >= limit:
+                    return result
+            if self._forms(query) is not None:
+                for field, form in ((NAME, text), (PHONE, digits), (EMAIL, text)):
+                    if len(form) < 3:
+                        continue
+                    self._fill(result, seen, limit, self._estimate(form), lambda d: form in d[field],
+                               lambda: self._contains(form))
+                    if len(result) >= limit:
+                        break
+            return result
+
+    def _fill(self, result: List[int], seen: Set[int], limit: int, estimate: int,
+              test: Callable[[Doc], bool], collect: Callable[[], Set[int]]) -> None:
+        need = limit - len(result)
+        docs = self._docs
+        if self._worth_scanning(estimate, need):
+            fresh = self._walk(lambda i: i not in seen and test(docs[i]), need)
+        else:
+            fresh = heapq.nlargest(need, (i for i in collect() if i not in seen and test(docs[i])))
+        result.extend(fresh)
+        seen.update(fresh)
+
+    def _worth_scanning(self, matches: int, need: int) -> bool:
+        # Walking newest-first touches about need * N / matches IDs; collecting touches `matches`.
+        return matches * matches > need * len(self._order)
+
+    def _walk(self, test: Callable[[int], bool], limit: int,
+              after_id: Optional[int] = None, before_id: Optional[int] = None) -> List[int]:
+        order = self._order
+        out: List[int] = []
+        if before_id is not None:
+            for pos in range(bisect_right(order, before_id), len(order)):
+                if test(order[pos]):
+                    out.append(order[pos])
+                    if len(out) >= limit:
+                        break
+            return out[::-1]
+        start = bisect_left(order, after_id) if after_id is not None else len(order)
+        for pos in range(start - 1, -1, -1):
+            if test(order[pos]):
+                out.append(order[pos])
+                if len(out) >= limit:
+                    break
+        return out
+
+    def _forms(self, query: str) -> Optional[List[str]]:
+        text, digits = _query_forms(query)
+        forms = [f for f in {text, digits} if len(f) >= 3]
+        return forms or None
+
+    def _estimate(self, form: str) -> int:
+        # Upper bound on matches: the rarest trigram's posting size.
+        return min((len(self._grams.get(g, ())) for g in _grams(form)), default=0)
+
+    def _add_doc(self, c: Customer) -> Doc:
+        doc = (c.Name.lower(), _NON_DIGITS.sub("", c.Phone or ""), (c.Email or "").lower())
+        self._docs[c.CustomerID] = doc
+        for gram in _grams(doc[0]) | _grams(doc[1]) | _grams(doc[2]):
+            self._grams.setdefault(gram, set()).add(c.CustomerID)
+        return doc
+
+    @staticmethod
+    def _doc_keys(doc: Doc) -> List[Tuple[int, str]]:
+        keys = [(NAME, doc[NAME]), (PHONE, doc[PHONE]), (EMAIL, doc[EMAIL])]
+        keys += [(WORD, w) for w in set(doc[NAME].split()[1:])]  # the first word is already a Name prefix
+        return [(kind, key) for kind, key in keys if key]
+
+    def _remove(self, customer_id: int) -> None:
+        doc = self._docs.pop(customer_id, None)
+        if doc is None:
+            return
+        for gram in _grams(doc[0]) | _grams(doc[1]) | _grams(doc[2]):
+            ids = self._grams.get(gram)
+            if ids is not None:
+                ids.discard(customer_id)
+                if not ids:
+                    del self._grams[gram]
+        for kind, key in self._doc_keys(doc):
+            self._keys[kind].remove(key, customer_id)
+        pos = bisect_left(self._order, customer_id)
+        if pos < len(self._order) and self._order[pos] == customer_id:
+            del self._order[pos]
+
+    def _contains(self, form: str) -> Set[int]:
+        postings = sorted((self._grams.get(g, set()) for g in _grams(form)), key=len)
+        if not postings or not postings[0]:
+            return set()
+        if len(postings) == 1:
+            return set(postings[0])  # a single trigram is an exact match
+        result = set(postings[0])
+        for ids in postings[1:]:
+            result &= ids
+            if not result:
+                return result
+        # Sharing every trigram does not guarantee a contiguous match.
+        docs = self._docs
+        return {i for i in result if form in docs[i][0] or form in docs[i][1] or form in docs[i][2]}
+
+
+@process_wide
+def shared_customer_index() -> CustomerSearchIndex:
+    return CustomerSearchIndex()
@@ -1,8 +1,12 @@
 # app/services/service.py
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
-from app.config import VALID_STATUSES, SERVICE_TYPES
+from app.config import VALID_STATUSES, SERVICE_TYPES, STREAM_BATCH_SIZE, CUSTOMER_SEARCH_INDEX
 from app.model.customer import Customer
+from app.model.page import Page, make_page
+from app.services.customerSearchIndex import shared_customer_index
+from app.services.dimensionCache import shared_dimension_cache
+from app.services.queryCache import cached, invalidates
 
 
 from app.model.CURDoperations import CustomerRepository, TechnicianRepository, ServiceOrderRepository
@@ -12,25 +16,96 @@ class CustomerServiceManager:
         self.customers = CustomerRepository()
         self.techs = TechnicianRepository()
         self.orders = ServiceOrderRepository()
+        self.search_index = shared_customer_index() if CUSTOMER_SEARCH_INDEX else None
+        self.dimensions = shared_dimension_cache()
 
     # Customers
+    @invalidates("customers")
     def create_customer(self, name: str, phone: str, email: Optional[str], address: Optional[str]) -> int:
+        c = self.build_customer(name, phone, email, address)
+        c.CustomerID = self.customers.create(c)
+        self._index(c)
+        return c.CustomerID
+
+    @invalidates("customers")
+    def create_customers(self, customers: List[dict]) -> List[int]:
+        """Create many customers in one transaction; each dict holds create_customer's arguments. Returns IDs in order."""
+        built = [self.build_customer(**c) for c in customers]
+        ids = self.customers.create_many(built)
+        for c, new_id in zip(built, ids):
+            c.CustomerID = new_id
+            self._index(c)
+        return ids
+
+    @staticmethod
+    def build_customer(name: str, phone: str, email: Optional[str], address: Optional[str]) -> Customer:
+        """Validate and normalise input for a new customer (shared with bulk import)."""
         if not name or not phone:
             raise ValueError("Name and phone are required")
-        c = Customer(CustomerID=None, Name=name.strip(), Phone=phone.strip(),
-                     Email=(email.strip() if email else None),
-                     Address=(address.strip() if address else None))
-        return self.customers.create(c)
+        return Customer(CustomerID=None, Name=name.strip(), Phone=phone.strip(),
+                        Email=(email.strip() if email else None),
+                        Address=(address.strip() if address else None))
+
+    @cached("customers")
+    def list_customers(self, search: Optional[str] = None, limit: int = 100,
+                       after_id: Optional[int] = None, before_id: Optional[int] = None) -> List[Customer]:
+        ids = self._search_page(search, limit, after_id, before_id)
+        if ids is None:
+            return self.customers.list(search=search, limit=limit, after_id=after_id, before_id=before_id)
+        return self.customers.get_many(ids)
+
+    @cached("customers")
+    def list_customers_page(self, search: Optional[str] = None, limit: int = 100,
+                            after_id: Optional[int] = None, before_id: Optional[int] = None) -> Page:
+        ids = self._search_page(search, limit + 1, after_id, before_id)
+        if ids is None:
+            return self.customers.list_page(search=search, limit=limit, after_id=after_id, before_id=before_id)
+        if before_id is not None and len(ids) <= limit:
+            return self.list_customers_page(search=search, limit=limit)
+        return make_page(self.customers.get_many(ids), limit, lambda c: c.CustomerID, after_id, before_id)
 
-    def list_customers(self, search: Optional[str] = None, limit: int = 100) -> List[Customer]:
-        return self.customers.list(search=search, limit=limit)
+    @cached("customers")
+    def search_customers(self, query: str, limit: int = 20) -> List[Customer]:
+        """Customers ranked by how well Name, Phone or Email match `query` (best first)."""
+        if self.search_index is None:
+            return self.customers.list(search=query, limit=limit)
+        self._refresh_index()
+        return self.customers.get_many(self.search_index.search(query, limit))
 
+    def _search_page(self, search: Optional[str], limit: int, after_id: Optional[int],
+                     before_id: Optional[int]) -> Optional[List[int]]:
+        # Terms under three characters have no trigrams; the database handles those.
+        if not search or self.search_index is None:
+            return None
+        self._refresh_index()
+        return self.search_index.page(search, limit, after_id, before_id)
+
+    def _refresh_index(self) -> None:
+        self.search_index.ensure_built(lambda: self.customers.iter(batch_size=5000))
+        self.search_index.top_up(lambda after: self.customers.iter_newer(after, batch_size=5000))
+
+    def _index(self, customer: Customer) -> None:
+        if self.search_index is not None and self.search_index.built:
+            self.search_index.add(customer)
+
+    def iter_customers(self, search: Optional[str] = None, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Customer]:
+        """Stream every matching customer; close the generator (or use contextlib.closing) to stop early."""
+        return self.customers.iter(search=search, batch_size=batch_size)
+
+    @invalidates("customers")
     def update_customer(self, customer_id: int, name: str, phone: str, email: Optional[str], address: Optional[str]) -> None:
         c = Customer(CustomerID=customer_id, Name=name.strip(), Phone=phone.strip(),
                      Email=(email.strip() if email else None),
                      Address=(address.strip() if address else None))
         self.customers.update(c)
+        self._index(c)
+        self.dimensions.forget_customer(customer_id)
 
+    @invalidates("customers")
     def delete_customer(self, customer_id: int) -> None:
         self.customers.delete(customer_id)
+        self.dimensions.forget_customer(customer_id)
+        if self.search_index is not None:
+            self.search_index.remove(customer_id)
+
 
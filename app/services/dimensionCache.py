@@ -0,0 +1,127 @@
+# app/services/dimensionCache.py
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.config import DIMENSION_CACHE_MAX_ENTRIES, DIMENSION_CACHE_TTL
+from app.model.CURDoperations import CustomerRepository, TechnicianRepository
+from app.model.serviceorder import ServiceOrder, ServiceOrderDetail
+from app.services.processWide import process_wide
+
+_ORDER_FIELDS = tuple(f.name for f in fields(ServiceOrder))
+
+
+class _Dimension:
+    """ID -> display tuple, least recently used dropped first, each entry good for `ttl` seconds."""
+
+    def __init__(self, load: Callable[[List[int]], Dict[int, tuple]], max_entries: int, ttl: float):
+        self.load = load
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, tuple]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, key: int, value: tuple, now: float) -> None:
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def lookup(self, keys: Iterable[int], now: float) -> Tuple[Dict[int, tuple], List[int]]:
+        found, missing = {}, []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                found[key] = entry[1]
+                self.hits += 1
+            else:
+                missing.append(key)
+                self.misses += 1
+        return found, missing
+
+    def forget(self, key: Optional[int] = None) -> None:
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+class DimensionCache:
+    """
+    Customer (Name, Phone) and technician (Name, SkillLevel) by ID, for
+    putting names next to orders without a lookup per row. Joined listings
+    feed it for free through remember(). decorate() turns plain ServiceOrders
+    (e.g. from order_changes) into ServiceOrderDetails, with at most one
+    batched query per dimension for IDs it has not seen. Entries expire after
+    `ttl` seconds so renames made at other desks show up. The service managers
+    call forget_customer() after their own updates and deletes.
+    """
+
+    def __init__(self, max_entries: int = DIMENSION_CACHE_MAX_ENTRIES, ttl: float = DIMENSION_CACHE_TTL):
+        customers, techs = CustomerRepository(), TechnicianRepository()
+        self._lock = threading.Lock()
+        self.customers = _Dimension(
+            lambda ids: {c.CustomerID: (c.Name, c.Phone) for c in customers.get_many(ids)}, max_entries, ttl)
+        self.technicians = _Dimension(
+            lambda ids: {t.TechnicianID: (t.Name, t.SkillLevel) for t in techs.get_many(ids)}, max_entries, ttl)
+
+    def remember(self, details: Iterable[ServiceOrderDetail]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for d in details:
+                self.customers.put(d.CustomerID, (d.CustomerName, d.CustomerPhone), now)
+                if d.TechnicianID is not None:
+                    self.technicians.put(d.TechnicianID, (d.TechnicianName, d.TechnicianSkillLevel), now)
+
+    def _resolve(self, dim: _Dimension, keys: set) -> Dict[int, tuple]:
+        now = time.monotonic()
+        with self._lock:
+            found, missing = dim.lookup(keys, now)
+            generation = dim._generation
+        if missing:
+            loaded = dim.load(missing)  # outside the lock: a query per call, never per row
+            found.update(loaded)
+            with self._lock:
+                # A rename that landed while loading may have been read before it committed; don't keep it.
+                if generation == dim._generation:
+                    for key, value in loaded.items():
+                        dim.put(key, value, now)
+        return found
+
+    def decorate(self, orders: Iterable[ServiceOrder]) -> List[ServiceOrderDetail]:
+        orders = list(orders)
+        customers = self._resolve(self.customers, {o.CustomerID for o in orders})
+        technicians = self._resolve(self.technicians, {o.TechnicianID for o in orders if o.TechnicianID is not None})
+        details = []
+        for o in orders:
+            if isinstance(o, ServiceOrderDetail):
+                details.append(o)
+                continue
+            customer = customers.get(o.CustomerID, (None, None))
+            tech = technicians.get(o.TechnicianID, (None, None)) if o.TechnicianID is not None else (None, None)
+            details.append(ServiceOrderDetail(*(getattr(o, f) for f in _ORDER_FIELDS), *customer, *tech))
+        return details
+
+    def forget_customer(self, customer_id: Optional[int] = None) -> None:
+        with self._lock:
+            self.customers.forget(customer_id)
+
+    def forget_technician(self, technician_id: Optional[int] = None) -> None:
+        with self._lock:
+            self.technicians.forget(technician_id)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: {"entries": len(dim._entries), "hits": dim.hits, "misses": dim.misses}
+                    for name, dim in (("customers", self.customers), ("technicians", self.technicians))}
+
+
+@process_wide
+def shared_dimension_cache() -> DimensionCache:
+    return DimensionCache()
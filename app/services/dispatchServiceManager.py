@@ -0,0 +1,184 @@
+# app/services/dispatchServiceManager.py
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+from app.config import (
+    SKILL_LEVELS, SERVICE_SKILL_REQUIREMENTS, DEFAULT_JOB_DURATION_MINUTES, DISPATCH_MAX_OPEN_ORDERS,
+)
+from app.model.CURDoperations import TechnicianRepository, ServiceOrderRepository
+from app.model.serviceorder import ServiceOrder
+from app.model.technician import Technician
+from app.services.queryCache import invalidates
+from app.services.technicianSchedule import Booking, TechnicianSchedule, shared_schedule_index
+from app.services.orderCounters import shared_order_counters
+
+dispatch_log = logging.getLogger("acservicedesk.dispatch")
+
+MAX_CANDIDATES = 64  # conflicting technicians tried per order before giving up on it
+
+NO_SKILL = "no active technician with the required skill"
+NO_CAPACITY = "every qualified technician is at capacity or booked at that time"
+CHANGED = "order was assigned or changed by someone else meanwhile"
+
+
+@dataclass
+class DispatchPlan:
+    assignments: List[Tuple[int, int]] = field(default_factory=list)  # (OrderID, TechnicianID), by priority
+    unassigned: Dict[int, str] = field(default_factory=dict)  # OrderID -> reason
+    applied: List[int] = field(default_factory=list)  # OrderIDs actually assigned when applied
+    plan_seconds: float = 0.0
+    apply_seconds: float = 0.0
+
+
+def skill_rank(level: str) -> int:
+    """Position in SKILL_LEVELS; unknown levels rank lowest."""
+    try:
+        return SKILL_LEVELS.index(level)
+    except ValueError:
+        return -1
+
+
+def required_rank(service_type: str) -> int:
+    return skill_rank(SERVICE_SKILL_REQUIREMENTS.get(service_type, SKILL_LEVELS[0]))
+
+
+def _priority(order: ServiceOrder) -> tuple:
+    # Scheduled jobs first, soonest first; then unscheduled ones oldest first.
+    scheduled = order.ScheduledAt
+    return (scheduled is None, scheduled or datetime.min, order.CreatedAt or datetime.min, order.OrderID)
+
+
+def plan_dispatch(orders: Iterable[ServiceOrder], technicians: Iterable[Technician],
+                  open_assignments: Iterable[Booking] = (),
+                  max_open: int = DISPATCH_MAX_OPEN_ORDERS,
+                  duration_minutes: int = DEFAULT_JOB_DURATION_MINUTES) -> DispatchPlan:
+    """
+    Greedy least-loaded matching. Orders are taken from a priority queue
+    (scheduled soonest, then oldest). Each goes to the eligible technician
+    (skill at or above the service type's minimum, under `max_open` open
+    orders, free at ScheduledAt) with the lowest load. Ties go to the least
+    over-qualified technician, then the lowest ID.
+
+    Technicians sit in one heap per skill level keyed by (load, ID). An order
+    looks only at the heap tops of the levels it may use, so a run costs
+    O(orders x levels x log technicians), plus whatever technicians are
+    skipped for being booked at that time.
+    """
+    started = time.perf_counter()
+    plan = DispatchPlan()
+    duration = timedelta(minutes=duration_minutes)
+
+    techs, unknown = [], []
+    for t in technicians:
+        if t.Active:
+            (techs if skill_rank(t.SkillLevel) >= 0 else unknown).append(t)
+    if unknown:
+        dispatch_log.warning("Skipping technicians with a SkillLevel not in %s: %s", SKILL_LEVELS,
+                             ", ".join(f"{t.TechnicianID} ({t.SkillLevel!r})" for t in unknown))
+    load: Dict[int, int] = {t.TechnicianID: 0 for t in techs}
+    schedules: Dict[int, TechnicianSchedule] = {t.TechnicianID: TechnicianSchedule(duration) for t in techs}
+    for order_id, tech_id, scheduled_at in open_assignments:
+        if tech_id in load:
+            load[tech_id] += 1
+            if scheduled_at is not None:
+                schedules[tech_id].add(scheduled_at, order_id)
+
+    heaps: List[List[Tuple[int, int]]] = [[] for _ in SKILL_LEVELS]
+    for t in techs:
+        if load[t.TechnicianID] < max_open:
+            heaps[skill_rank(t.SkillLevel)].append((load[t.TechnicianID], t.TechnicianID))
+    for h in heaps:
+        heapq.heapify(h)
+    staffed = {skill_rank(t.SkillLevel) for t in techs}  # at capacity still counts: NO_CAPACITY, not NO_SKILL
+
+    queue = [(_priority(o), o) for o in orders]
+    heapq.heapify(queue)
+    while queue:
+        _, order = heapq.heappop(queue)
+        need = required_rank(order.ServiceType)
+        if not any(rank in staffed for rank in range(need, len(SKILL_LEVELS))):
+            plan.unassigned[order.OrderID] = NO_SKILL
+            continue
+        skipped: List[Tuple[int, int, int]] = []  # (rank, load, id) popped because of a time clash
+        chosen = None
+        while len(skipped) < MAX_CANDIDATES:
+            best = None
+            for rank in range(need, len(SKILL_LEVELS)):
+                h = heaps[rank]
+                while h and h[0][0] != load[h[0][1]]:
+                    heapq.heappop(h)  # stale entry; the technician's load changed since it was pushed
+                if h and (best is None or (h[0][0], rank - need, h[0][1]) < best[0]):
+                    best = ((h[0][0], rank - need, h[0][1]), rank)
+            if best is None:
+                break
+            (tech_load, _, tech_id), rank = best
+            heapq.heappop(heaps[rank])
+            if order.ScheduledAt is not None and schedules[tech_id].overlapping(order.ScheduledAt,
+                                                                                 order.ScheduledAt + duration):
+                skipped.append((rank, tech_load, tech_id))
+                continue
+            chosen = (rank, tech_id)
+            break
+        for rank, tech_load, tech_id in skipped:
+            heapq.heappush(heaps[rank], (tech_load, tech_id))
+        if chosen is None:
+            plan.unassigned[order.OrderID] = NO_CAPACITY
+            continue
+        rank, tech_id = chosen
+        load[tech_id] += 1
+        if order.ScheduledAt is not None:
+            schedules[tech_id].add(order.ScheduledAt, order.OrderID)
+        if load[tech_id] < max_open:
+            heapq.heappush(heaps[rank], (load[tech_id], tech_id))
+        plan.assignments.append((order.OrderID, tech_id))
+
+    plan.plan_seconds = time.perf_counter() - started
+    return plan
+
+
+class DispatchServiceManager:
+    """
+    Assigns Pending orders to active technicians automatically. It reads the
+    pending orders, active technicians and open assignments (three queries),
+    plans in memory with plan_dispatch(), and applies every assignment in one
+    transaction with ServiceOrderRepository.assign_many().
+    """
+
+    def __init__(self):
+        self.orders = ServiceOrderRepository()
+        self.techs = TechnicianRepository()
+        self.schedule = shared_schedule_index()
+        self.counters = shared_order_counters()
+
+    def plan(self) -> DispatchPlan:
+        # A Pending order that already names a technician is not ours to place; assign_many would skip it.
+        pending = self.orders.iter(status="Pending", with_description=False)
+        return plan_dispatch(
+            (o for o in pending if o.TechnicianID is None),
+            self.techs.iter(active_only=True),
+            self.orders.open_assignments(),
+        )
+
+    @invalidates("orders")
+    def dispatch(self, apply: bool = True) -> DispatchPlan:
+        """Plan and (unless apply=False) apply; orders changed meanwhile are reported, not forced."""
+        plan = self.plan()
+        if apply and plan.assignments:
+            started = time.perf_counter()
+            changed = self.orders.assign_many(plan.assignments, pending_only=True)
+            plan.apply_seconds = time.perf_counter() - started
+            plan.applied = [o.OrderID for o in changed]
+            targets = dict(plan.assignments)
+            for order in changed:
+                tech_id = targets[order.OrderID]
+                self.counters.apply(order, replace(order, TechnicianID=tech_id, Status="Assigned"))
+                self.schedule.place(order.OrderID, tech_id, order.ScheduledAt)
+            applied = set(plan.applied)
+            for order_id, _ in plan.assignments:
+                if order_id not in applied:
+                    plan.unassigned[order_id] = CHANGED
+        return plan
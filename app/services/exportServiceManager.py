@@ -0,0 +1,197 @@
+# app/services/exportServiceManager.py
+import argparse
+import csv
+import gzip
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.config import STREAM_BATCH_SIZE
+from app.model.CURDoperations import ServiceOrderRepository, ORDER_COLUMNS
+from app.model.dbconnection import engine_spec, set_engine
+from app.model.engine import create_engine
+
+EXPORT_FORMATS = ["csv", "jsonl"]
+PARTITIONS = ["month", "week", "day"]
+
+ORDER_FIELDS = [c.strip() for c in ORDER_COLUMNS.split(",")]
+NAME_FIELDS = ["CustomerName", "TechnicianName"]
+
+
+def _partition_start(ts: datetime, partition: str) -> datetime:
+    day = datetime(ts.year, ts.month, ts.day)
+    if partition == "month":
+        return day.replace(day=1)
+    if partition == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _next_start(start: datetime, partition: str) -> datetime:
+    if partition == "month":
+        return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    return start + timedelta(days=7 if partition == "week" else 1)
+
+
+def plan_partitions(first: datetime, last: datetime, partition: str = "month",
+                    created_from: Optional[datetime] = None,
+                    created_to: Optional[datetime] = None) -> List[Tuple[datetime, datetime]]:
+    """Half-open CreatedAt ranges covering [first, last], clipped to the requested window."""
+    if partition not in PARTITIONS:
+        raise ValueError(f"Invalid partition. Allowed: {PARTITIONS}")
+    ranges = []
+    start = _partition_start(first, partition)
+    while start <= last:
+        end = _next_start(start, partition)
+        ranges.append((max(start, created_from) if created_from else start,
+                       min(end, created_to) if created_to else end))
+        start = end
+    return ranges
+
+
+def _label(start: datetime, partition: str) -> str:
+    return start.strftime("%Y-%m" if partition == "month" else "%Y-%m-%d")
+
+
+def _cell(value):
+    return value.isoformat(sep=" ") if isinstance(value, datetime) else value
+
+
+def _init_worker(spec: Tuple[str, Optional[str]]) -> None:
+    # Spawned workers start from config defaults; use whatever engine the parent runs on.
+    set_engine(create_engine(*spec))
+
+
+def export_partition(job: Dict) -> Dict:
+    """
+    Write one CreatedAt range to its own file and return its manifest entry.
+    Runs inside a worker process, so it only takes and returns plain data.
+    """
+    started = time.perf_counter()
+    start, end = job["start"], job["end"]
+    fields = ORDER_FIELDS + (NAME_FIELDS if job["with_names"] else [])
+    path = job["path"]
+    tmp = path + ".part"
+    opener = gzip.open if job["compress"] else open
+    rows = 0
+    stream = ServiceOrderRepository().iter_export(start, end, job["with_names"], job["batch_size"], as_dicts=False)
+    try:
+        with opener(tmp, "wt", encoding="utf-8", newline="") as f:
+            if job["format"] == "csv":
+                writer = csv.writer(f)
+                writer.writerow(fields)
+                for rec in stream:
+                    writer.writerow([_cell(v) for v in rec])
+                    rows += 1
+            else:
+                for rec in stream:
+                    f.write(json.dumps(dict(zip(fields, map(_cell, rec))), ensure_ascii=False))
+                    f.write("\n")
+                    rows += 1
+    finally:
+        stream.close()
+    os.replace(tmp, path)
+    return {
+        "file": os.path.basename(path),
+        "created_from": start.isoformat(sep=" "),
+        "created_to": end.isoformat(sep=" "),
+        "rows": rows,
+        "bytes": os.path.getsize(path),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+class ExportServiceManager:
+    """
+    Exports ServiceOrders to CSV or JSONL files, optionally gzipped, with one file
+    per CreatedAt partition (month, week or day). Each partition is streamed in
+    constant memory by a worker process with its own connection pool. A
+    manifest.json records per-file row counts and timings.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = STREAM_BATCH_SIZE):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.batch_size = batch_size
+        self.orders = ServiceOrderRepository()
+
+    def export_orders(self, out_dir: str, created_from: Optional[datetime] = None,
+                      created_to: Optional[datetime] = None, fmt: str = "csv", compress: bool = False,
+                      with_names: bool = True, partition: str = "month") -> Dict:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Invalid format. Allowed: {EXPORT_FORMATS}")
+        started_at = datetime.now()
+        started = time.perf_counter()
+        os.makedirs(out_dir, exist_ok=True)
+
+        first, last = self.orders.created_bounds(created_from, created_to)
+        ranges = plan_partitions(first, last, partition, created_from, created_to) if first else []
+        suffix = f".{fmt}" + (".gz" if compress else "")
+        spec = engine_spec()
+        jobs = [
+            {
+                "start": start, "end": end, "format": fmt, "compress": compress, "with_names": with_names,
+                "batch_size": self.batch_size,
+                "path": os.path.join(out_dir, f"orders_{_label(start, partition)}{suffix}"),
+            }
+            for start, end in ranges
+        ]
+
+        # An in-memory SQLite database only exists in this process.
+        in_memory = spec[0] == "sqlite" and spec[1] == ":memory:"
+        if self.workers <= 1 or len(jobs) <= 1 or in_memory:
+            parts = [export_partition(job) for job in jobs]
+        else:
+            # spawn, not fork: a forked worker would inherit the pool's threads and the parent's connections.
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)),
+                                     mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_worker, initargs=(spec,)) as pool:
+                parts = list(pool.map(export_partition, jobs))
+
+        elapsed = time.perf_counter() - started
+        total = sum(p["rows"] for p in parts)
+        manifest = {
+            "table": "ServiceOrders",
+            "format": fmt,
+            "compressed": compress,
+            "with_names": with_names,
+            "partition": partition,
+            "created_from": created_from.isoformat(sep=" ") if created_from else None,
+            "created_to": created_to.isoformat(sep=" ") if created_to else None,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "seconds": round(elapsed, 3),
+            "workers": 1 if in_memory else min(self.workers, max(len(jobs), 1)),
+            "rows": total,
+            "rows_per_sec": round(total / elapsed) if elapsed else 0,
+            "partitions": parts,
+        }
+        with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export service orders in CreatedAt partitions.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--from", dest="created_from", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--to", dest="created_to", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--partition", choices=PARTITIONS, default="month")
+    parser.add_argument("--no-names", action="store_true", help="skip the customer/technician name join")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    manifest = ExportServiceManager(workers=args.workers).export_orders(
+        args.out_dir, args.created_from, args.created_to, fmt=args.format, compress=args.gzip,
+        with_names=not args.no_names, partition=args.partition,
+    )
+    print(f"Exported {manifest['rows']} orders in {len(manifest['partitions'])} files "
+          f"in {manifest['seconds']}s ({manifest['rows_per_sec']} rows/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+# app/services/importServiceManager.py
+import argparse
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.config import IMPORT_CHUNK_SIZE
+from app.model.CURDoperations import CustomerRepository, TechnicianRepository, ServiceOrderRepository
+from app.model.dbconnection import get_engine
+from app.services.customerServiceManager import CustomerServiceManager
+from app.services.technicianServiceManager import TechnicianServiceManager
+from app.services.serviceorderServiceManager import ServiceorderServiceManager
+from app.services.queryCache import invalidate_cache
+from app.services.orderCounters import shared_order_counters
+from app.services.customerSearchIndex import shared_customer_index
+
+
+@dataclass
+class RowError:
+    line: int
+    message: str
+    record: Dict[str, str]
+
+
+@dataclass
+class ImportReport:
+    entity: str
+    source: str
+    rows_read: int = 0
+    rows_imported: int = 0
+    ids: List[int] = field(default_factory=list)
+    errors: List[RowError] = field(default_factory=list)
+    resumed_after_line: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_imported / self.elapsed if self.elapsed else 0.0
+
+
+def _key(name: str) -> str:
+    # "CustomerID", "customer_id" and "Customer Id" all mean the same column.
+    return name.replace("_", "").replace(" ", "").lower()
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Tuple[int, Dict[str, str], Optional[str]]]:
+    """
+    Stream (line number, record, parse error) from a CSV or JSONL file without
+    loading it whole. Record keys are normalised with _key().
+    """
+    fmt = fmt or ("jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv")
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {_key(k): v for k, v in row.items() if k is not None}, None
+        elif fmt == "jsonl":
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    obj = json.loads(line)
+                except ValueError as e:
+                    yield line_no, {"raw": line.rstrip("\n")}, f"Invalid JSON: {e}"
+                    continue
+                if not isinstance(obj, dict):
+                    yield line_no, {"raw": line.rstrip("\n")}, "Expected a JSON object"
+                    continue
+                yield line_no, {_key(k): v for k, v in obj.items()}, None
+        else:
+            raise ValueError("Invalid format. Allowed: ['csv', 'jsonl']")
+
+
+def _text(rec: Dict, name: str) -> Optional[str]:
+    value = rec.get(name)
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+def _parse_bool(value, default: bool = True) -> bool:
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "yes", "y"):
+        return True
+    if text in ("0", "false", "no", "n"):
+        return False
+    raise ValueError(f"Invalid boolean {value!r}")
+
+
+def _parse_dt(value) -> Optional[datetime]:
+    text = _text({"v": value}, "v")
+    return datetime.fromisoformat(text.strip()) if text else None
+
+
+def _build_customer(rec: Dict):
+    return CustomerServiceManager.build_customer(
+        _text(rec, "name"), _text(rec, "phone"), _text(rec, "email"), _text(rec, "address")
+    )
+
+
+def _build_technician(rec: Dict):
+    return TechnicianServiceManager.build_technician(
+        _text(rec, "name"), _text(rec, "phone"), _text(rec, "skilllevel"), _parse_bool(rec.get("active"))
+    )
+
+
+def _build_order(rec: Dict):
+    customer_id = _text(rec, "customerid")
+    if customer_id is None:
+        raise ValueError("CustomerID is required")
+    return ServiceorderServiceManager.build_order(
+        int(customer_id), _text(rec, "servicetype"), _text(rec, "description"), _parse_dt(rec.get("scheduledat"))
+    )
+
+
+class ImportServiceManager:
+    """
+    Bulk loader for franchise onboarding. Records are streamed from CSV/JSONL,
+    validated with the same rules as the service managers, and inserted
+    `chunk_size` rows per transaction with one executemany() each. A chunk
+    the database rejects is retried row by row so only the bad rows fail.
+    After every committed chunk a checkpoint records the last source line, and
+    a re-run with the same checkpoint picks up after it.
+    """
+
+    def __init__(self, chunk_size: int = IMPORT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self.entities = {
+            "customers": (_build_customer, CustomerRepository()),
+            "technicians": (_build_technician, TechnicianRepository()),
+            "orders": (_build_order, ServiceOrderRepository()),
+        }
+
+    def import_file(self, entity: str, path: str, fmt: Optional[str] = None,
+                    checkpoint_path: Optional[str] = None, resume: bool = True,
+                    progress: Optional[Callable[[ImportReport], None]] = None) -> ImportReport:
+        if entity not in self.entities:
+            raise ValueError(f"Invalid entity. Allowed: {list(self.entities)}")
+        build, repo = self.entities[entity]
+        source = os.path.abspath(path)
+        report = ImportReport(entity=entity, source=source)
+        if checkpoint_path and resume:
+            report.resumed_after_line = self._load_checkpoint(checkpoint_path, entity, source)
+
+        started = time.perf_counter()
+        chunk: List[Tuple[int, object, Dict]] = []
+        last_line = report.resumed_after_line
+
+        def row_committed(line: int) -> None:
+            self._checkpoint(checkpoint_path, report, line, started, None)
+
+        for line, record, error in read_records(path, fmt):
+            if line <= report.resumed_after_line:
+                continue
+            report.rows_read += 1
+            last_line = line
+            if error:
+                report.errors.append(RowError(line, error, record))
+                continue
+            try:
+                chunk.append((line, build(record), record))
+            except (ValueError, TypeError) as e:
+                report.errors.append(RowError(line, str(e), record))
+                continue
+            if len(chunk) >= self.chunk_size:
+                self._flush(repo, chunk, report, row_committed)
+                chunk = []
+                self._checkpoint(checkpoint_path, report, last_line, started, progress)
+        if chunk:
+            self._flush(repo, chunk, report, row_committed)
+        self._checkpoint(checkpoint_path, report, last_line, started, progress)
+        return report
+
+    def _flush(self, repo, chunk: List[Tuple[int, object, Dict]], report: ImportReport,
+               row_committed: Callable[[int], None]) -> None:
+        errors = get_engine().errors
+        try:
+            ids = repo.bulk_insert([item for _, item, _ in chunk])
+            report.ids.extend(ids)
+            report.rows_imported += len(ids)
+        except errors:
+            # Isolate the offending rows (e.g. an unknown CustomerID) and keep the rest. Each row
+            # commits on its own, so the checkpoint follows it and a resume won't insert it again.
+            ids = []
+            for line, item, record in chunk:
+                try:
+                    new_id = repo.create(item)
+                except errors as e:
+                    report.errors.append(RowError(line, str(e), record))
+                    continue
+                ids.append(new_id)
+                report.ids.append(new_id)
+                report.rows_imported += 1
+                row_committed(line)
+        if ids:
+            invalidate_cache(report.entity)
+            if report.entity == "orders":
+                shared_order_counters().invalidate()
+            elif report.entity == "customers":
+                shared_customer_index().invalidate()  # rebuilt in one pass on the next search
+
+    def _checkpoint(self, checkpoint_path: Optional[str], report: ImportReport, last_line: int,
+                    started: float, progress: Optional[Callable[[ImportReport], None]]) -> None:
+        report.elapsed = time.perf_counter() - started
+        if checkpoint_path:
+            state = {
+                "entity": report.entity,
+                "source": report.source,
+                "line": last_line,
+                "rows_imported": report.rows_imported,
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            tmp = checkpoint_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, checkpoint_path)
+        if progress:
+            progress(report)
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: str, entity: str, source: str) -> int:
+        try:
+            with open(checkpoint_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return 0
+        if state.get("entity") != entity or state.get("source") != source:
+            raise ValueError(f"Checkpoint {checkpoint_path} belongs to {state.get('entity')} from {state.get('source')}")
+        return int(state.get("line", 0))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import customers, technicians or orders from CSV/JSONL.")
+    parser.add_argument("entity", choices=["customers", "technicians", "orders"])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None)
+    parser.add_argument("--checkpoint", help="checkpoint file; an existing one resumes the import")
+    parser.add_argument("--no-resume", action="store_true", help="ignore an existing checkpoint")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--errors", help="write rejected rows to this JSONL file")
+    args = parser.parse_args(argv)
+
+    def show(report: ImportReport):
+        print(f"  {report.rows_imported} imported, {report.rows_failed} failed ({report.rows_per_sec:.0f} rows/sec)")
+
+    report = ImportServiceManager(args.chunk_size).import_file(
+        args.entity, args.path, fmt=args.format, checkpoint_path=args.checkpoint,
+        resume=not args.no_resume, progress=show,
+    )
+    if args.errors and report.errors:
+        with open(args.errors, "w", encoding="utf-8") as f:
+            for err in report.errors:
+                f.write(json.dumps(asdict(err), default=str) + "\n")
+    print(f"Imported {report.rows_imported} of {report.rows_read} {report.entity} in {report.elapsed:.2f}s "
+          f"({report.rows_per_sec:.0f} rows/sec); {report.rows_failed} rejected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# app/services/orderCounters.py
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from app.config import VALID_STATUSES, SERVICE_TYPES, COUNTERS_RECONCILE_SECONDS
+from app.model.serviceorder import ServiceOrder
+from app.services.processWide import process_wide
+
+CountRow = Tuple[str, str, Optional[int], int]  # (Status, ServiceType, TechnicianID, count)
+
+
+class OrderCounters:
+    """
+    Order counts per Status, per ServiceType and per technician (split by
+    Status). They are loaded with one GROUP BY and then kept current through
+    apply(old, new), which the service managers call after each write.
+
+    Other desks' writes are not seen, so reconcile() reloads from the database
+    every `reconcile_every` seconds and records how far the counts had drifted.
+    If a local write lands while a reload is running, the reload could count
+    that write twice, so its result is discarded and the next read retries,
+    just as QueryCache does.
+    """
+
+    def __init__(self, reconcile_every: float = COUNTERS_RECONCILE_SECONDS):
+        self.reconcile_every = reconcile_every
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._status: Counter = Counter()
+        self._type: Counter = Counter()
+        self._technician: Dict[int, Counter] = {}
+        self._generation = 0
+        self._loaded_at: Optional[float] = None
+        self.reconciled_at: Optional[datetime] = None
+        self.last_drift = 0
+        self.applied = 0
+
+    @property
+    def built(self) -> bool:
+        return self._loaded_at is not None
+
+    def apply(self, old: Optional[ServiceOrder], new: Optional[ServiceOrder]) -> None:
+        """Move one order from `old` (None: created) to `new` (None: deleted)."""
+        with self._lock:
+            self._generation += 1
+            if self._loaded_at is None:
+                return
+            if old is not None:
+                self._count(old.Status, old.ServiceType, old.TechnicianID, -1)
+            if new is not None:
+                self._count(new.Status, new.ServiceType, new.TechnicianID, 1)
+            self.applied += 1
+
+    def _count(self, status: str, service_type: str, technician_id: Optional[int], n: int) -> None:
+        self._status[status] += n
+        self._type[service_type] += n
+        if technician_id is not None:
+            per_tech = self._technician.get(technician_id)
+            if per_tech is None:
+                per_tech = self._technician[technician_id] = Counter()
+            per_tech[status] += n
+
+    def invalidate(self) -> None:
+        """Force a reload on the next read (e.g. after a bulk import)."""
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def reconcile(self, load: Callable[[], Iterable[CountRow]]) -> bool:
+        """Reload from `load`; returns False if a local write raced the reload and it was dropped."""
+        with self._reload_lock:
+            with self._lock:
+                generation = self._generation
+            status, service_type, technician = Counter(), Counter(), {}
+            for s, t, tech, n in load():
+                status[s] += n
+                service_type[t] += n
+                if tech is not None:
+                    technician.setdefault(tech, Counter())[s] += n
+            with self._lock:
+                if generation != self._generation and self._loaded_at is not None:
+                    return False
+                if self._loaded_at is not None:
+                    self.last_drift = sum(abs(status[k] - self._status[k]) for k in set(status) | set(self._status))
+                self._status, self._type, self._technician = status, service_type, technician
+                self._loaded_at = time.monotonic()
+                self.reconciled_at = datetime.now()
+                return True
+
+    def ensure_fresh(self, load: Callable[[], Iterable[CountRow]]) -> None:
+        with self._lock:
+            due = self._loaded_at is None or time.monotonic() - self._loaded_at > self.reconcile_every
+        if due:
+            self.reconcile(load)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            by_technician = {
+                tid: {**{s: c[s] for s in VALID_STATUSES if c[s]}, "Total": sum(c.values())}
+                for tid, c in sorted(self._technician.items()) if any(c.values())
+            }
+            return {
+                "by_status": {s: self._status[s] for s in VALID_STATUSES},
+                "by_type": {t: self._type[t] for t in SERVICE_TYPES},
+                "by_technician": by_technician,
+                "total": sum(self._status.values()),
+                "reconciled_at": self.reconciled_at,
+                "last_drift": self.last_drift,
+                "applied": self.applied,
+            }
+
+
+@process_wide
+def shared_order_counters() -> OrderCounters:
+    return OrderCounters()
@@ -0,0 +1,26 @@
+# app/services/processWide.py
+import functools
+import threading
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+
+
+def process_wide(factory: Callable[[], T]) -> Callable[[], T]:
+    """
+    Turn `factory` into an accessor for one lazily created instance per
+    process, so every manager instance reads and keeps current the same
+    in-memory index, cache or counters. The factory runs once, on first use.
+    """
+    lock = threading.Lock()
+    made: List[T] = []
+
+    @functools.wraps(factory)
+    def get() -> T:
+        if not made:
+            with lock:
+                if not made:
+                    made.append(factory())
+        return made[0]
+
+    return get
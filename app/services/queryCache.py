@@ -0,0 +1,152 @@
+# app/services/queryCache.py
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from app.config import CACHE_ENABLED, CACHE_MAX_ENTRIES, CACHE_TTL
+
+
+class QueryCache:
+    """
+    Bounded LRU cache with a per-entry TTL for read results of one entity
+    ("customers", "technicians", "orders"). Writes call invalidate(), which
+    drops everything and bumps a generation counter. A load that started
+    before the invalidation is then not stored, so an in-flight read cannot
+    put a stale result back.
+    """
+
+    def __init__(self, name: str, max_entries: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL,
+                 enabled: bool = CACHE_ENABLED):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return load()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            generation = self._generation
+        value = load()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+_caches: Dict[str, QueryCache] = {}
+_caches_lock = threading.Lock()
+_enabled = CACHE_ENABLED
+
+
+def get_cache(name: str) -> QueryCache:
+    """Process-wide cache for one entity, shared by every manager instance."""
+    cache = _caches.get(name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.setdefault(name, QueryCache(name, enabled=_enabled))
+    return cache
+
+
+def invalidate_cache(*names: str) -> None:
+    for name in names:
+        get_cache(name).invalidate()
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Turn caching on or off at runtime (e.g. while debugging data issues); turning it off also empties it."""
+    global _enabled
+    with _caches_lock:
+        _enabled = enabled
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.enabled = enabled
+        cache.invalidate()
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+def cached(name: str):
+    """
+    Cache a read method's result in the `name` cache, keyed by method name
+    plus its bound arguments, so list_x(True) and list_x(active_only=True)
+    share one entry. Cached results are shared between callers; treat them
+    as read-only.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__qualname__,) + tuple(v for k, v in bound.arguments.items() if k != "self")
+            return get_cache(name).get_or_load(key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def invalidates(*names: str):
+    """Drop the named caches after a write method completes (or fails part way)."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                invalidate_cache(*names)
+        return wrapper
+    return decorator
@@ -1,37 +1,252 @@
-from typing import List, Optional
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Tuple
 from app.model.serviceorder import ServiceOrder
-from app.model.CURDoperations import ServiceOrderRepository
+from app.model.page import Page
+from app.model.changes import ChangeWatermark, OrderChanges
+from app.model.CURDoperations import ServiceOrderRepository, TechnicianRepository
+from app.services.queryCache import cached, invalidates
+from app.services.technicianSchedule import TechnicianSchedule, shared_schedule_index
+from app.services.orderCounters import shared_order_counters
+from app.services.dimensionCache import shared_dimension_cache
 from datetime import datetime
-from app.config import VALID_STATUSES, SERVICE_TYPES
+from app.config import VALID_STATUSES, SERVICE_TYPES, STREAM_BATCH_SIZE, CHANGES_BATCH_SIZE
 
+# Per-order outcomes of the bulk updates
+UPDATED = "updated"
+NOT_FOUND = "not found"
+INVALID_STATUS = "invalid status"
+UNKNOWN_TECHNICIAN = "unknown technician"
+SCHEDULE_CONFLICT = "schedule conflict"
 class ServiceorderServiceManager:
     def __init__(self):
 
         self.orders = ServiceOrderRepository()
+        self.techs = TechnicianRepository()
+        self.schedule = shared_schedule_index()
+        self.counters = shared_order_counters()
+        self.dimensions = shared_dimension_cache()
 # Service orders
+    @invalidates("orders")
     def create_order(self, customer_id: int, service_type: str, description: Optional[str], scheduled_at: Optional[datetime]) -> int:
+        order = self.build_order(customer_id, service_type, description, scheduled_at)
+        order.OrderID = self.orders.create(order)
+        self.counters.apply(None, order)
+        return order.OrderID
+
+    @invalidates("orders")
+    def create_orders(self, orders: List[dict]) -> List[int]:
+        """Create many orders in one transaction; each dict holds create_order's arguments. Returns IDs in order."""
+        built = [self.build_order(**o) for o in orders]
+        ids = self.orders.create_many(built)
+        for order, new_id in zip(built, ids):
+            order.OrderID = new_id
+            self.counters.apply(None, order)
+        return ids
+
+    @staticmethod
+    def build_order(customer_id: int, service_type: str, description: Optional[str], scheduled_at: Optional[datetime]) -> ServiceOrder:
+        """Validate and normalise input for a new order (shared with bulk import)."""
         if service_type not in SERVICE_TYPES:
             raise ValueError(f"Invalid service type. Allowed: {SERVICE_TYPES}")
-        order = ServiceOrder(
+        return ServiceOrder(
             OrderID=None, CustomerID=customer_id, TechnicianID=None,
             ServiceType=service_type, Description=(description.strip() if description else None),
             Status="Pending", ScheduledAt=scheduled_at
         )
-        return self.orders.create(order)
 
-    def list_orders(self, status: Optional[str] = None, limit: int = 100) -> List[ServiceOrder]:
+    @cached("orders")
+    def list_orders(self, status: Optional[str] = None, limit: int = 100,
+                    after_id: Optional[int] = None, before_id: Optional[int] = None) -> List[ServiceOrder]:
+        if status and status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status. Allowed: {VALID_STATUSES}")
+        return self.orders.list(status=status, limit=limit, after_id=after_id, before_id=before_id)
+
+    @cached("orders")
+    def list_orders_page(self, status: Optional[str] = None, limit: int = 100,
+                         after_id: Optional[int] = None, before_id: Optional[int] = None,
+                         with_description: bool = True) -> Page:
+        if status and status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status. Allowed: {VALID_STATUSES}")
+        return self.orders.list_page(status=status, limit=limit, after_id=after_id, before_id=before_id,
+                                     with_description=with_description)
+
+    def orders_snapshot(self, status: Optional[str] = None, limit: int = 100,
+                        after_id: Optional[int] = None, before_id: Optional[int] = None) -> Tuple[Page, ChangeWatermark]:
+        """
+        A page read straight from the database (not the cache) plus a watermark
+        taken just before it, to keep the page current with order_changes().
+        """
+        if status and status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status. Allowed: {VALID_STATUSES}")
+        watermark = self.orders.change_watermark()
+        return self.orders.list_page(status=status, limit=limit, after_id=after_id, before_id=before_id), watermark
+
+    def order_changes(self, watermark: Optional[ChangeWatermark] = None,
+                      limit: int = CHANGES_BATCH_SIZE) -> OrderChanges:
+        """Orders created, modified or deleted since `watermark`; None just returns a watermark for now."""
+        if watermark is None:
+            return OrderChanges(watermark=self.orders.change_watermark())
+        return self.orders.changes_since(watermark, limit)
+
+    # Orders with customer and technician names
+    def list_order_details_page(self, status: Optional[str] = None, limit: int = 100,
+                                after_id: Optional[int] = None, before_id: Optional[int] = None,
+                                with_description: bool = True) -> Page:
+        """list_orders_page with ServiceOrderDetail items: names joined in the same query."""
+        if status and status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status. Allowed: {VALID_STATUSES}")
+        page = self.orders.list_page(status=status, limit=limit, after_id=after_id, before_id=before_id,
+                                     with_description=with_description, with_names=True)
+        self.dimensions.remember(page.items)
+        return page
+
+    def order_details_snapshot(self, status: Optional[str] = None, limit: int = 100,
+                               after_id: Optional[int] = None, before_id: Optional[int] = None) -> Tuple[Page, ChangeWatermark]:
+        """orders_snapshot with names; keep it current with order_detail_changes()."""
         if status and status not in VALID_STATUSES:
             raise ValueError(f"Invalid status. Allowed: {VALID_STATUSES}")
-        return self.orders.list(status=status, limit=limit)
+        watermark = self.orders.change_watermark()
+        page = self.orders.list_page(status=status, limit=limit, after_id=after_id, before_id=before_id,
+                                     with_names=True)
+        self.dimensions.remember(page.items)
+        return page, watermark
 
-    def assign_technician(self, order_id: int, technician_id: int) -> None:
+    def order_detail_changes(self, watermark: Optional[ChangeWatermark] = None,
+                             limit: int = CHANGES_BATCH_SIZE) -> OrderChanges:
+        """order_changes with the changed orders as ServiceOrderDetails, named from the dimension cache."""
+        changes = self.order_changes(watermark, limit)
+        if changes.orders:
+            changes.orders = self.dimensions.decorate(changes.orders)
+        return changes
+
+    def iter_orders(self, status: Optional[str] = None, batch_size: int = STREAM_BATCH_SIZE,
+                    with_description: bool = True) -> Iterator[ServiceOrder]:
+        """Stream every matching order; close the generator (or use contextlib.closing) to stop early."""
+        if status and status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status. Allowed: {VALID_STATUSES}")
+        return self.orders.iter(status=status, batch_size=batch_size, with_description=with_description)
+
+    @invalidates("orders")
+    def assign_technician(self, order_id: int, technician_id: int, allow_conflict: bool = False) -> None:
         # Basic consistency checks could be added here (e.g., tech active)
-        self.orders.assign_technician(order_id, technician_id)
+        if not allow_conflict:
+            order = self.orders.get(order_id)
+            if order is not None and order.ScheduledAt is not None:
+                clashes = self.slot_conflicts(technician_id, order.ScheduledAt, ignore_order_id=order_id)
+                if clashes:
+                    raise ValueError(f"Technician {technician_id} is already booked at {order.ScheduledAt:%Y-%m-%d %H:%M} "
+                                     f"(order {', '.join(map(str, clashes))})")
+        old = self.orders.assign_technician(order_id, technician_id)
+        if old is not None:
+            status = "Assigned" if old.Status == "Pending" else old.Status
+            self._track(old, replace(old, TechnicianID=technician_id, Status=status))
 
+    @invalidates("orders")
     def update_order_status(self, order_id: int, status: str) -> None:
         if status not in VALID_STATUSES:
             raise ValueError(f"Invalid status. Allowed: {VALID_STATUSES}")
-        self.orders.update_status(order_id, status)
+        old = self.orders.update_status(order_id, status)
+        if old is not None:
+            self._track(old, replace(old, Status=status))
 
+    @invalidates("orders")
+    def update_status_many(self, updates: List[Tuple[int, str]]) -> Dict[int, str]:
+        """
+        Set many (order_id, status) pairs with one set-based UPDATE per batch, in
+        one transaction. Statuses are checked against VALID_STATUSES first;
+        returns an outcome per OrderID (a repeated ID keeps its last status).
+        """
+        wanted = dict(updates)
+        outcomes = {oid: INVALID_STATUS for oid, status in wanted.items() if status not in VALID_STATUSES}
+        valid = [(oid, status) for oid, status in wanted.items() if oid not in outcomes]
+        for old in self.orders.update_status_many(valid):
+            outcomes[old.OrderID] = UPDATED
+            self._track(old, replace(old, Status=wanted[old.OrderID]))
+        for oid, _ in valid:
+            outcomes.setdefault(oid, NOT_FOUND)
+        return outcomes
+
+    @invalidates("orders")
+    def assign_many(self, assignments: List[Tuple[int, int]], allow_conflict: bool = False) -> Dict[int, str]:
+        """
+        Assign many (order_id, technician_id) pairs with one set-based UPDATE per
+        batch, in one transaction. Unknown orders/technicians and (unless
+        allow_conflict) schedule clashes, also among the pairs themselves, are
+        caught in memory first; returns an outcome per OrderID.
+        """
+        wanted = dict(assignments)
+        orders = {o.OrderID: o for o in self.orders.get_many(list(wanted))}
+        techs = {t.TechnicianID for t in self.techs.get_many(sorted(set(wanted.values())))}
+        outcomes: Dict[int, str] = {}
+        batch: Dict[int, TechnicianSchedule] = {}
+        valid = []
+        for oid, tid in wanted.items():
+            order = orders.get(oid)
+            if order is None:
+                outcomes[oid] = NOT_FOUND
+            elif tid not in techs:
+                outcomes[oid] = UNKNOWN_TECHNICIAN
+            elif not allow_conflict and order.ScheduledAt is not None and (
+                    self.slot_conflicts(tid, order.ScheduledAt, ignore_order_id=oid)
+                    or (tid in batch and batch[tid].overlapping(order.ScheduledAt,
+                                                                 order.ScheduledAt + self.schedule.duration))):
+                outcomes[oid] = SCHEDULE_CONFLICT
+            else:
+                if order.ScheduledAt is not None:
+                    batch.setdefault(tid, TechnicianSchedule(self.schedule.duration)).add(order.ScheduledAt, oid)
+                valid.append((oid, tid))
+        for old in self.orders.assign_many(valid):
+            outcomes[old.OrderID] = UPDATED
+            status = "Assigned" if old.Status == "Pending" else old.Status
+            self._track(old, replace(old, TechnicianID=wanted[old.OrderID], Status=status))
+        for oid, _ in valid:
+            outcomes.setdefault(oid, NOT_FOUND)
+        return outcomes
+
+    @invalidates("orders")
     def delete_order(self, order_id: int) -> None:
-        self.orders.delete(order_id)
\ No newline at end of file
+        old = self.orders.delete(order_id)
+        if old is not None:
+            self.counters.apply(old, None)
+            if self.schedule.built:
+                self.schedule.remove(order_id)
+
+    def _track(self, old: ServiceOrder, new: ServiceOrder) -> None:
+        """Carry one order's change into the in-memory counters and schedule index."""
+        self.counters.apply(old, new)
+        if self.schedule.built:
+            self.schedule.update(new)
+
+    # Dashboard counters
+    def order_counts(self) -> Dict:
+        """Counts per status, service type and technician, from memory (reconciled with the database periodically)."""
+        self.counters.ensure_fresh(self.orders.order_counts)
+        return self.counters.snapshot()
+
+    def reconcile_counts(self) -> Dict:
+        self.counters.reconcile(self.orders.order_counts)
+        return self.counters.snapshot()
+
+    # Technician schedules (in-memory index over assigned, scheduled orders)
+
+    def _schedule(self):
+        self.schedule.ensure_built(self.orders.open_assignments)
+        return self.schedule
+
+    def is_slot_free(self, technician_id: int, start: datetime, minutes: Optional[int] = None,
+                     ignore_order_id: Optional[int] = None) -> bool:
+        """True if the technician has no job overlapping [start, start + minutes) (default: one job's length)."""
+        return self._schedule().is_free(technician_id, start, minutes, ignore_order_id)
+
+    def slot_conflicts(self, technician_id: int, start: datetime, minutes: Optional[int] = None,
+                       ignore_order_id: Optional[int] = None) -> List[int]:
+        """OrderIDs of the technician's jobs overlapping [start, start + minutes)."""
+        return self._schedule().conflicts_at(technician_id, start, minutes, ignore_order_id)
+
+    def next_free_slot(self, technician_id: int, after: datetime, minutes: Optional[int] = None) -> datetime:
+        """Earliest start at or after `after` with `minutes` free on the technician's schedule."""
+        return self._schedule().next_free(technician_id, after, minutes)
+
+    def schedule_conflicts(self, technician_id: Optional[int] = None) -> Dict[int, List[Tuple[int, int]]]:
+        """{TechnicianID: [(OrderID, OrderID), ...]} for overlapping bookings, e.g. from before this check existed."""
+        return self._schedule().conflicts(technician_id)
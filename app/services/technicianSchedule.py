@@ -0,0 +1,193 @@
+# app/services/technicianSchedule.py
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.config import DEFAULT_JOB_DURATION_MINUTES, SCHEDULE_INDEX_MAX_AGE
+from app.model.serviceorder import ServiceOrder
+from app.services.processWide import process_wide
+
+BLOCKING_STATUSES = ("Assigned", "In Progress")  # orders that hold a technician's time
+
+Booking = Tuple[int, int, Optional[datetime]]  # (OrderID, TechnicianID, ScheduledAt)
+
+
+def blocks(order: ServiceOrder) -> bool:
+    return order.TechnicianID is not None and order.ScheduledAt is not None and order.Status in BLOCKING_STATUSES
+
+
+class TechnicianSchedule:
+    """
+    One technician's booked jobs as (start, OrderID) sorted by start. Every job
+    lasts `duration` (ServiceOrders has no duration column), so the jobs that
+    overlap [a, b) are exactly those starting in (a - duration, b): two
+    bisections, O(log n + k) for k hits.
+    """
+
+    def __init__(self, duration: timedelta):
+        self.duration = duration
+        self.jobs: List[Tuple[datetime, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def add(self, start: datetime, order_id: int) -> None:
+        insort(self.jobs, (start, order_id))
+
+    def remove(self, start: datetime, order_id: int) -> None:
+        i = bisect_left(self.jobs, (start, order_id))
+        if i < len(self.jobs) and self.jobs[i] == (start, order_id):
+            del self.jobs[i]
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Tuple[datetime, int]]:
+        jobs = self.jobs
+        i = bisect_left(jobs, (start - self.duration + timedelta(microseconds=1),))
+        hits = []
+        while i < len(jobs) and jobs[i][0] < end:
+            hits.append(jobs[i])
+            i += 1
+        return hits
+
+    def next_free(self, after: datetime, length: timedelta) -> datetime:
+        """
+        Earliest start >= `after` with `length` free. Each step jumps to the end
+        of the latest job in the way, so the cost is O(log n) per run of
+        back-to-back jobs skipped.
+        """
+        start = after
+        while True:
+            hits = self.overlapping(start, start + length)
+            if not hits:
+                return start
+            start = hits[-1][0] + self.duration
+
+    def conflicts(self) -> List[Tuple[int, int]]:
+        """(OrderID, OrderID) for every pair of jobs that overlap."""
+        pairs = []
+        jobs = self.jobs
+        for i, (start, order_id) in enumerate(jobs):
+            j = i + 1
+            while j < len(jobs) and jobs[j][0] < start + self.duration:
+                pairs.append((order_id, jobs[j][1]))
+                j += 1
+        return pairs
+
+
+class ScheduleIndex:
+    """
+    In-memory TechnicianSchedule per technician, built from ServiceOrders
+    (assigned, unfinished, scheduled orders) and kept current by the service
+    manager after each create/assign/status change/delete. Writes made by other
+    desks are not seen, so the index is rebuilt from the database once it is
+    older than `max_age` seconds.
+    """
+
+    def __init__(self, duration_minutes: int = DEFAULT_JOB_DURATION_MINUTES,
+                 max_age: float = SCHEDULE_INDEX_MAX_AGE):
+        self.duration = timedelta(minutes=duration_minutes)
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._schedules: Dict[int, TechnicianSchedule] = {}
+        self._placed: Dict[int, Tuple[int, datetime]] = {}  # OrderID -> (TechnicianID, start)
+        self._built_at: Optional[float] = None
+
+    @property
+    def built(self) -> bool:
+        return self._built_at is not None
+
+    def build(self, bookings: Iterable[Booking]) -> None:
+        schedules: Dict[int, TechnicianSchedule] = {}
+        placed: Dict[int, Tuple[int, datetime]] = {}
+        for order_id, technician_id, start in bookings:
+            if start is None:
+                continue
+            schedule = schedules.get(technician_id)
+            if schedule is None:
+                schedule = schedules[technician_id] = TechnicianSchedule(self.duration)
+            schedule.jobs.append((start, order_id))
+            placed[order_id] = (technician_id, start)
+        for schedule in schedules.values():
+            schedule.jobs.sort()
+        with self._lock:
+            self._schedules, self._placed = schedules, placed
+            self._built_at = time.monotonic()
+
+    def ensure_built(self, load: Callable[[], Iterable[Booking]]) -> None:
+        with self._lock:
+            if self._built_at is None or time.monotonic() - self._built_at > self.max_age:
+                self.build(load())
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._built_at = None
+
+    def place(self, order_id: int, technician_id: Optional[int], start: Optional[datetime]) -> None:
+        """Record where an order now sits; technician_id or start None takes it off every schedule."""
+        with self._lock:
+            self._unplace(order_id)
+            if technician_id is None or start is None:
+                return
+            schedule = self._schedules.get(technician_id)
+            if schedule is None:
+                schedule = self._schedules[technician_id] = TechnicianSchedule(self.duration)
+            schedule.add(start, order_id)
+            self._placed[order_id] = (technician_id, start)
+
+    def update(self, order: ServiceOrder) -> None:
+        """Place or drop an order according to its current state."""
+        if blocks(order):
+            self.place(order.OrderID, order.TechnicianID, order.ScheduledAt)
+        else:
+            self.remove(order.OrderID)
+
+    def remove(self, order_id: int) -> None:
+        with self._lock:
+            self._unplace(order_id)
+
+    def _unplace(self, order_id: int) -> None:
+        placed = self._placed.pop(order_id, None)
+        if placed is not None:
+            self._schedules[placed[0]].remove(placed[1], order_id)
+
+    def _length(self, minutes: Optional[int]) -> timedelta:
+        return self.duration if minutes is None else timedelta(minutes=minutes)
+
+    def schedule(self, technician_id: int) -> TechnicianSchedule:
+        return self._schedules.get(technician_id) or TechnicianSchedule(self.duration)
+
+    def conflicts_at(self, technician_id: int, start: datetime, minutes: Optional[int] = None,
+                     ignore_order_id: Optional[int] = None) -> List[int]:
+        """OrderIDs booked on the technician that overlap [start, start + minutes)."""
+        with self._lock:
+            hits = self.schedule(technician_id).overlapping(start, start + self._length(minutes))
+            return [order_id for _, order_id in hits if order_id != ignore_order_id]
+
+    def is_free(self, technician_id: int, start: datetime, minutes: Optional[int] = None,
+                ignore_order_id: Optional[int] = None) -> bool:
+        return not self.conflicts_at(technician_id, start, minutes, ignore_order_id)
+
+    def next_free(self, technician_id: int, after: datetime, minutes: Optional[int] = None) -> datetime:
+        with self._lock:
+            return self.schedule(technician_id).next_free(after, self._length(minutes))
+
+    def conflicts(self, technician_id: Optional[int] = None) -> Dict[int, List[Tuple[int, int]]]:
+        """Overlapping order pairs per technician (only technicians that have any)."""
+        with self._lock:
+            ids = [technician_id] if technician_id is not None else list(self._schedules)
+            found = {tid: self.schedule(tid).conflicts() for tid in ids}
+        return {tid: pairs for tid, pairs in found.items() if pairs}
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        with self._lock:
+            return {
+                "technicians": len(self._schedules),
+                "bookings": len(self._placed),
+                "age_seconds": round(time.monotonic() - self._built_at, 1) if self._built_at is not None else None,
+            }
+
+
+@process_wide
+def shared_schedule_index() -> ScheduleIndex:
+    return ScheduleIndex()
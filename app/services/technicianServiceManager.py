@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from app.model.technician import Technician
+from app.model.page import Page
 from datetime import datetime
-from app.config import VALID_STATUSES, SERVICE_TYPES
+from app.config import VALID_STATUSES, SERVICE_TYPES, STREAM_BATCH_SIZE
 from app.model.CURDoperations import TechnicianRepository
+from app.services.queryCache import cached, invalidates
 
 
 class TechnicianServiceManager:
@@ -11,15 +13,37 @@ class TechnicianServiceManager:
         self.techs = TechnicianRepository()
 
 # Technicians
+    @invalidates("technicians")
     def create_technician(self, name: str, phone: str, skill_level: str, active: bool = True) -> int:
+        return self.techs.create(self.build_technician(name, phone, skill_level, active))
+
+    @invalidates("technicians")
+    def create_technicians(self, techs: List[dict]) -> List[int]:
+        """Create many technicians in one transaction; each dict holds create_technician's arguments. Returns IDs in order."""
+        return self.techs.create_many([self.build_technician(**t) for t in techs])
+
+    @staticmethod
+    def build_technician(name: str, phone: str, skill_level: str, active: bool = True) -> Technician:
+        """Validate and normalise input for a new technician (shared with bulk import)."""
         if not name or not phone or not skill_level:
             raise ValueError("Name, phone, and skill level are required")
-        t = Technician(TechnicianID=None, Name=name.strip(), Phone=phone.strip(), SkillLevel=skill_level.strip(), Active=active)
-        return self.techs.create(t)
+        return Technician(TechnicianID=None, Name=name.strip(), Phone=phone.strip(), SkillLevel=skill_level.strip(), Active=active)
+
+    @cached("technicians")
+    def list_technicians(self, active_only: bool = True, limit: int = 100,
+                         after_id: Optional[int] = None, before_id: Optional[int] = None) -> List[Technician]:
+        return self.techs.list(active_only=active_only, limit=limit, after_id=after_id, before_id=before_id)
+
+    @cached("technicians")
+    def list_technicians_page(self, active_only: bool = True, limit: int = 100,
+                              after_id: Optional[int] = None, before_id: Optional[int] = None) -> Page:
+        return self.techs.list_page(active_only=active_only, limit=limit, after_id=after_id, before_id=before_id)
 
-    def list_technicians(self, active_only: bool = True, limit: int = 100) -> List[Technician]:
-        return self.techs.list(active_only=active_only, limit=limit)
+    def iter_technicians(self, active_only: bool = True, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[Technician]:
+        """Stream every matching technician; close the generator (or use contextlib.closing) to stop early."""
+        return self.techs.iter(active_only=active_only, batch_size=batch_size)
 
+    @invalidates("technicians")
     def set_technician_active(self, technician_id: int, active: bool) -> None:
         self.techs.set_active(technician_id, active)
 
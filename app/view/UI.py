@@ -1,20 +1,40 @@
 # app/view/app.py
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
-from app.config import APP_TITLE, DEFAULT_PAGE_SIZE, VALID_STATUSES, SERVICE_TYPES
+from typing import Optional
+from app.config import (APP_TITLE, DEFAULT_PAGE_SIZE, VALID_STATUSES, SERVICE_TYPES, SKILL_LEVELS, ORDERS_POLL_SECONDS,
+                        DASHBOARD_REFRESH_SECONDS, STARTUP_PREFETCH)
 from app.services.customerServiceManager import CustomerServiceManager
 from app.services.technicianServiceManager import TechnicianServiceManager
 from app.services.serviceorderServiceManager import ServiceorderServiceManager
+from app.services.dispatchServiceManager import DispatchServiceManager
+from app.model.page import Page
+from app.view.startupTiming import StartupTimer
+from app.view.worker import UIWorker
+from app.view.virtualTable import VirtualTable
 
 class ACServiceDeskApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, timer: Optional[StartupTimer] = None):
         super().__init__()
+        self.timer = timer or StartupTimer()
         self.title(APP_TITLE)
         self.geometry("1000x650")
         self.customer_mgr = CustomerServiceManager()
         self.technician_mgr = TechnicianServiceManager()
         self.serviceorder_mgr = ServiceorderServiceManager()
+        self.dispatch_mgr = DispatchServiceManager()
+
+        # Database calls run on the worker; the status bar shows when any are in flight.
+        status_bar = ttk.Frame(self)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.busy_var = tk.StringVar(value="Ready")
+        ttk.Label(status_bar, textvariable=self.busy_var).pack(side=tk.LEFT, padx=10)
+        self.busy_bar = ttk.Progressbar(status_bar, mode="indeterminate", length=120)
+        self.busy_bar.pack(side=tk.RIGHT, padx=10, pady=2)
+        self.worker = UIWorker(self, on_busy=self._show_busy)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True)
@@ -22,14 +42,140 @@ class ACServiceDeskApp(tk.Tk):
         self.customers_tab = ttk.Frame(self.notebook)
         self.techs_tab = ttk.Frame(self.notebook)
         self.orders_tab = ttk.Frame(self.notebook)
+        self.dashboard_tab = ttk.Frame(self.notebook)
 
         self.notebook.add(self.customers_tab, text="Customers")
         self.notebook.add(self.techs_tab, text="Technicians")
         self.notebook.add(self.orders_tab, text="Service Orders")
+        self.notebook.add(self.dashboard_tab, text="Dashboard")
+
+        # Tabs are built, and load their first page, the first time they are shown. Nothing
+        # touches the database until the window is on screen; then the first page of every
+        # list is fetched concurrently (STARTUP_PREFETCH) so switching tabs does not wait.
+        self._tabs = {
+            str(self.customers_tab): ("customers", self._build_customers_tab),
+            str(self.techs_tab): ("technicians", self._build_technicians_tab),
+            str(self.orders_tab): ("orders", self._build_orders_tab),
+            str(self.dashboard_tab): ("dashboard", self._build_dashboard_tab),
+        }
+        self._built_tabs = set()
+        self._initial_pages = {}  # tab name -> first page fetched at startup, until the tab is built
+        self._prefetching = set()
+        self._painted = False
+        self._orders_poll = None
+        self._dashboard_poll = None
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.bind("<Map>", self._on_map)
+        self.timer.mark("window")
+
+    # Startup
+    def _on_map(self, event):
+        # <Map> on the root also fires for every child widget; only the window itself matters.
+        if event.widget is not self:
+            return
+        self.unbind("<Map>")
+        self.after_idle(self._after_first_paint)
+
+    def _after_first_paint(self):
+        self.update_idletasks()
+        self._painted = True
+        self.timer.mark("first_paint")
+        if STARTUP_PREFETCH:
+            for name, (fn, kwargs) in self._initial_loads().items():
+                self._prefetching.add(name)
+                self.worker.submit(fn, key=name, **kwargs,
+                                   on_done=lambda result, name=name: self._initial_page_loaded(name, result),
+                                   on_error=lambda e, name=name: self._initial_page_failed(name, e))
+        self._on_tab_changed()
+
+    def _initial_loads(self):
+        """First page of each list, as the tab's Refresh would ask for it with the default filters."""
+        return {
+            "customers": (self.customer_mgr.list_customers_page, {"limit": DEFAULT_PAGE_SIZE}),
+            "technicians": (self.technician_mgr.list_technicians_page, {"active_only": True, "limit": DEFAULT_PAGE_SIZE}),
+            "orders": (self.serviceorder_mgr.order_details_snapshot, {"limit": DEFAULT_PAGE_SIZE}),
+        }
+
+    def _initial_page_loaded(self, name, result):
+        self._prefetching.discard(name)
+        self.timer.mark(f"{name}_data")
+        if name in self._built_tabs:
+            self._show_initial(name, result)
+        else:
+            self._initial_pages[name] = result
+        self._startup_progress()
+
+    def _initial_page_failed(self, name, error):
+        # The tab loads again (and reports the error) when it is opened.
+        self._prefetching.discard(name)
+        if name in self._built_tabs:
+            messagebox.showerror("Error", str(error))
+        self._startup_progress()
+
+    def _show_initial(self, name, result):
+        {"customers": self._show_customers, "technicians": self._show_technicians,
+         "orders": self._show_orders}[name](result)
+
+    def _startup_progress(self):
+        if not self.timer.finished and "first_data" in self.timer.marks and not self._prefetching:
+            self.timer.finish(prefetch=STARTUP_PREFETCH, tabs_built=sorted(self._built_tabs))
+
+    def _data_shown(self, name):
+        self._prefetching.discard(name)  # a Refresh issued meanwhile supersedes the prefetch
+        self.timer.mark(f"{name}_data")
+        self.timer.mark("first_data")
+        self._startup_progress()
+
+    def _on_tab_changed(self, _event=None):
+        if not self._painted:
+            return
+        self._ensure_tab(self.notebook.select())
+        self._schedule_dashboard_poll(0)
 
-        self._build_customers_tab()
-        self._build_technicians_tab()
-        self._build_orders_tab()
+    def _ensure_tab(self, tab_id):
+        name, build = self._tabs[tab_id]
+        if name in self._built_tabs:
+            return
+        self._built_tabs.add(name)
+        started = time.perf_counter()
+        build()
+        self.timer.record(f"{name}_build", (time.perf_counter() - started) * 1000)
+        if name == "dashboard":
+            return  # the dashboard polls on its own while it is shown
+        page = self._initial_pages.pop(name, None)
+        if page is not None:
+            self._show_initial(name, page)
+        elif name not in self._prefetching:
+            {"customers": self._refresh_customers, "technicians": lambda: self._refresh_technicians(True),
+             "orders": self._refresh_orders}[name]()
+
+    def _show_busy(self, pending: int):
+        if pending:
+            self.busy_var.set(f"Working… ({pending})")
+            self.busy_bar.start(15)
+            self.config(cursor="watch")
+        else:
+            self.busy_var.set("Ready")
+            self.busy_bar.stop()
+            self.config(cursor="")
+
+    def _on_close(self):
+        if self._orders_poll is not None:
+            self.after_cancel(self._orders_poll)
+        if self._dashboard_poll is not None:
+            self.after_cancel(self._dashboard_poll)
+        self.worker.shutdown()
+        self.destroy()
+
+    def _run(self, fn, *args, on_done=None, success=None, key=None, **kwargs):
+        """Run a service call on the worker; report errors in a dialog and optionally a success message."""
+        def done(result):
+            if success:
+                messagebox.showinfo("Success", success(result) if callable(success) else success)
+            if on_done:
+                on_done(result)
+        self.worker.submit(fn, *args, on_done=done, on_error=lambda e: messagebox.showerror("Error", str(e)),
+                           key=key, **kwargs)
 
     # Customers UI
     def _build_customers_tab(self):
@@ -66,62 +212,73 @@ class ACServiceDeskApp(tk.Tk):
         search_frame.pack(fill=tk.X, padx=10, pady=5)
         ttk.Entry(search_frame, textvariable=self.c_search_var, width=40).pack(side=tk.LEFT, padx=5, pady=5)
         ttk.Button(search_frame, text="Refresh", command=self._refresh_customers).pack(side=tk.LEFT, padx=5)
-
-        self.customers_tree = ttk.Treeview(self.customers_tab, columns=("id","name","phone","email","address","created"), show="headings", height=15)
-        for col, text, w in [
+        self.customers_page = Page()
+        self.c_next_btn = ttk.Button(search_frame, text="Next ▶",
+                                     command=lambda: self._refresh_customers(after_id=self.customers_page.next_cursor))
+        self.c_next_btn.pack(side=tk.RIGHT, padx=5)
+        self.c_prev_btn = ttk.Button(search_frame, text="◀ Prev",
+                                     command=lambda: self._refresh_customers(before_id=self.customers_page.prev_cursor))
+        self.c_prev_btn.pack(side=tk.RIGHT, padx=5)
+
+        self.customers_table = VirtualTable(self.customers_tab, [
             ("id", "ID", 60),
             ("name", "Name", 180),
             ("phone", "Phone", 120),
             ("email", "Email", 180),
             ("address", "Address", 250),
             ("created", "CreatedAt", 140),
-        ]:
-            self.customers_tree.heading(col, text=text)
-            self.customers_tree.column(col, width=w, anchor=tk.W)
-        self.customers_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._refresh_customers()
+        ], height=15)
+        self.customers_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
     def _create_customer(self):
-        try:
-            new_id = self.customer_mgr.create_customer(
-                self.c_name_var.get(), self.c_phone_var.get(),
-                self.c_email_var.get() or None, self.c_address_var.get() or None
-            )
-            messagebox.showinfo("Success", f"Customer created with ID {new_id}")
-            self._refresh_customers()
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._run(
+            self.customer_mgr.create_customer,
+            self.c_name_var.get(), self.c_phone_var.get(),
+            self.c_email_var.get() or None, self.c_address_var.get() or None,
+            success=lambda new_id: f"Customer created with ID {new_id}",
+            on_done=lambda _: self._refresh_customers(),
+        )
 
     def _update_customer(self):
         try:
             cid = int(self.c_id_var.get())
-            self.customer_mgr.update_customer(
-                cid, self.c_name_var.get(), self.c_phone_var.get(),
-                self.c_email_var.get() or None, self.c_address_var.get() or None
-            )
-            messagebox.showinfo("Success", "Customer updated")
-            self._refresh_customers()
         except ValueError:
             messagebox.showerror("Error", "Valid Customer ID required")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            return
+        self._run(
+            self.customer_mgr.update_customer,
+            cid, self.c_name_var.get(), self.c_phone_var.get(),
+            self.c_email_var.get() or None, self.c_address_var.get() or None,
+            success="Customer updated", on_done=lambda _: self._refresh_customers(),
+        )
 
     def _delete_customer(self):
         try:
             cid = int(self.c_id_var.get())
-            self.customer_mgr.delete_customer(cid)
-            messagebox.showinfo("Success", "Customer deleted")
-            self._refresh_customers()
         except ValueError:
             messagebox.showerror("Error", "Valid Customer ID required")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-
-    def _refresh_customers(self):
-        self.customers_tree.delete(*self.customers_tree.get_children())
-        rows = self.customer_mgr.list_customers(search=self.c_search_var.get() or None, limit=DEFAULT_PAGE_SIZE)
-        for c in rows:
-            self.customers_tree.insert("", tk.END, values=(c.CustomerID, c.Name, c.Phone, c.Email or "", c.Address or "", c.CreatedAt))
+            return
+        self._run(self.customer_mgr.delete_customer, cid,
+                  success="Customer deleted", on_done=lambda _: self._refresh_customers())
+
+    def _refresh_customers(self, after_id=None, before_id=None):
+        self._run(
+            self.customer_mgr.list_customers_page,
+            search=self.c_search_var.get() or None, limit=DEFAULT_PAGE_SIZE, after_id=after_id, before_id=before_id,
+            on_done=self._show_customers, key="customers",
+        )
+
+    def _show_customers(self, page: Page):
+        self.customers_page = page
+        self.customers_table.set_rows(
+            (c.CustomerID, (c.CustomerID, c.Name, c.Phone, c.Email or "", c.Address or "", c.CreatedAt)) for c in page.items
+        )
+        self._update_pager(self.customers_page, self.c_prev_btn, self.c_next_btn)
+        self._data_shown("customers")
+
+    def _update_pager(self, page: Page, prev_btn, next_btn):
+        prev_btn.config(state=tk.NORMAL if page.prev_cursor is not None else tk.DISABLED)
+        next_btn.config(state=tk.NORMAL if page.next_cursor is not None else tk.DISABLED)
 
     # Technicians UI
     def _build_technicians_tab(self):
@@ -130,7 +287,7 @@ class ACServiceDeskApp(tk.Tk):
 
         self.t_name_var = tk.StringVar()
         self.t_phone_var = tk.StringVar()
-        self.t_skill_var = tk.StringVar(value="Junior")
+        self.t_skill_var = tk.StringVar(value=SKILL_LEVELS[0])
         self.t_active_var = tk.BooleanVar(value=True)
 
         ttk.Label(form, text="Name:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
@@ -140,59 +297,69 @@ class ACServiceDeskApp(tk.Tk):
         ttk.Entry(form, textvariable=self.t_phone_var, width=15).grid(row=0, column=3, sticky="w", padx=5, pady=5)
 
         ttk.Label(form, text="Skill Level:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        ttk.Combobox(form, textvariable=self.t_skill_var, values=["Junior","Mid","Senior"], width=12, state="readonly").grid(row=1, column=1, sticky="w", padx=5, pady=5)
+        ttk.Combobox(form, textvariable=self.t_skill_var, values=SKILL_LEVELS, width=12, state="readonly").grid(row=1, column=1, sticky="w", padx=5, pady=5)
 
         ttk.Checkbutton(form, text="Active", variable=self.t_active_var).grid(row=1, column=2, sticky="w", padx=5, pady=5)
 
         ttk.Button(form, text="Create", command=self._create_technician).grid(row=2, column=0, padx=5, pady=8)
         ttk.Button(form, text="Set Active/Inactive", command=self._toggle_technician_active).grid(row=2, column=1, padx=5, pady=8)
 
-        self.techs_tree = ttk.Treeview(self.techs_tab, columns=("id","name","phone","skill","active","created"), show="headings", height=18)
-        for col, text, w in [
+        self.techs_table = VirtualTable(self.techs_tab, [
             ("id", "ID", 60),
             ("name", "Name", 180),
             ("phone", "Phone", 120),
             ("skill", "Skill", 120),
             ("active", "Active", 80),
             ("created", "CreatedAt", 140),
-        ]:
-            self.techs_tree.heading(col, text=text)
-            self.techs_tree.column(col, width=w, anchor=tk.W)
-        self.techs_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        ], height=18)
+        self.techs_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         actions = ttk.Frame(self.techs_tab)
         actions.pack(fill=tk.X, padx=10, pady=5)
         ttk.Button(actions, text="Refresh (Active only)", command=lambda: self._refresh_technicians(True)).pack(side=tk.LEFT, padx=5)
         ttk.Button(actions, text="Refresh (All)", command=lambda: self._refresh_technicians(False)).pack(side=tk.LEFT, padx=5)
-
-        self._refresh_technicians(True)
+        self.techs_page = Page()
+        self.t_active_only = True
+        self.t_next_btn = ttk.Button(actions, text="Next ▶",
+                                     command=lambda: self._refresh_technicians(self.t_active_only, after_id=self.techs_page.next_cursor))
+        self.t_next_btn.pack(side=tk.RIGHT, padx=5)
+        self.t_prev_btn = ttk.Button(actions, text="◀ Prev",
+                                     command=lambda: self._refresh_technicians(self.t_active_only, before_id=self.techs_page.prev_cursor))
+        self.t_prev_btn.pack(side=tk.RIGHT, padx=5)
 
     def _create_technician(self):
-        try:
-            new_id = self.technician_mgr.create_technician(self.t_name_var.get(), self.t_phone_var.get(), self.t_skill_var.get(), self.t_active_var.get())
-            messagebox.showinfo("Success", f"Technician created with ID {new_id}")
-            self._refresh_technicians(True)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._run(
+            self.technician_mgr.create_technician,
+            self.t_name_var.get(), self.t_phone_var.get(), self.t_skill_var.get(), self.t_active_var.get(),
+            success=lambda new_id: f"Technician created with ID {new_id}",
+            on_done=lambda _: self._refresh_technicians(True),
+        )
 
     def _toggle_technician_active(self):
-        sel = self.techs_tree.selection()
+        sel = self.techs_table.selection()
         if not sel:
             messagebox.showerror("Error", "Select a technician row")
             return
-        item = self.techs_tree.item(sel[0])["values"]
+        item = self.techs_table.values(sel[0])
         tech_id, _, _, _, active, _ = item
-        try:
-            self.technician_mgr.set_technician_active(int(tech_id), not bool(active))
-            self._refresh_technicians(False)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-
-    def _refresh_technicians(self, active_only: bool):
-        self.techs_tree.delete(*self.techs_tree.get_children())
-        rows = self.technician_mgr.list_technicians(active_only=active_only, limit=DEFAULT_PAGE_SIZE)
-        for t in rows:
-            self.techs_tree.insert("", tk.END, values=(t.TechnicianID, t.Name, t.Phone, t.SkillLevel, int(t.Active), t.CreatedAt))
+        self._run(self.technician_mgr.set_technician_active, int(tech_id), not bool(active),
+                  on_done=lambda _: self._refresh_technicians(False))
+
+    def _refresh_technicians(self, active_only: bool, after_id=None, before_id=None):
+        self.t_active_only = active_only
+        self._run(
+            self.technician_mgr.list_technicians_page,
+            active_only=active_only, limit=DEFAULT_PAGE_SIZE, after_id=after_id, before_id=before_id,
+            on_done=self._show_technicians, key="technicians",
+        )
+
+    def _show_technicians(self, page: Page):
+        self.techs_page = page
+        self.techs_table.set_rows(
+            (t.TechnicianID, (t.TechnicianID, t.Name, t.Phone, t.SkillLevel, int(t.Active), t.CreatedAt)) for t in page.items
+        )
+        self._update_pager(self.techs_page, self.t_prev_btn, self.t_next_btn)
+        self._data_shown("technicians")
 
     # Orders UI
     def _build_orders_tab(self):
@@ -236,6 +403,13 @@ class ACServiceDeskApp(tk.Tk):
         ttk.Label(actions, text="Status:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
         ttk.Combobox(actions, textvariable=self.o_status_var, values=VALID_STATUSES, width=14, state="readonly").grid(row=1, column=1, sticky="w", padx=5, pady=5)
         ttk.Button(actions, text="Update Status", command=self._update_status).grid(row=1, column=2, padx=5, pady=8)
+        ttk.Button(actions, text="Auto-dispatch Pending", command=self._auto_dispatch).grid(row=1, column=4, padx=5, pady=8)
+
+        # Assign/Update apply to every selected row (Ctrl/Shift-click), or to the Order ID above when none is.
+        ttk.Button(actions, text="Select All", command=lambda: self._select_orders(self.orders_table.keys())).grid(row=0, column=5, padx=5, pady=8)
+        ttk.Button(actions, text="Clear Selection", command=lambda: self._select_orders([])).grid(row=1, column=5, padx=5, pady=8)
+        self.o_selection_var = tk.StringVar()
+        ttk.Label(actions, textvariable=self.o_selection_var).grid(row=0, column=6, sticky="w", padx=5, pady=5)
 
         filter_frame = ttk.Frame(self.orders_tab)
         filter_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -243,24 +417,35 @@ class ACServiceDeskApp(tk.Tk):
         ttk.Label(filter_frame, text="Filter by Status:").pack(side=tk.LEFT, padx=5)
         ttk.Combobox(filter_frame, textvariable=self.o_filter_status_var, values=[""] + VALID_STATUSES, width=14, state="readonly").pack(side=tk.LEFT, padx=5)
         ttk.Button(filter_frame, text="Refresh", command=self._refresh_orders).pack(side=tk.LEFT, padx=5)
-
-        self.orders_tree = ttk.Treeview(self.orders_tab, columns=("id","customer","tech","type","desc","status","scheduled","created","updated"), show="headings", height=16)
-        for col, text, w in [
+        self.o_auto_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text=f"Auto-refresh ({ORDERS_POLL_SECONDS:g}s)", variable=self.o_auto_var,
+                        command=self._schedule_orders_poll).pack(side=tk.LEFT, padx=5)
+        self.o_auto_status_var = tk.StringVar()
+        ttk.Label(filter_frame, textvariable=self.o_auto_status_var).pack(side=tk.LEFT, padx=5)
+        self.orders_page = Page()
+        self.orders_watermark = None
+        self._orders_generation = 0
+        self.o_next_btn = ttk.Button(filter_frame, text="Next ▶",
+                                     command=lambda: self._refresh_orders(after_id=self.orders_page.next_cursor))
+        self.o_next_btn.pack(side=tk.RIGHT, padx=5)
+        self.o_prev_btn = ttk.Button(filter_frame, text="◀ Prev",
+                                     command=lambda: self._refresh_orders(before_id=self.orders_page.prev_cursor))
+        self.o_prev_btn.pack(side=tk.RIGHT, padx=5)
+
+        self.orders_table = VirtualTable(self.orders_tab, [
             ("id", "OrderID", 70),
-            ("customer", "CustomerID", 90),
-            ("tech", "TechnicianID", 100),
-            ("type", "ServiceType", 110),
-            ("desc", "Description", 260),
+            ("customer", "Customer", 170),
+            ("phone", "Phone", 110),
+            ("tech", "Technician", 170),
+            ("type", "ServiceType", 100),
+            ("desc", "Description", 200),
             ("status", "Status", 100),
             ("scheduled", "ScheduledAt", 160),
             ("created", "CreatedAt", 140),
             ("updated", "UpdatedAt", 140),
-        ]:
-            self.orders_tree.heading(col, text=text)
-            self.orders_tree.column(col, width=w, anchor=tk.W)
-        self.orders_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        self._refresh_orders()
+        ], height=16, selectmode="extended")
+        self.orders_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.orders_table.tree.bind("<<TreeviewSelect>>", self._on_orders_select, add="+")
 
     def _parse_dt(self, s: str):
         if not s:
@@ -280,52 +465,221 @@ class ACServiceDeskApp(tk.Tk):
         scheduled = self._parse_dt(self.o_sched_var.get())
         if self.o_sched_var.get() and not scheduled:
             return
+        self._run(
+            self.serviceorder_mgr.create_order,
+            customer_id=cid,
+            service_type=self.o_service_type_var.get(),
+            description=self.o_desc_var.get() or None,
+            scheduled_at=scheduled,
+            success=lambda new_id: f"Order created with ID {new_id}",
+            on_done=lambda _: self._refresh_orders(),
+        )
+
+    def _on_orders_select(self, _event=None):
+        n = len(self.orders_table.selection())
+        self.o_selection_var.set(f"{n} selected" if n > 1 else "")
+        if n == 1:
+            self.o_order_id_var.set(str(self.orders_table.selection()[0]))
+
+    def _select_orders(self, keys):
+        self.orders_table.select(keys)
+        self._on_orders_select()
+
+    def _target_orders(self):
+        """Selected OrderIDs when several rows are selected, else the Order ID field; None if neither is valid."""
+        selected = self.orders_table.selection()
+        if len(selected) > 1:
+            return selected
         try:
-            new_id = self.serviceorder_mgr.create_order(
-                customer_id=cid,
-                service_type=self.o_service_type_var.get(),
-                description=self.o_desc_var.get() or None,
-                scheduled_at=scheduled
-            )
-            messagebox.showinfo("Success", f"Order created with ID {new_id}")
-            self._refresh_orders()
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            return [int(self.o_order_id_var.get())]
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _bulk_summary(outcomes):
+        counts = {}
+        for outcome in outcomes.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        return "\n".join(f"{n} {outcome}" for outcome, n in counts.items())
 
     def _assign_technician(self):
+        oids = self._target_orders()
         try:
-            oid = int(self.o_order_id_var.get())
             tid = int(self.o_technician_id_var.get())
-            self.serviceorder_mgr.assign_technician(oid, tid)
-            messagebox.showinfo("Success", "Technician assigned")
-            self._refresh_orders()
         except ValueError:
-            messagebox.showerror("Error", "Valid Order ID and Technician ID required")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            tid = None
+        if oids is None or tid is None:
+            messagebox.showerror("Error", "Valid Order ID (or selected rows) and Technician ID required")
+            return
+        if len(oids) == 1:
+            self._run(self.serviceorder_mgr.assign_technician, oids[0], tid,
+                      success="Technician assigned", on_done=lambda _: self._refresh_orders())
+        else:
+            self._run(self.serviceorder_mgr.assign_many, [(oid, tid) for oid in oids],
+                      success=self._bulk_summary, on_done=lambda _: self._refresh_orders())
 
     def _update_status(self):
-        try:
-            oid = int(self.o_order_id_var.get())
-            status = self.o_status_var.get()
-            self.serviceorder_mgr.update_order_status(oid, status)
-            messagebox.showinfo("Success", "Order status updated")
-            self._refresh_orders()
-        except ValueError:
-            messagebox.showerror("Error", "Valid Order ID required")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-
-    def _refresh_orders(self):
-        self.orders_tree.delete(*self.orders_tree.get_children())
-        status = self.o_filter_status_var.get() or None
-        rows = self.serviceorder_mgr.list_orders(status=status, limit=DEFAULT_PAGE_SIZE)
-        for o in rows:
-            self.orders_tree.insert("", tk.END, values=(o.OrderID, o.CustomerID, o.TechnicianID or "", o.ServiceType, o.Description or "", o.Status, o.ScheduledAt, o.CreatedAt, o.UpdatedAt))
-
-def main():
-    app = ACServiceDeskApp()
+        oids = self._target_orders()
+        if oids is None:
+            messagebox.showerror("Error", "Valid Order ID (or selected rows) required")
+            return
+        status = self.o_status_var.get()
+        if len(oids) == 1:
+            self._run(self.serviceorder_mgr.update_order_status, oids[0], status,
+                      success="Order status updated", on_done=lambda _: self._refresh_orders())
+        else:
+            self._run(self.serviceorder_mgr.update_status_many, [(oid, status) for oid in oids],
+                      success=self._bulk_summary, on_done=lambda _: self._refresh_orders())
+
+    def _auto_dispatch(self):
+        if not messagebox.askyesno("Auto-dispatch", "Assign all Pending orders to available technicians?"):
+            return
+        self._run(self.dispatch_mgr.dispatch, key="dispatch", on_done=self._dispatch_done)
+
+    def _dispatch_done(self, plan):
+        reasons = {}
+        for reason in plan.unassigned.values():
+            reasons[reason] = reasons.get(reason, 0) + 1
+        lines = [f"Assigned {len(plan.applied)} order(s) in {plan.plan_seconds + plan.apply_seconds:.2f}s."]
+        lines += [f"{n} left Pending: {reason}" for reason, n in reasons.items()]
+        messagebox.showinfo("Auto-dispatch", "\n".join(lines))
+        self._refresh_orders()
+
+    def _refresh_orders(self, after_id=None, before_id=None):
+        # A full read starts a new generation; polls issued before it are ignored when they land.
+        self._orders_generation += 1
+        self._run(
+            self.serviceorder_mgr.order_details_snapshot,
+            status=self.o_filter_status_var.get() or None, limit=DEFAULT_PAGE_SIZE,
+            after_id=after_id, before_id=before_id,
+            on_done=self._show_orders, key="orders",
+        )
+
+    def _show_orders(self, snapshot):
+        page, self.orders_watermark = snapshot
+        self.orders_page = page
+        self._update_pager(page, self.o_prev_btn, self.o_next_btn)
+        self.orders_table.set_rows((o.OrderID, self._order_values(o)) for o in page.items)
+        self._data_shown("orders")
+
+    @staticmethod
+    def _order_values(o):
+        # ServiceOrderDetail rows: names come with the page (joined) or from the dimension cache (polls).
+        customer = f"{o.CustomerID} · {o.CustomerName}" if o.CustomerName else o.CustomerID
+        tech = ""
+        if o.TechnicianID is not None:
+            tech = f"{o.TechnicianID} · {o.TechnicianName} ({o.TechnicianSkillLevel})" if o.TechnicianName else o.TechnicianID
+        return (o.OrderID, customer, o.CustomerPhone or "", tech, o.ServiceType, o.Description or "", o.Status,
+                o.ScheduledAt, o.CreatedAt, o.UpdatedAt)
+
+    def _schedule_orders_poll(self, delay_ms=None):
+        if self._orders_poll is not None:
+            self.after_cancel(self._orders_poll)
+            self._orders_poll = None
+        if self.o_auto_var.get():
+            delay = int(ORDERS_POLL_SECONDS * 1000) if delay_ms is None else delay_ms
+            self._orders_poll = self.after(delay, self._poll_orders)
+        else:
+            self.o_auto_status_var.set("")
+
+    def _poll_orders(self):
+        self._orders_poll = None
+        if not self.o_auto_var.get():
+            return
+        if self.orders_watermark is None:
+            self._schedule_orders_poll()
+            return
+        generation = self._orders_generation
+
+        def failed(e):
+            self.o_auto_status_var.set(f"Auto-refresh failed: {e}")
+            self._schedule_orders_poll()
+
+        self.worker.submit(self.serviceorder_mgr.order_detail_changes, self.orders_watermark,
+                           on_done=lambda changes: self._apply_order_changes(generation, changes), on_error=failed)
+
+    def _apply_order_changes(self, generation, changes):
+        if generation == self._orders_generation:
+            self.orders_watermark = changes.watermark
+            # Keep the page's bounds: only rows whose ID falls inside it are added.
+            page = self.orders_page
+            status = self.o_filter_status_var.get() or None
+            rows = {k: self.orders_table.values(k) for k in self.orders_table.keys()}
+            for o in changes.orders:
+                on_page = ((page.next_cursor is None or o.OrderID >= page.next_cursor)
+                           and (page.prev_cursor is None or o.OrderID <= page.prev_cursor))
+                if on_page and (status is None or o.Status == status):
+                    rows[o.OrderID] = self._order_values(o)
+                else:
+                    rows.pop(o.OrderID, None)
+            for order_id in changes.deleted:
+                rows.pop(order_id, None)
+            self.orders_table.set_rows(sorted(rows.items(), key=lambda kv: kv[0], reverse=True))
+            self.o_auto_status_var.set(f"Updated {datetime.now():%H:%M:%S}")
+        self._schedule_orders_poll(0 if changes.has_more else None)
+
+    # Dashboard UI
+    def _build_dashboard_tab(self):
+        top = ttk.Frame(self.dashboard_tab)
+        top.pack(fill=tk.X, padx=10, pady=10)
+        self.d_status_table = VirtualTable(top, [("status", "Status", 140), ("count", "Orders", 90)],
+                                           height=len(VALID_STATUSES))
+        self.d_status_table.pack(side=tk.LEFT, padx=(0, 10))
+        self.d_type_table = VirtualTable(top, [("type", "Service Type", 140), ("count", "Orders", 90)],
+                                         height=len(VALID_STATUSES))
+        self.d_type_table.pack(side=tk.LEFT)
+
+        self.d_tech_table = VirtualTable(
+            self.dashboard_tab,
+            [("tech", "Technician ID", 110)] + [(s, s, 100) for s in VALID_STATUSES] + [("total", "Total", 90)],
+            height=14,
+        )
+        self.d_tech_table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        actions = ttk.Frame(self.dashboard_tab)
+        actions.pack(fill=tk.X, padx=10, pady=5)
+        ttk.Button(actions, text="Reconcile now", command=self._reconcile_dashboard).pack(side=tk.LEFT, padx=5)
+        self.d_info_var = tk.StringVar()
+        ttk.Label(actions, textvariable=self.d_info_var).pack(side=tk.LEFT, padx=5)
+
+    def _schedule_dashboard_poll(self, delay_ms=None):
+        # Counts come from memory; only redraw while the tab is on screen.
+        if self._dashboard_poll is not None:
+            self.after_cancel(self._dashboard_poll)
+            self._dashboard_poll = None
+        if self.notebook.select() == str(self.dashboard_tab):
+            delay = int(DASHBOARD_REFRESH_SECONDS * 1000) if delay_ms is None else delay_ms
+            self._dashboard_poll = self.after(delay, self._refresh_dashboard)
+
+    def _refresh_dashboard(self):
+        self._dashboard_poll = None
+        self.worker.submit(self.serviceorder_mgr.order_counts, key="dashboard", on_done=self._show_counts,
+                           on_error=lambda e: self.d_info_var.set(f"Refresh failed: {e}"))
+        self._schedule_dashboard_poll()
+
+    def _reconcile_dashboard(self):
+        self._run(self.serviceorder_mgr.reconcile_counts, key="dashboard", on_done=self._show_counts)
+
+    def _show_counts(self, counts):
+        self.d_status_table.set_rows([(s, (s, n)) for s, n in counts["by_status"].items()])
+        self.d_type_table.set_rows([(t, (t, n)) for t, n in counts["by_type"].items()])
+        self.d_tech_table.set_rows([
+            (tid, (tid, *[c.get(s, 0) for s in VALID_STATUSES], c["Total"]))
+            for tid, c in counts["by_technician"].items()
+        ])
+        reconciled = counts["reconciled_at"]
+        self.d_info_var.set(
+            f"{counts['total']} orders · reconciled {reconciled:%H:%M:%S}"
+            f" (drift {counts['last_drift']}) · {counts['applied']} live updates"
+            if reconciled else f"{counts['total']} orders"
+        )
+
+def main(started: Optional[float] = None):
+    """`started` is a time.perf_counter() taken before the UI was imported (see app/run.py)."""
+    timer = StartupTimer(started)
+    timer.mark("import")
+    app = ACServiceDeskApp(timer)
     app.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
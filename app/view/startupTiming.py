@@ -0,0 +1,53 @@
+# app/view/startupTiming.py
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.config import STARTUP_TIMING_LOG, STARTUP_WARN_MS
+
+startup_log = logging.getLogger("acservicedesk.startup")
+
+
+class StartupTimer:
+    """
+    Milliseconds from `started` (taken in app/run.py before the UI is
+    imported) to each startup milestone: "import", "window", "first_paint",
+    "first_data", and "<tab>_data"/"<tab>_build" per tab. Only the first
+    mark of a name counts. finish() logs the report once and appends it as a
+    JSON line to STARTUP_TIMING_LOG, so runs can be compared over time.
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.started_at = datetime.now()
+        self.marks: Dict[str, float] = {}
+        self.finished = False
+
+    def mark(self, name: str) -> None:
+        if name not in self.marks:
+            self.marks[name] = round((time.perf_counter() - self.started) * 1000, 1)
+
+    def record(self, name: str, ms: float) -> None:
+        """A duration rather than a point in time (e.g. how long a tab took to build)."""
+        self.marks.setdefault(name, round(ms, 1))
+
+    def report(self) -> Dict[str, Any]:
+        return {"started_at": self.started_at.isoformat(timespec="seconds"), "marks_ms": dict(self.marks)}
+
+    def finish(self, **extra: Any) -> Dict[str, Any]:
+        report = {**self.report(), **extra}
+        if self.finished:
+            return report
+        self.finished = True
+        summary = ", ".join(f"{k} {v:g} ms" for k, v in self.marks.items())
+        slow = self.marks.get("first_data", 0) > STARTUP_WARN_MS
+        startup_log.log(logging.WARNING if slow else logging.INFO, "startup: %s", summary)
+        if STARTUP_TIMING_LOG:
+            try:
+                with open(STARTUP_TIMING_LOG, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(report) + "\n")
+            except OSError as e:
+                startup_log.warning("Could not write %s: %s", STARTUP_TIMING_LOG, e)
+        return report
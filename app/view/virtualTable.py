@@ -0,0 +1,199 @@
+# app/view/virtualTable.py
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+Row = Tuple[Hashable, Sequence[Any]]  # (key, column values)
+
+
+class VirtualTable(ttk.Frame):
+    """
+    A Treeview that holds every row in memory but only materializes the rows
+    that fit on screen, with its own scrollbar over the full list.
+
+    Rows are keyed (OrderID, CustomerID, ...). set_rows() replaces the
+    contents, upsert()/remove() change single rows, and each only issues
+    the Treeview insert/item/move/delete calls needed to turn the visible
+    window into the new one. Nothing is rebuilt, so there is no flicker.
+    Selection is kept by key across refreshes, including rows scrolled out
+    of view. The scroll position stays anchored on the top row.
+    """
+
+    def __init__(self, parent, columns: Sequence[Tuple[str, str, int]], height: int = 15, **tree_options):
+        super().__init__(parent)
+        self.tree = ttk.Treeview(self, columns=[c for c, _, _ in columns], show="headings",
+                                 height=height, **tree_options)
+        for col, text, width in columns:
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=width, anchor=tk.W)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._keys: List[Hashable] = []
+        self._values: Dict[Hashable, Tuple] = {}
+        self._shown: Dict[Hashable, Tuple] = {}  # materialized rows and the values they display
+        self._iids: Dict[str, Hashable] = {}
+        self._selected: Set[Hashable] = set()
+        self._top = 0
+        self._visible = height
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self._scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self._scroll(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self._scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self._scroll(1, "pages"))
+        self.tree.bind("<Up>", lambda e: self._step(-1))
+        self.tree.bind("<Down>", lambda e: self._step(1))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys(self) -> List[Hashable]:
+        return list(self._keys)
+
+    def values(self, key: Hashable) -> Optional[Tuple]:
+        return self._values.get(key)
+
+    def selection(self) -> List[Hashable]:
+        """Selected keys in display order (including rows scrolled out of view)."""
+        return [k for k in self._keys if k in self._selected]
+
+    def select(self, keys: Iterable[Hashable]) -> None:
+        """Replace the selection (e.g. select(table.keys()) for all rows, select([]) to clear)."""
+        self._selected = {k for k in keys if k in self._values}
+        self._render()
+
+    def set_rows(self, rows: Iterable[Row]) -> Tuple[int, int, int]:
+        """Replace the contents; returns how many rows were (added, changed, removed)."""
+        anchor = self._anchor()
+        keys: List[Hashable] = []
+        values: Dict[Hashable, Tuple] = {}
+        for key, vals in rows:
+            if key not in values:
+                keys.append(key)
+            values[key] = tuple(vals)
+        old = self._values
+        added = sum(1 for k in keys if k not in old)
+        changed = sum(1 for k in keys if k in old and old[k] != values[k])
+        removed = sum(1 for k in old if k not in values)
+        self._keys, self._values = keys, values
+        self._selected &= values.keys()
+        self._restore(anchor)
+        return added, changed, removed
+
+    def upsert(self, rows: Iterable[Row]) -> None:
+        """Update rows in place; keys not shown yet are added at the top, in the given order."""
+        anchor = self._anchor()
+        new_keys = []
+        for key, vals in rows:
+            if key not in self._values:
+                new_keys.append(key)
+            self._values[key] = tuple(vals)
+        if new_keys:
+            self._keys[:0] = new_keys
+        self._restore(anchor)
+
+    def remove(self, keys: Iterable[Hashable]) -> None:
+        gone = {k for k in keys if k in self._values}
+        if not gone:
+            return
+        anchor = self._anchor()
+        self._keys = [k for k in self._keys if k not in gone]
+        for k in gone:
+            del self._values[k]
+        self._selected -= gone
+        self._restore(anchor)
+
+    def see(self, key: Hashable) -> None:
+        if key in self._values:
+            pos = self._keys.index(key)
+            if not self._top <= pos < self._top + self._visible:
+                self._top = max(0, pos - self._visible // 2)
+                self._render()
+
+    # Rendering
+    def _anchor(self) -> Optional[Hashable]:
+        # At the very top, stay there so new rows come into view; otherwise pin the top row.
+        return self._keys[self._top] if 0 < self._top < len(self._keys) else None
+
+    def _restore(self, anchor: Optional[Hashable]) -> None:
+        if anchor is not None and anchor in self._values:
+            self._top = self._keys.index(anchor)
+        self._render()
+
+    def _render(self) -> None:
+        n = len(self._keys)
+        self._top = max(0, min(self._top, n - self._visible))
+        window = self._keys[self._top:self._top + self._visible + 1]
+        wanted = set(window)
+        tree = self.tree
+        for key in [k for k in self._shown if k not in wanted]:
+            tree.delete(self._iid(key))
+            del self._shown[key]
+        for index, key in enumerate(window):
+            vals = self._values[key]
+            iid = self._iid(key)
+            if key not in self._shown:
+                tree.insert("", index, iid=iid, values=vals)
+            else:
+                if self._shown[key] != vals:
+                    tree.item(iid, values=vals)
+                if tree.index(iid) != index:
+                    tree.move(iid, "", index)
+            self._shown[key] = vals
+        selected = [self._iid(k) for k in window if k in self._selected]
+        if set(tree.selection()) != set(selected):
+            tree.selection_set(selected)
+        self._iids = {self._iid(k): k for k in self._shown}
+        if n:
+            self.scrollbar.set(self._top / n, min(1.0, (self._top + self._visible) / n))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    @staticmethod
+    def _iid(key: Hashable) -> str:
+        return str(key)
+
+    # Events
+    def _on_select(self, _event=None) -> None:
+        # Rows outside the window keep their state; rows inside follow the Treeview.
+        shown = set(self._shown)
+        self._selected = (self._selected - shown) | {self._iids[i] for i in self.tree.selection() if i in self._iids}
+
+    def _on_resize(self, event) -> None:
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible = max(1, event.height // row_height - 1)  # less one row for the headings
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_scrollbar(self, action: str, amount, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self._top = int(float(amount) * len(self._keys))
+            self._render()
+        else:
+            self._scroll(int(amount), unit)
+
+    def _scroll(self, amount: int, unit: str) -> str:
+        self._top += amount * (self._visible if unit == "pages" else 1)
+        self._render()
+        return "break"
+
+    def _step(self, direction: int) -> Optional[str]:
+        focus = self._iids.get(self.tree.focus())
+        if focus is None:
+            return None
+        pos = self._keys.index(focus) + direction
+        if not 0 <= pos < len(self._keys):
+            return "break"
+        if not self._top <= pos < self._top + self._visible:
+            self._top += direction
+            self._render()
+        self._selected = {self._keys[pos]}
+        iid = self._iid(self._keys[pos])
+        self.tree.focus(iid)
+        self.tree.selection_set(iid)
+        return "break"
@@ -0,0 +1,103 @@
+# app/view/worker.py
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.config import UI_WORKERS, UI_POLL_MS
+
+
+class UIWorker:
+    """
+    Runs service calls on a thread pool so the Tk mainloop never waits on the
+    database. Results are handed back through a queue that the Tk thread
+    drains on an after() timer, so callbacks always run on the Tk thread.
+    Tk is not safe to touch from the workers.
+
+    Requests that share a `key` (e.g. "orders" for the orders grid) supersede
+    each other. Submitting a new one cancels the older request if it has not
+    started, and drops its result if it has. `on_busy(n)` reports how many
+    requests are in flight so the window can show a busy indicator.
+    """
+
+    def __init__(self, root, max_workers: int = UI_WORKERS, poll_ms: int = UI_POLL_MS,
+                 on_busy: Optional[Callable[[int], None]] = None):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.on_busy = on_busy
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-worker")
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        self._latest: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+        self._after_id = None
+
+    def submit(self, fn: Callable[..., Any], *args,
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               key: Optional[Hashable] = None, **kwargs) -> Optional[Future]:
+        """Run fn(*args, **kwargs) on a worker; on_done/on_error are called on the Tk thread."""
+        if self._closed:
+            return None
+        future = self._executor.submit(fn, *args, **kwargs)
+        if key is not None:
+            with self._lock:
+                previous = self._latest.get(key)
+                self._latest[key] = future
+            if previous is not None:
+                previous.cancel()
+        self._pending += 1
+        self._notify_busy()
+        future.add_done_callback(lambda f: self._results.put((f, key, on_done, on_error)))
+        if self._after_id is None:
+            self._after_id = self.root.after(self.poll_ms, self._drain)
+        return future
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _drain(self) -> None:
+        self._after_id = None
+        while True:
+            try:
+                future, key, on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if key is not None:
+                with self._lock:
+                    stale = self._latest.get(key) is not future
+                    if not stale:
+                        del self._latest[key]
+                if stale:
+                    continue
+            if future.cancelled():
+                continue
+            error = future.exception()
+            try:
+                if error is None:
+                    if on_done:
+                        on_done(future.result())
+                elif on_error:
+                    on_error(error)
+                else:
+                    self.root.report_callback_exception(type(error), error, error.__traceback__)
+            except Exception as e:
+                self.root.report_callback_exception(type(e), e, e.__traceback__)
+        self._notify_busy()
+        if self._pending and not self._closed:
+            self._after_id = self.root.after(self.poll_ms, self._drain)
+
+    def _notify_busy(self) -> None:
+        if self.on_busy:
+            self.on_busy(self._pending)
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop anything queued; running calls finish in the background."""
+        self._closed = True
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)